@@ -1,15 +1,22 @@
 from argparse import Namespace
 from pathlib import Path
 
-from patterns.singleton import Singleton
 
+class Args:
+    """ Аргументы компилятора. Поля класса — значения по умолчанию. """
 
-class Args(metaclass=Singleton):
     source = ''
     stop_after_parsing = False
     stop_before_type_inferring = False
     stop_after_type_inferring = False
     skip_header_generation = False
+    print_constraints_stats = False
+    incremental = False
+    jobs = 1
+    stream_definitions = False
+    mmap_source = False
+    ast_cache = None
+    ast_cache_size = 256
 
     def __init__(self, args: Namespace = None):
         # Обновление полей текущего объекта полями из args.
@@ -17,7 +24,10 @@ class Args(metaclass=Singleton):
             self.__dict__.update(args.__dict__)
 
     def get_header_path(self):
-        return str(Path(Args().source).with_suffix('.tmlh'))
+        return str(Path(self.source).with_suffix('.tmlh'))
+
+    def get_cache_path(self):
+        return str(Path(self.source).with_suffix('.tmli'))
 
     def get_module_name(self):
-        return str(Path(Args().source).stem)
+        return str(Path(self.source).stem)
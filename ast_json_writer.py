@@ -0,0 +1,132 @@
+import json
+from json.encoder import encode_basestring_ascii
+from typing import Iterator, TextIO, Tuple
+
+from ast_to_dict_visitor import AstToDictVisitor
+from tml_ast import Node
+
+# Количество частей JSON, после накопления которых они записываются в файл.
+CHUNKS_PER_WRITE = 4096
+
+# Разделители компактного JSON (без пробелов): для файлов, которые читает только компилятор.
+COMPACT_SEPARATORS = (',', ':')
+
+
+def is_container(value) -> bool:
+    return isinstance(value, (Node, list, tuple, dict))
+
+
+def scalar_to_json(value) -> str:
+    if type(value) is int:
+        return int.__repr__(value)
+
+    if type(value) is str:
+        return encode_basestring_ascii(value)
+
+    return json.dumps(value)
+
+
+class AstJsonWriter:
+    """
+    Записывает АСД в файл в формате JSON по мере обхода, не строя словарь всего АСД (в отличие от AstToDictVisitor) и
+    всю строку JSON, поэтому кроме самого АСД в памяти находится только стек обхода и буфер записи. Результат совпадает
+    с json.dumps(AstToDictVisitor().visit(node)).
+
+    Кроме узлов записываются и словари (со строковыми ключами), поэтому так же без рекурсии записываются другие
+    глубоко вложенные значения, например заголовки модулей. Результат для них совпадает с json.dumps.
+
+    separators — разделители элементов и ключей, как в json.dumps.
+    """
+
+    # Поля узлов, которые не записываются: служебные поля (как в AstToDictVisitor).
+    omitted_fields: Tuple[str, ...] = AstToDictVisitor.omitted_fields
+
+    def __init__(self, file: TextIO, separators: Tuple[str, str] = (', ', ': ')):
+        self.file = file
+        self.item_separator, self.key_separator = separators
+
+    def write(self, node):
+        buffer = []
+        stack = [self.items(node)]
+
+        while stack:
+            for item in stack[-1]:
+                if type(item) is str:
+                    buffer.append(item)
+
+                    if len(buffer) >= CHUNKS_PER_WRITE:
+                        self.file.write(''.join(buffer))
+                        buffer.clear()
+                else:
+                    stack.append(self.items(item))
+                    break
+            else:
+                stack.pop()
+
+        self.file.write(''.join(buffer))
+
+    def items(self, value) -> Iterator:
+        """
+        Части JSON значения: строки JSON, между которыми находятся вложенные узлы, списки и словари (их части обходятся
+        отдельно). Как и в AstToDictVisitor, Group записывается как список.
+        """
+        if isinstance(value, (list, tuple)):
+            return self.list_items(value)
+
+        if isinstance(value, dict):
+            return self.dict_items(value)
+
+        return self.node_items(value)
+
+    def node_items(self, n: Node) -> Iterator:
+        yield '{"node_type"' + self.key_separator + encode_basestring_ascii(n.__class__.__name__)
+
+        for name, value in n.fields():
+            if name in self.omitted_fields:
+                continue
+
+            prefix = self.item_separator + encode_basestring_ascii(name) + self.key_separator
+
+            if is_container(value):
+                yield prefix
+                yield value
+            else:
+                yield prefix + scalar_to_json(value)
+
+        yield '}'
+
+    def list_items(self, values) -> Iterator:
+        if not values:
+            yield '[]'
+            return
+
+        separator = '['
+        for value in values:
+            if is_container(value):
+                yield separator
+                yield value
+            else:
+                yield separator + scalar_to_json(value)
+
+            separator = self.item_separator
+
+        yield ']'
+
+    def dict_items(self, values: dict) -> Iterator:
+        if not values:
+            yield '{}'
+            return
+
+        separator = '{'
+        for name, value in values.items():
+            prefix = separator + encode_basestring_ascii(name) + self.key_separator
+
+            if is_container(value):
+                yield prefix
+                yield value
+            else:
+                yield prefix + scalar_to_json(value)
+
+            separator = self.item_separator
+
+        yield '}'
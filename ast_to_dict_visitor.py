@@ -1,18 +1,20 @@
 from tml_ast import *
-from patterns.visitor import Visitor
+from patterns.visitor import StackVisitor, Visit
 
 
-class AstToDictVisitor(Visitor):
-    def visit_node(self, n: Node) -> dict:
-        dic = n.__dict__
+class AstToDictVisitor(StackVisitor):
+    # Служебные поля узлов, которые не входят в словарь (Root.spans).
+    omitted_fields = ('spans',)
+
+    def visit_node(self, n: Node):
         new_dic = {'node_type': n.__class__.__name__}
 
-        for child_name, child_value in dic.items():
-            if child_name == 'position':
-                child_name = 'line'
-                child_value = dic['position'].line
-            else:
-                child_value = self.visit(child_value)
+        for child_name, child_value in n.fields():
+            if child_name in self.omitted_fields:
+                continue
+
+            if isinstance(child_value, (Node, list)):
+                child_value = yield Visit(child_value)
 
             new_dic[child_name] = child_value
 
@@ -21,8 +23,16 @@ class AstToDictVisitor(Visitor):
     def visit_group(self, n: Group):
         return self.visit_list(n)
 
-    def visit_list(self, n: list) -> list:
-        return [self.visit(el) for el in n]
+    def visit_list(self, n: list):
+        values = []
+
+        for el in n:
+            if isinstance(el, (Node, list)):
+                el = yield Visit(el)
+
+            values.append(el)
+
+        return values
 
     def visit_default(self, n, *args, **kwargs):
         if isinstance(n, Node):
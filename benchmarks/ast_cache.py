@@ -0,0 +1,46 @@
+"""
+Замер времени получения АСД модулей при сборке без изменений: синтаксический разбор всех модулей в сравнении с
+загрузкой их АСД из кэша (AstCache).
+
+Запуск из корня репозитория: python -m benchmarks.ast_cache
+"""
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from parsing.ast_cache import AstCache
+from parsing.parser import parse
+
+MODULES_COUNT = 500
+DEFINITIONS_COUNT = 40
+
+DEFINITION = 'let f{i} = fun(a, b) -> {{ let d = a + b * {j}; if (d > {i}) then [d, a] else [b] }}\n'
+
+
+def make_module(j: int) -> str:
+    return f'module m{j}\n' + ''.join(DEFINITION.format(i=i, j=j) for i in range(DEFINITIONS_COUNT))
+
+
+def build(modules, get_ast) -> float:
+    start = perf_counter()
+    for text in modules:
+        get_ast(text)
+
+    return perf_counter() - start
+
+
+if __name__ == '__main__':
+    modules = [make_module(j) for j in range(MODULES_COUNT)]
+    parse(modules[0])
+
+    with TemporaryDirectory() as directory:
+        cache = AstCache(directory, 256 * 2 ** 20)
+
+        parse_time = build(modules, parse)
+        save_time = build(modules, lambda text: cache.save(text, parse(text))) - parse_time
+        load_time = build(modules, cache.load)
+
+    print(f'модулей: {MODULES_COUNT}, объявлений в модуле: {DEFINITIONS_COUNT}')
+    print(f'{"разбор":>22} {parse_time:>8.3f} с')
+    print(f'{"сохранение в кэш":>22} {save_time:>8.3f} с')
+    print(f'{"загрузка из кэша":>22} {load_time:>8.3f} с')
+    print(f'ускорение: {parse_time / load_time:.1f}')
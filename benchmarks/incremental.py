@@ -0,0 +1,66 @@
+"""
+Замер времени инкрементального разбора после типичных изменений в середине большого модуля (в сравнении со временем
+разбора всего модуля). Время изменения должно почти не зависеть от размера модуля.
+
+Запуск из корня репозитория: python -m benchmarks.incremental
+"""
+from statistics import median
+from time import perf_counter
+
+from parsing.incremental import IncrementalParser, TextEdit
+from parsing.parser import parse
+
+DEFINITIONS_COUNTS = (1000, 5000, 20000)
+REPEAT = 50
+
+DEFINITION = 'let f{i} = fun(a, b) -> {{ let d = a + b * 2; if (d > {i}) then [d, a] else [b] }}\n'
+
+
+def make_source(count: int) -> str:
+    return 'module bench\n' + ''.join(DEFINITION.format(i=i) for i in range(count))
+
+
+def make_edits(text: str):
+    """
+    Изменения в объявлении в середине модуля: ввод символа, новая строка и новое объявление. Каждое изменение
+    отменяется следующим за ним, поэтому исходный код после пары изменений остается прежним.
+    """
+    middle = text.index('let d', len(text) // 2)
+    inserted = ' 1 } let g = fun() -> {'
+
+    return {
+        'ввод символа': [TextEdit(middle + 4, middle + 4, 'x'), TextEdit(middle + 4, middle + 5, '')],
+        'новая строка': [TextEdit(middle, middle, '\n'), TextEdit(middle, middle + 1, '')],
+        'новое объявление': [TextEdit(middle - 1, middle - 1, inserted),
+                             TextEdit(middle - 1, middle - 1 + len(inserted), '')],
+    }
+
+
+def bench(count: int):
+    text = make_source(count)
+    parse(text)
+
+    start = perf_counter()
+    parse(text)
+    full = perf_counter() - start
+    print(f'{count:>10} {"весь модуль":>18} {full * 1e3:>10.3f}')
+
+    for name, edits in make_edits(text).items():
+        parser = IncrementalParser(text)
+        times = []
+
+        for _ in range(REPEAT):
+            for edit in edits:
+                start = perf_counter()
+                parser.edit(edit)
+                times.append(perf_counter() - start)
+
+        assert parser.full_parses == 1
+        print(f'{count:>10} {name:>18} {median(times) * 1e3:>10.3f}')
+
+
+if __name__ == '__main__':
+    print(f'{"объявлений":>10} {"изменение":>18} {"время, мс":>10}')
+
+    for definitions_count in DEFINITIONS_COUNTS:
+        bench(definitions_count)
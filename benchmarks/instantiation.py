@@ -0,0 +1,36 @@
+"""
+Замер времени инстанцирования схемы типа и именования полиморфных типов в зависимости от
+размера типа. Время на один узел типа должно оставаться примерно постоянным (линейная зависимость от размера).
+
+Запуск из корня репозитория: python -m benchmarks.instantiation
+"""
+from timeit import timeit
+
+from semantic.typing.polym_type_name_setter import PolymorphTypeNameSetter
+from semantic.typing.scheme import TypeScheme
+from semantic.typing.types import PolymorphType, ParameterizedType, fun_type, t_int
+
+SIZES = (1000, 2000, 4000, 8000, 16000)
+REPEAT = 5
+
+
+def make_type(size: int):
+    """ Тип-функция из size параметров вида ref<`a>, где каждый `a — отдельный полиморфный тип. """
+    return fun_type([ParameterizedType('ref', [PolymorphType()]) for _ in range(size // 2)], t_int)
+
+
+def bench(name: str, fun):
+    print(name)
+    print(f'{"размер":>10} {"время, мс":>12} {"мкс на узел":>12}')
+
+    for size in SIZES:
+        t = make_type(size)
+        seconds = timeit(lambda: fun(t), number=REPEAT) / REPEAT
+        print(f'{size:>10} {seconds * 1e3:>12.2f} {seconds * 1e6 / size:>12.3f}')
+
+    print()
+
+
+if __name__ == '__main__':
+    bench('TypeScheme', lambda t: TypeScheme(t).instantiate())
+    bench('PolymorphTypeNameSetter', lambda t: PolymorphTypeNameSetter().visit(t))
@@ -0,0 +1,77 @@
+"""
+Замер скорости лексического анализа (лексем в секунду) анализатором PLY и MasterLexer на исходном коде размером в
+несколько мегабайт.
+
+Запуск из корня репозитория: python -m benchmarks.lexer
+"""
+from time import perf_counter
+
+from parsing.lexer import get_lexer
+from parsing.master_lexer import MasterLexer
+
+SIZES_MB = (1, 2, 4)
+REPEAT = 3
+
+# Фрагмент кода, повторяемый до нужного размера (в нем есть лексемы всех видов).
+SNIPPET = '''
+# Комментарий
+let f{i} = fun(n, acc) -> {{
+    let x = if (n <= 0 && acc != 1) then acc else f{i}(n - 1, acc * n % 7 ~> 1);
+    let s = "строка " ^ "{i}";
+    let r = new [1.5 +. .5, 2. *. 3.0];
+    match x {{ Cons(h, t) -> {{ h :: t }}, Empty -> {{ [] }} }};
+    r := $r >=. 0.1 || !(x > 1)
+}}
+type t{i}<`a> = {{ A{i} = `a * ref<int>, B{i} }}
+'''
+
+
+def make_source(size_mb: int) -> str:
+    parts = []
+    size = 0
+    i = 0
+
+    while size < size_mb * 2 ** 20:
+        part = SNIPPET.format(i=i)
+        parts.append(part)
+        size += len(part)
+        i += 1
+
+    return ''.join(parts)
+
+
+def count_tokens(lexer, text: str) -> int:
+    lexer.input(text)
+    count = 0
+    token = lexer.token
+
+    while token() is not None:
+        count += 1
+
+    return count
+
+
+def measure(make_lexer, text: str) -> float:
+    start = perf_counter()
+    count_tokens(make_lexer(), text)
+
+    return perf_counter() - start
+
+
+def bench(name: str, make_lexer, text: str):
+    seconds = min(measure(make_lexer, text) for _ in range(REPEAT))
+    count = count_tokens(make_lexer(), text)
+    print(f'{name:>12} {len(text) / 2 ** 20:>10.1f} {count:>10} {seconds:>10.3f} {count / seconds:>14.0f}')
+
+    return count / seconds
+
+
+if __name__ == '__main__':
+    print(f'{"анализатор":>12} {"размер, МБ":>10} {"лексем":>10} {"время, с":>10} {"лексем в сек.":>14}')
+
+    for size_mb in SIZES_MB:
+        source = make_source(size_mb)
+        ply_speed = bench('PLY', lambda: get_lexer().clone(), source)
+        master_speed = bench('MasterLexer', MasterLexer, source)
+        print(f'ускорение: {master_speed / ply_speed:.2f}')
+        print()
@@ -0,0 +1,74 @@
+"""
+Замер памяти, занимаемой одним узлом АСД и семантического дерева (с помощью tracemalloc). Узлы создаются так же, как
+при разборе и семантическом анализе: узлы АСД получают позицию по лексеме, узлы семантического дерева — позицию узла
+АСД. Дочерние узлы и значения полей общие для всех узлов, поэтому учитывается только память самих узлов.
+
+Запуск из корня репозитория: python -m benchmarks.nodes_memory
+"""
+import tracemalloc
+from types import SimpleNamespace
+
+import semantic.expressions as semantic
+import tml_ast
+from position import Position
+
+COUNT = 100000
+# Количество узлов на одной строке исходного кода.
+NODES_PER_LINE = 10
+
+VAR = tml_ast.Var(Position.start(), 'x')
+ARGS = [VAR]
+
+AST_NODES = {
+    'Var': lambda p: tml_ast.Var(p, 'x'),
+    'Literal': lambda p: tml_ast.Literal(p, 'int', 1),
+    'Apply': lambda p: tml_ast.Apply(p, VAR, ARGS),
+    'BinaryOperator': lambda p: tml_ast.BinaryOperator(p, '+', VAR, VAR),
+    'If': lambda p: tml_ast.If(p, VAR, VAR, VAR),
+}
+
+SEMANTIC_NODES = {
+    'Var': lambda: semantic.Var(None),
+    'Literal': lambda: semantic.Literal(1),
+    'Apply': lambda: semantic.Apply(None, ARGS),
+    'BinaryOperator': lambda: semantic.BinaryOperator('+', None, None),
+    'If': lambda: semantic.If(None, None, None),
+}
+
+
+def traced(create) -> float:
+    """ Память в байтах на один узел, созданный функцией create(i). """
+    nodes = [None] * COUNT
+
+    tracemalloc.start()
+    for i in range(COUNT):
+        nodes[i] = create(i)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return size / COUNT
+
+
+def ast_node_size(make) -> float:
+    tokens = [SimpleNamespace(lineno=i // NODES_PER_LINE + 1) for i in range(COUNT)]
+    return traced(lambda i: make(Position.from_parser_token(tokens[i])))
+
+
+def semantic_node_size(make) -> float:
+    positions = [VAR.position for _ in range(COUNT)]
+    return traced(lambda i: make().at(positions[i]))
+
+
+def bench(name: str, nodes: dict, size):
+    print(name)
+    print(f'{"узел":>16} {"байт на узел":>14}')
+
+    for node_name, make in nodes.items():
+        print(f'{node_name:>16} {size(make):>14.1f}')
+
+    print()
+
+
+if __name__ == '__main__':
+    bench('АСД', AST_NODES, ast_node_size)
+    bench('Семантическое дерево', SEMANTIC_NODES, semantic_node_size)
@@ -0,0 +1,46 @@
+"""
+Замер времени синтаксического разбора в зависимости от длины списков: количества объявлений верхнего уровня и
+количества элементов литерала списка. Время на один элемент должно оставаться примерно постоянным (линейная
+зависимость от длины списка).
+
+Запуск из корня репозитория: python -m benchmarks.parser
+"""
+from time import perf_counter
+
+from parsing.parser import parse
+
+LETS_COUNTS = (12500, 25000, 50000, 100000)
+LIST_LENGTHS = (1250, 2500, 5000, 10000)
+# Количество литералов списков в модуле для замера разбора списков.
+LISTS_COUNT = 10
+
+
+def make_lets(count: int) -> str:
+    return 'module bench\n' + ''.join(f'let x{i} = {i}\n' for i in range(count))
+
+
+def make_lists(length: int) -> str:
+    elements = ', '.join(str(i) for i in range(length))
+    return 'module bench\n' + ''.join(f'let l{i} = [{elements}]\n' for i in range(LISTS_COUNT))
+
+
+def bench(name: str, make_source, sizes, repeat: int = 1):
+    """ repeat — количество списков указанной длины в модуле. """
+    print(name)
+    print(f'{"длина":>10} {"время, мс":>12} {"мкс на элемент":>15}')
+
+    for size in sizes:
+        source = make_source(size)
+
+        start = perf_counter()
+        parse(source)
+        seconds = perf_counter() - start
+
+        print(f'{size:>10} {seconds * 1e3:>12.2f} {seconds * 1e6 / (size * repeat):>15.3f}')
+
+    print()
+
+
+if __name__ == '__main__':
+    bench('Объявления верхнего уровня', make_lets, LETS_COUNTS)
+    bench(f'Литералы списков ({LISTS_COUNT} в модуле)', make_lists, LIST_LENGTHS, LISTS_COUNT)
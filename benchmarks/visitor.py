@@ -0,0 +1,90 @@
+"""
+Замер скорости обхода узлов (обходов в секунду): вызовы Visitor.visit для узлов разных классов с пустыми методами
+обхода и обход АСД большого модуля AstToDictVisitor.
+
+Запуск из корня репозитория: python -m benchmarks.visitor
+"""
+from time import perf_counter
+
+import tml_ast
+from ast_to_dict_visitor import AstToDictVisitor
+from parsing.parser import parse
+from patterns.visitor import Visitor
+from position import Position
+
+VISITS_COUNT = 10 ** 6
+REPEAT = 3
+
+DEFINITION = 'let f{i} = fun(a, b) -> {{ let d = a + b * 2; if (d > {i}) then [d, a] else [b] }}\n'
+DEFINITIONS_COUNT = 2000
+
+
+class EmptyVisitor(Visitor):
+    def visit_var(self, n):
+        pass
+
+    def visit_literal(self, n):
+        pass
+
+    def visit_binary_operator(self, n):
+        pass
+
+    def visit_default(self, n, *args, **kwargs):
+        pass
+
+
+def count_nodes(node) -> int:
+    count = 0
+    stack = [node]
+
+    while stack:
+        n = stack.pop()
+
+        if isinstance(n, list):
+            stack.extend(n)
+
+        if isinstance(n, tml_ast.Node):
+            count += 1
+            stack.extend(value for name, value in n.fields() if name != 'line')
+
+    return count
+
+
+def best_time(fun) -> float:
+    times = []
+    for _ in range(REPEAT):
+        start = perf_counter()
+        fun()
+        times.append(perf_counter() - start)
+
+    return min(times)
+
+
+def bench_empty_visits():
+    position = Position.start()
+    nodes = [tml_ast.Var(position, 'x'), tml_ast.Literal(position, None, 1),
+             tml_ast.BinaryOperator(position, '+', None, None), tml_ast.If(position, None, None, None)]
+    nodes = nodes * (VISITS_COUNT // len(nodes))
+    visitor = EmptyVisitor()
+
+    def visit_all():
+        visit = visitor.visit
+        for n in nodes:
+            visit(n)
+
+    seconds = best_time(visit_all)
+    print(f'{"пустые методы":>16} {len(nodes):>10} {seconds:>10.3f} {len(nodes) / seconds:>16.0f}')
+
+
+def bench_ast_to_dict():
+    root = parse('module bench\n' + ''.join(DEFINITION.format(i=i) for i in range(DEFINITIONS_COUNT)))
+    count = count_nodes(root)
+
+    seconds = best_time(lambda: AstToDictVisitor().visit(root))
+    print(f'{"AstToDictVisitor":>16} {count:>10} {seconds:>10.3f} {count / seconds:>16.0f}')
+
+
+if __name__ == '__main__':
+    print(f'{"обход":>16} {"узлов":>10} {"время, с":>10} {"узлов в сек.":>16}')
+    bench_empty_visits()
+    bench_ast_to_dict()
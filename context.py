@@ -0,0 +1,20 @@
+from typing import Optional
+
+from args import Args
+from errors import Errors
+from semantic.module import GlobalModule
+from semantic.typing.inferer import GlobalTypeInferer
+
+
+class CompilationContext:
+    """
+    Состояние компиляции одного модуля: аргументы компилятора, найденные ошибки, модуль и его вывод типов. Контекст
+    явно передается синтаксическому анализатору, семантическому анализатору и остальным стадиям компиляции, поэтому
+    один процесс может компилировать модули друг за другом или параллельно в разных потоках.
+    """
+
+    def __init__(self, args: Optional[Args] = None):
+        self.args = Args() if args is None else args
+        self.errors = Errors()
+        self.module = GlobalModule()
+        self.type_inferer = GlobalTypeInferer()
@@ -1,7 +1,5 @@
 from typing import Optional, List
 
-from args import Args
-from patterns.singleton import Singleton
 from position import Position
 
 
@@ -10,13 +8,18 @@ class Error:
         self.message = message + '.'
         self.position = position
 
-    def __str__(self) -> str:
+    def format(self, source: str) -> str:
+        """ Сообщение об ошибке в файле source. """
         pos = '' if self.position is None else f':{self.position.line}'
-        return f'{Args().source}{pos}: {self.message}'
+        return f'{source}{pos}: {self.message}'
+
+    def __str__(self) -> str:
+        return self.format('')
 
 
-class Errors(metaclass=Singleton):
-    list: List[Error] = []
+class Errors:
+    def __init__(self):
+        self.list: List[Error] = []
 
     def is_ok(self):
         return len(self.list) == 0
@@ -26,8 +29,8 @@ class CompilationException(Exception):
     def __init__(self, error: Error):
         self.error = error
 
-    def handle(self):
-        Errors().list.append(self.error)
+    def handle(self, errors: Errors):
+        errors.list.append(self.error)
 
     def __str__(self) -> str:
         return str(self.error)
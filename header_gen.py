@@ -1,17 +1,26 @@
-from patterns.visitor import Visitor
+from types import GeneratorType
+
+from patterns.visitor import StackVisitor, Visit
 from semantic.defs import Typedef, TypeConstructor, Let
 from semantic.module import GlobalModule, Module
-from semantic.typing.types import ParameterizedType, PolymorphType
+from semantic.typing.types import ParameterizedType, PolymorphType, BaseType
 
 
-class HeaderGenerator(Visitor):
+class HeaderGenerator(StackVisitor):
     def __init__(self):
         self.polymorph_types = []
         self.lets = []
         self.typedefs = []
 
-    def visit(self, node, *args, **kwargs):
-        dic = super().visit(node)
+    def begin_visit(self, node, *args, **kwargs):
+        if isinstance(node, BaseType):
+            node = node.find()
+
+        return self.visit_common_fields(node, super().begin_visit(node))
+
+    def visit_common_fields(self, node, result):
+        """ Добавляет к результату обхода узла класс, имя и тип узла. """
+        dic = (yield from result) if isinstance(result, GeneratorType) else result
 
         if not (isinstance(node, GlobalModule) or isinstance(node, Module)):
             if isinstance(node, Let):
@@ -23,7 +32,7 @@ class HeaderGenerator(Visitor):
             dic['name'] = node.name
 
         if hasattr(node, 'type'):
-            dic['type'] = self.visit(node.type)
+            dic['type'] = yield Visit(node.type)
 
         return dic
 
@@ -36,8 +45,8 @@ class HeaderGenerator(Visitor):
 
         dic = {
             'name': n.name,
-            'lets': [self.visit(let) for let in self.lets],
-            'typedefs': [self.visit(typedef) for typedef in self.typedefs],
+            'lets': (yield from self.visit_all(self.lets)),
+            'typedefs': (yield from self.visit_all(self.typedefs)),
             'pols': len(self.polymorph_types)
         }
 
@@ -45,7 +54,7 @@ class HeaderGenerator(Visitor):
 
     def visit_type_constructor(self, n: TypeConstructor):
         return {
-            'fields': [self.visit(field_type) for field_type in n.field_types],
+            'fields': (yield from self.visit_all(n.field_types)),
             'td_i': self.typedefs.index(n.typedef)
         }
 
@@ -57,7 +66,7 @@ class HeaderGenerator(Visitor):
     def visit_typedef(self, n: Typedef):
         return {
             'ctors': [self.lets.index(constructor) for constructor in n.constructors],
-            'params': [self.visit(p) for p in n.params]
+            'params': (yield from self.visit_all(n.params))
         }
 
     def visit_polymorph_type(self, n: PolymorphType):
@@ -71,5 +80,13 @@ class HeaderGenerator(Visitor):
 
     def visit_parameterized_type(self, n: ParameterizedType):
         return {
-            'params': [self.visit(p) for p in n.params]
+            'params': (yield from self.visit_all(n.params))
         }
+
+    @staticmethod
+    def visit_all(nodes: list):
+        results = []
+        for node in nodes:
+            results.append((yield Visit(node)))
+
+        return results
@@ -70,12 +70,27 @@ class HeaderReader:
         return typedef
 
     def read_type(self, json_dic: dict):
-        if json_dic['class'] == SimpleType.__name__:
-            return self.read_simple_type(json_dic)
-        elif json_dic['class'] == PolymorphType.__name__:
-            return self.read_polymorph_type(json_dic)
-        else:
-            return self.read_parameterized_type(json_dic)
+        # Чтение без рекурсии: в стеке находятся еще не прочитанные типы, а в results — прочитанные типы параметров.
+        results = []
+        stack = [(json_dic, False)]
+
+        while stack:
+            json_dic, is_read = stack.pop()
+
+            if is_read:
+                start = len(results) - len(json_dic['params'])
+                t = self.read_parameterized_type(json_dic, results[start:])
+                del results[start:]
+                results.append(t)
+            elif json_dic['class'] == SimpleType.__name__:
+                results.append(self.read_simple_type(json_dic))
+            elif json_dic['class'] == PolymorphType.__name__:
+                results.append(self.read_polymorph_type(json_dic))
+            else:
+                stack.append((json_dic, True))
+                stack.extend((p, False) for p in reversed(json_dic['params']))
+
+        return results[0]
 
     def read_simple_type(self, json_dic: dict) -> SimpleType:
         return SimpleType(json_dic['name'])
@@ -83,5 +98,5 @@ class HeaderReader:
     def read_polymorph_type(self, json_dic: dict) -> PolymorphType:
         return self.polymorph_types[json_dic['i']]
 
-    def read_parameterized_type(self, json_dic: dict) -> ParameterizedType:
-        return ParameterizedType(json_dic['name'], [self.read_type(p) for p in json_dic['params']])
+    def read_parameterized_type(self, json_dic: dict, params: list) -> ParameterizedType:
+        return ParameterizedType(json_dic['name'], params)
@@ -0,0 +1,105 @@
+import json
+import re
+from json import JSONDecodeError
+from json.decoder import scanstring
+from json.scanner import NUMBER_RE
+from typing import Tuple
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+CONSTANTS = {'true': True, 'false': False, 'null': None}
+
+
+def read_json(text: str):
+    """
+    Значение JSON из строки text. Стандартный json.loads рекурсивен и не справляется с глубоко вложенными значениями
+    (например, заголовками модулей с типами вложенных функций), поэтому для них используется чтение без рекурсии.
+    """
+    try:
+        return json.loads(text)
+    except RecursionError:
+        return read_json_iteratively(text)
+
+
+def read_json_iteratively(text: str):
+    """ Значение JSON из строки text. Незаконченные словари и списки хранятся в явном стеке. """
+    # Элементы стека: [словарь или список, ключ следующего значения словаря].
+    stack = []
+    pos = WHITESPACE.match(text, 0).end()
+
+    while True:
+        # Чтение значения: начало словаря или списка либо скалярное значение.
+        char = text[pos:pos + 1]
+
+        if char == '{' or char == '[':
+            container = {} if char == '{' else []
+            pos = WHITESPACE.match(text, pos + 1).end()
+
+            if text[pos:pos + 1] != ('}' if char == '{' else ']'):
+                stack.append([container, None])
+                if char == '{':
+                    stack[-1][1], pos = read_key(text, pos)
+                continue
+
+            value = container
+            pos += 1
+        elif char == '"':
+            value, pos = scanstring(text, pos + 1)
+        else:
+            match = NUMBER_RE.match(text, pos)
+            if match is not None:
+                integer, fraction, exponent = match.groups()
+                value = float(integer + (fraction or '') + (exponent or '')) if fraction or exponent else int(integer)
+                pos = match.end()
+            else:
+                for name, value in CONSTANTS.items():
+                    if text.startswith(name, pos):
+                        pos += len(name)
+                        break
+                else:
+                    raise JSONDecodeError('Expecting value', text, pos)
+
+        # Добавление значения в словари и списки, которые оно завершает.
+        while True:
+            pos = WHITESPACE.match(text, pos).end()
+
+            if not stack:
+                if pos != len(text):
+                    raise JSONDecodeError('Extra data', text, pos)
+
+                return value
+
+            container, key = stack[-1]
+            if key is None:
+                container.append(value)
+            else:
+                container[key] = value
+
+            char = text[pos:pos + 1]
+
+            if char == ',':
+                pos = WHITESPACE.match(text, pos + 1).end()
+                if key is not None:
+                    stack[-1][1], pos = read_key(text, pos)
+                break
+
+            if char != ('}' if key is not None else ']'):
+                raise JSONDecodeError("Expecting ',' delimiter", text, pos)
+
+            value = container
+            stack.pop()
+            pos += 1
+
+
+def read_key(text: str, pos: int) -> Tuple[str, int]:
+    """ Ключ словаря, начинающийся в позиции pos, и позиция значения после него. """
+    if text[pos:pos + 1] != '"':
+        raise JSONDecodeError('Expecting property name enclosed in double quotes', text, pos)
+
+    key, pos = scanstring(text, pos + 1)
+    pos = WHITESPACE.match(text, pos).end()
+
+    if text[pos:pos + 1] != ':':
+        raise JSONDecodeError("Expecting ':' delimiter", text, pos)
+
+    return key, WHITESPACE.match(text, pos + 1).end()
@@ -1,27 +1,33 @@
 import argparse
-import json
+import os
+import sys
+from mmap import mmap, ACCESS_READ
+from typing import Union
 
 from args import Args
-from ast_to_dict_visitor import AstToDictVisitor
-from errors import Errors
+from ast_json_writer import COMPACT_SEPARATORS, AstJsonWriter
+from context import CompilationContext
+from errors import CompilationException
 from header_gen import HeaderGenerator
-from parsing.parser import parser
+from parallel import infer_in_parallel
+from parsing.ast_cache import AstCache
+from parsing.parser import DefinitionsStream, parse
 from semantic.ast_visitor import SemanticVisitor
-from semantic.typing.inferer import GlobalTypeInferer
+from semantic.typing.incremental import InferenceCache
 from tml_ast import Root
 
 
-def handle_next_stage(result, next_stage=None):
-    if not Errors().is_ok():
-        for error in Errors().list:
-            print(error)
+def handle_next_stage(context: CompilationContext, result, next_stage=None):
+    if not context.errors.is_ok():
+        for error in context.errors.list:
+            print(error.format(context.args.source))
 
         exit(-1)
 
     if next_stage is None:
         return result
 
-    return next_stage(result)
+    return next_stage(context, result)
 
 
 def parse_args(_=None):
@@ -33,57 +39,155 @@ def parse_args(_=None):
     arg_parser.add_argument('-i', '--stop-before-type-inferring',
                             help='Остановиться перед выводом типов и вывести систему уравнений.',
                             action='store_true')
+    arg_parser.add_argument('-s', '--print-constraints-stats',
+                            help='Вывести количество ограничений, удаленных при упрощении системы уравнений.',
+                            action='store_true')
+    arg_parser.add_argument('-n', '--incremental',
+                            help='Инкрементальный вывод типов: переиспользовать типы неизмененных объявлений из кэша '
+                                 '(файл .tmli рядом с исходным кодом), не решая их ограничения. Синтаксический и '
+                                 'семантический анализ по-прежнему выполняются для всего модуля.',
+                            action='store_true')
+    arg_parser.add_argument('-j', '--jobs', type=int, default=1,
+                            help='Количество процессов для параллельного вывода типов независимых групп объявлений.')
+    arg_parser.add_argument('-t', '--stream-definitions',
+                            help='Потоковый режим: выполнять семантический анализ каждого объявления верхнего уровня '
+                                 'сразу после его разбора, не сохраняя АСД всего модуля.',
+                            action='store_true')
+    arg_parser.add_argument('-m', '--mmap-source',
+                            help='Разбирать исходный код (в кодировке UTF-8) через отображение файла в память, не '
+                                 'декодируя его целиком.',
+                            action='store_true')
+    arg_parser.add_argument('-c', '--ast-cache', metavar='DIR',
+                            help='Каталог кэша АСД: не разбирать модуль заново, если его исходный код не изменился '
+                                 '(кроме потокового режима). Каталог должен быть доступен для записи только текущему '
+                                 'пользователю, иначе кэш не используется.')
+    arg_parser.add_argument('--ast-cache-size', type=int, default=256, metavar='MB',
+                            help='Размер кэша АСД в мегабайтах, при превышении которого удаляются давно не '
+                                 'использованные АСД.')
     arg_parser.add_argument('-g', '--skip-header-saving', help='Пропустить сохранение заголовочного файла модуля.',
                             action='store_true')
 
     args = arg_parser.parse_args()
-    Args(args)
 
-    return handle_next_stage(None, read_source_code)
+    return handle_next_stage(CompilationContext(Args(args)), None, read_source_code)
+
 
+def read_source_code(context: CompilationContext, _):
+    if context.args.mmap_source:
+        with open(context.args.source, 'rb') as file:
+            # Пустой файл нельзя отобразить в память.
+            text = mmap(file.fileno(), 0, access=ACCESS_READ) if os.fstat(file.fileno()).st_size else b''
+    else:
+        with open(context.args.source, 'r') as file:
+            text = file.read()
 
-def read_source_code(_):
-    with open(Args().source, 'r') as file:
-        text = file.read()
+    return handle_next_stage(context, text, parse_source_code)
 
-    return handle_next_stage(text, parse_source_code)
 
+def parse_source_code(context: CompilationContext, text: Union[str, bytes, mmap]):
+    args = context.args
+    if args.stream_definitions and not (args.stop_after_parsing or args.incremental or args.jobs > 1):
+        return parse_and_visit_source_code(context, text)
 
-def parse_source_code(text: str):
-    ast = parser.parse(text, tracking=True)
+    ast = parse(text, context) if args.ast_cache is None else parse_with_cache(context, text)
 
-    if Args().stop_after_parsing and Errors().is_ok():
-        print(json.dumps(AstToDictVisitor().visit(ast)))
+    if args.stop_after_parsing and context.errors.is_ok():
+        AstJsonWriter(sys.stdout).write(ast)
+        print()
         exit(0)
 
-    return handle_next_stage(ast, visit_ast)
+    return handle_next_stage(context, ast, visit_ast)
+
+
+def parse_with_cache(context: CompilationContext, text: Union[str, bytes, mmap]) -> Root:
+    cache = AstCache(context.args.ast_cache, context.args.ast_cache_size * 2 ** 20)
+
+    ast = cache.load(text)
+    if ast is None:
+        ast = parse(text, context)
+
+        if context.errors.is_ok():
+            cache.save(text, ast)
+
+    return ast
+
+
+def parse_and_visit_source_code(context: CompilationContext, text: Union[str, bytes, mmap]):
+    """
+    Потоковый режим: каждое объявление верхнего уровня проходит семантический анализ сразу после разбора, после чего
+    его АСД больше не нужно. Несовместим с режимами, которым нужно АСД всего модуля (-p, -n, -j).
+    """
+    visitor = SemanticVisitor(context)
+    errors = context.errors.list
+    # Как и в обычном режиме, об ошибках семантического анализа сообщается, только если разбор прошел без ошибок.
+    semantic_errors = []
 
+    def visit(visit_fun, node):
+        errors_count = len(errors)
+        visit_fun(node)
+        semantic_errors.extend(errors[errors_count:])
+        del errors[errors_count:]
 
-def visit_ast(ast: Root):
-    module = SemanticVisitor().visit_root(ast)
-    return handle_next_stage(module, infer_types)
+    parse(text, context, stream=DefinitionsStream(
+        lambda root: visit(visitor.visit_module_header, root),
+        lambda definition: visit(visitor.visit_top_level_definition, definition)))
 
+    if context.errors.is_ok():
+        errors.extend(semantic_errors)
 
-def infer_types(module):
-    if Args().stop_before_type_inferring:
-        print(GlobalTypeInferer().dump())
+    return handle_next_stage(context, context.module, infer_types)
+
+
+def visit_ast(context: CompilationContext, ast: Root):
+    args = context.args
+    if args.jobs > 1 and not (args.incremental or args.stop_before_type_inferring):
+        module = infer_in_parallel(context, ast, args.jobs)
+        return handle_next_stage(context, module, generate_header)
+
+    if args.incremental:
+        context.type_inferer.cache = InferenceCache(args.get_cache_path())
+
+    module = SemanticVisitor(context).visit_root(ast)
+    return handle_next_stage(context, module, infer_types)
+
+
+def infer_types(context: CompilationContext, module):
+    type_inferer = context.type_inferer
+
+    if context.args.stop_before_type_inferring:
+        print(type_inferer.dump())
         exit(0)
 
-    GlobalTypeInferer().infer()
-    return handle_next_stage(module, generate_header)
+    try:
+        type_inferer.infer()
+    except CompilationException as e:
+        # Сообщение об ошибке содержит путь к исходному коду из контекста, поэтому ошибка выводится как остальные.
+        e.handle(context.errors)
+
+    if type_inferer.cache is not None and context.errors.is_ok():
+        type_inferer.cache.save()
+
+    if context.args.print_constraints_stats:
+        print(f'удалено ограничений при упрощении: {type_inferer.removed_constraints_count}')
+        print(f'решено ограничений: {type_inferer.solved_constraints_count}')
+
+        if type_inferer.cache is not None:
+            print(f'типов объявлений взято из кэша: {type_inferer.reused_definitions_count}')
+
+    return handle_next_stage(context, module, generate_header)
 
 
-def generate_header(module):
-    if not Args().skip_header_generation:
-        text = json.dumps(HeaderGenerator().visit(module), separators=(',', ':'))
-        with open(Args().get_header_path(), 'w') as file:
-            file.write(text)
+def generate_header(context: CompilationContext, module):
+    if not context.args.skip_header_generation:
+        header = HeaderGenerator().visit(module)
+        with open(context.args.get_header_path(), 'w') as file:
+            AstJsonWriter(file, separators=COMPACT_SEPARATORS).write(header)
 
-    return handle_next_stage(module, generate_code)
+    return handle_next_stage(context, module, generate_code)
 
 
-def generate_code(module):
-    return handle_next_stage(None)
+def generate_code(context: CompilationContext, module):
+    return handle_next_stage(context, None)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,164 @@
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import tml_ast as ast
+from args import Args
+from ast_json_writer import COMPACT_SEPARATORS, AstJsonWriter
+from context import CompilationContext
+from errors import CompilationException, Error
+from header_gen import HeaderGenerator
+from header_reader import HeaderReader
+from json_reader import read_json
+from semantic.ast_visitor import SemanticVisitor
+from semantic.defs import ForeignLet
+from semantic.module import GlobalModule, Scope
+from semantic.typing.types import PolymorphType
+
+# Количество частей, на которое делятся объявления модуля на каждый процесс (для балансировки нагрузки).
+CHUNKS_PER_JOB = 4
+
+
+def referenced_names(node) -> set:
+    """ Имена, на которые ссылается узел АСД (с избытком: локальные имена, совпадающие с глобальными, тоже входят). """
+    names = set()
+    stack = [node]
+
+    while stack:
+        n = stack.pop()
+
+        if isinstance(n, ast.Var):
+            names.add(n.name)
+
+        if isinstance(n, list):
+            stack.extend(n)
+
+        if isinstance(n, ast.Node):
+            stack.extend(value for name, value in n.fields() if name != 'line')
+
+    return names
+
+
+def split_into_clusters(lets: List[ast.Let]) -> List[List[ast.Let]]:
+    """
+    Делит объявления верхнего уровня на независимые группы: объявления, ссылающиеся друг на друга (в том числе
+    транзитивно), попадают в одну группу. Объявления внутри группы сохраняют порядок объявления.
+    """
+    parent = list(range(len(lets)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+
+        return i
+
+    # Индекс первого объявления с каждым именем. Объявления с одинаковыми именами объединяются, чтобы ошибка
+    # переопределения была обнаружена.
+    first_by_name: Dict[str, int] = {}
+    for i, let in enumerate(lets):
+        first = first_by_name.setdefault(let.name, i)
+        parent[find(i)] = find(first)
+
+    for i, let in enumerate(lets):
+        for name in referenced_names(let):
+            if name in first_by_name:
+                parent[find(i)] = find(first_by_name[name])
+
+    clusters: Dict[int, List[ast.Let]] = {}
+    for i, let in enumerate(lets):
+        clusters.setdefault(find(i), []).append(let)
+
+    return list(clusters.values())
+
+
+def split_into_chunks(clusters: List[List[ast.Let]], chunks_count: int) -> List[List[ast.Let]]:
+    """ Распределяет группы по частям примерно одинакового размера. """
+    chunks = [[] for _ in range(min(chunks_count, len(clusters)))]
+
+    for cluster in sorted(clusters, key=len, reverse=True):
+        min(chunks, key=len).extend(cluster)
+
+    return chunks
+
+
+def infer_chunk(args: Args, root: ast.Root) -> Tuple[Optional[str], List[Error]]:
+    """
+    Выполняется в отдельном процессе: семантический анализ и вывод типов модуля, содержащего только часть объявлений
+    верхнего уровня. Возвращает заголовок модуля в формате JSON (стандартная сериализация pickle рекурсивна и не
+    справляется с глубоко вложенными типами) и ошибки.
+    """
+    # Процессы переиспользуются для нескольких частей, поэтому каждая часть компилируется в своем контексте.
+    context = CompilationContext(args)
+    module = SemanticVisitor(context).visit_root(root)
+
+    if context.errors.is_ok():
+        try:
+            context.type_inferer.infer()
+        except CompilationException as e:
+            e.handle(context.errors)
+
+    if not context.errors.is_ok():
+        return None, context.errors.list
+
+    file = io.StringIO()
+    AstJsonWriter(file, separators=COMPACT_SEPARATORS).write(HeaderGenerator().visit(module))
+
+    return file.getvalue(), []
+
+
+class InferredLetsVisitor(SemanticVisitor):
+    """ Семантический анализ модуля, типы объявлений верхнего уровня которого уже выведены в других процессах. """
+
+    def __init__(self, context: CompilationContext, types: dict):
+        super().__init__(context)
+        self.types = types
+
+    def visit_let(self, n: ast.Let, scope: Scope):
+        if n.name not in self.types:
+            # Тип не был выведен из-за ошибки, о которой сообщил другой процесс.
+            return
+
+        let = ForeignLet(n.name).with_type(self.types[n.name]).at(n.position)
+        scope.lets.add(let, let.position)
+
+
+def infer_in_parallel(context: CompilationContext, root: ast.Root, jobs: int) -> GlobalModule:
+    """
+    Вывод типов независимых групп объявлений верхнего уровня в jobs процессах. Выведенные типы передаются в виде
+    заголовка модуля и объединяются в модуле контекста компиляции.
+    """
+    lets = [definition for definition in root.definitions if isinstance(definition, ast.Let)]
+    other_definitions = [definition for definition in root.definitions if not isinstance(definition, ast.Let)]
+
+    chunks = split_into_chunks(split_into_clusters(lets), jobs * CHUNKS_PER_JOB)
+    positions = {definition: i for i, definition in enumerate(root.definitions)}
+    roots = [ast.Root(root.module_name, root.imports, root.opens,
+                      sorted(other_definitions + chunk, key=positions.__getitem__)) for chunk in chunks]
+
+    # АСД передаются в процессы в виде плоских списков узлов, так как стандартная сериализация pickle рекурсивна.
+    with ProcessPoolExecutor(jobs) as executor:
+        results = list(executor.map(infer_chunk, [context.args] * len(roots), map(ast.FlatTree, roots)))
+
+    types = {}
+    errors = []
+    for header, chunk_errors in results:
+        errors += chunk_errors
+
+        if header is not None:
+            header = read_json(header)
+            reader = HeaderReader()
+            reader.polymorph_types = [PolymorphType() for _ in range(header['pols'])]
+
+            for let in header['lets']:
+                if let['class'] == ForeignLet.__name__:
+                    types[let['name']] = reader.read_type(let['type'])
+
+    module = InferredLetsVisitor(context, types).visit_root(root)
+
+    # Ошибки в объявлениях типов и импортах обнаруживаются в каждом процессе, поэтому повторы удаляются.
+    errors = list({str(error): error for error in context.errors.list + errors}.values())
+    errors.sort(key=lambda error: 0 if error.position is None else error.position.line)
+    context.errors.list[:] = errors
+
+    return module
@@ -0,0 +1,153 @@
+import gc
+import os
+import pickle
+import stat
+import zlib
+from hashlib import sha1
+from mmap import mmap
+from pathlib import Path
+from typing import Optional, Union
+
+from tml_ast import FlatTree, Root
+
+# Версия формата снимков АСД. Должна меняться при любом изменении грамматики, узлов АСД или их построения
+# синтаксическим анализатором, которое может изменить АСД.
+SNAPSHOT_VERSION = 1
+
+SNAPSHOT_SUFFIX = '.ast'
+
+# Размер частей, которыми исходный код в байтах добавляется к отпечатку.
+HASH_CHUNK_SIZE = 2 ** 20
+
+# Исключения при загрузке поврежденного или несовместимого снимка.
+SNAPSHOT_ERRORS = (zlib.error, pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, TypeError,
+                   ValueError)
+
+
+def is_private(file_stat: os.stat_result) -> bool:
+    """ Принадлежит ли файл (или каталог) текущему пользователю и запрещена ли запись в него остальным. """
+    if not hasattr(os, 'getuid'):
+        return True
+
+    return file_stat.st_uid == os.getuid() and not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+class AstCache:
+    """
+    Кэш АСД модулей на диске. Снимок АСД хранится в отдельном файле, имя которого — отпечаток исходного кода модуля и
+    версии формата снимков, поэтому измененный модуль просто не находится в кэше, а одинаковые модули используют один
+    снимок. Снимок — сжатое представление АСД в формате pickle: при его загрузке синтаксический анализатор не нужен.
+    Смещения в АСД исходного кода в байтах отличаются от смещений в строке, поэтому отпечаток учитывает и вид исходного
+    кода. Поврежденный снимок удаляется, а модуль считается отсутствующим в кэше.
+
+    Загрузка снимка pickle может выполнить произвольный код, поэтому каталог кэша должен быть доверенным: он
+    создается доступным только текущему пользователю, а каталог и снимки, которые принадлежат другому пользователю
+    или доступны для записи остальным, не используются.
+
+    Если после сохранения снимка размер кэша превышает max_size байт, то удаляются снимки, которые дольше всего не
+    использовались (время использования — время изменения файла снимка).
+    """
+
+    def __init__(self, directory: str, max_size: int):
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    @staticmethod
+    def key(text: Union[str, bytes, mmap]) -> str:
+        if isinstance(text, str):
+            return sha1(f'{SNAPSHOT_VERSION}:str:'.encode() + text.encode()).hexdigest()
+
+        # Байты добавляются к отпечатку частями без копирования, чтобы не читать целиком отображенный в память файл.
+        key = sha1(f'{SNAPSHOT_VERSION}:bytes:'.encode())
+        with memoryview(text) as source:
+            for start in range(0, len(source), HASH_CHUNK_SIZE):
+                key.update(source[start:start + HASH_CHUNK_SIZE])
+
+        return key.hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        return self.directory / (key + SNAPSHOT_SUFFIX)
+
+    def load(self, text: Union[str, bytes, mmap]) -> Optional[Root]:
+        """ АСД модуля с исходным кодом text или None, если его нет в кэше. """
+        if not self.is_trusted():
+            return None
+
+        path = self.get_path(self.key(text))
+
+        # Загрузка создает только новые объекты без циклических ссылок, поэтому сборка мусора во время неё не нужна.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(path, 'rb') as f:
+                if not is_private(os.fstat(f.fileno())):
+                    return None
+
+                root = pickle.loads(zlib.decompress(f.read()))
+        except FileNotFoundError:
+            return None
+        except SNAPSHOT_ERRORS:
+            path.unlink(missing_ok=True)
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        if not isinstance(root, Root):
+            path.unlink(missing_ok=True)
+            return None
+
+        os.utime(path)
+        return root
+
+    def save(self, text: Union[str, bytes, mmap], root: Root):
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not self.is_trusted():
+            return
+
+        path = self.get_path(self.key(text))
+
+        # Снимок записывается во временный файл и переименовывается, чтобы параллельные компиляции не прочитали
+        # недописанный снимок.
+        temp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with open(temp_path, 'wb', opener=lambda name, flags: os.open(name, flags, 0o600)) as f:
+            f.write(zlib.compress(self.dumps(root), 1))
+
+        os.replace(temp_path, path)
+        self.evict()
+
+    def is_trusted(self) -> bool:
+        """ Можно ли загружать снимки из каталога кэша (см. описание класса). """
+        try:
+            return is_private(self.directory.stat())
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def dumps(root: Root) -> bytes:
+        try:
+            return pickle.dumps(root, protocol=pickle.HIGHEST_PROTOCOL)
+        except RecursionError:
+            # Слишком глубокое АСД сохраняется в виде плоского списка узлов: так его сериализация и загрузка не
+            # рекурсивны, но медленнее.
+            return pickle.dumps(FlatTree(root), protocol=pickle.HIGHEST_PROTOCOL)
+
+    def evict(self):
+        """ Удаляет давно не использованные снимки, пока размер кэша превышает max_size. """
+        snapshots = []
+        for path in self.directory.glob('*' + SNAPSHOT_SUFFIX):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+
+            snapshots.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(snapshot_size for _, snapshot_size, _ in snapshots)
+
+        for _, snapshot_size, path in sorted(snapshots, key=lambda snapshot: snapshot[0]):
+            if size <= self.max_size:
+                break
+
+            path.unlink(missing_ok=True)
+            size -= snapshot_size
@@ -0,0 +1,192 @@
+from bisect import bisect_left, bisect_right
+from typing import List, Optional
+
+from context import CompilationContext
+from tml_ast import Definition, Node, Root
+from .master_lexer import MasterLexer
+from .parser import parse
+
+# Заголовок, с которым разбираются измененные объявления. Он не содержит переходов на новую строку, поэтому объявления
+# получают те же номера строк, что и при разборе всего модуля.
+FRAGMENT_HEADER = 'module _ '
+
+
+class TextEdit:
+    """ Изменение исходного кода: замена text[start:end] на new_text. """
+
+    def __init__(self, start: int, end: int, new_text: str):
+        self.start = start
+        self.end = end
+        self.new_text = new_text
+
+
+def shift_lines(node, delta: int):
+    """ Сдвигает номера строк всех узлов поддерева АСД на delta. """
+    stack = [node]
+
+    while stack:
+        n = stack.pop()
+
+        if isinstance(n, list):
+            stack.extend(n)
+
+        if isinstance(n, Node):
+            n.line += delta
+            stack.extend(value for name, value in n.fields() if name != 'line')
+
+
+class ShiftedList:
+    """
+    Неубывающий список чисел (смещений или номеров строк объявлений), к элементам которого начиная с индекса gap
+    прибавляется общий сдвиг shift. Изменение исходного кода сдвигает все следующие за ним элементы, но при этом
+    обновляются только элементы между предыдущим и текущим изменением, поэтому время сдвига зависит от расстояния между
+    изменениями, а не от длины списка.
+    """
+
+    def __init__(self, values: List[int]):
+        self.values = values
+        self.gap = len(values)
+        self.shift = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> int:
+        return self.values[i] + self.shift if i >= self.gap else self.values[i]
+
+    def to_list(self) -> List[int]:
+        self.move_gap(len(self.values))
+        return list(self.values)
+
+    def bisect_left(self, x: int) -> int:
+        i = bisect_left(self.values, x, 0, self.gap)
+        return i if i < self.gap else bisect_left(self.values, x - self.shift, self.gap)
+
+    def bisect_right(self, x: int) -> int:
+        i = bisect_right(self.values, x, 0, self.gap)
+        return i if i < self.gap else bisect_right(self.values, x - self.shift, self.gap)
+
+    def move_gap(self, gap: int):
+        values, shift = self.values, self.shift
+
+        if gap > self.gap:
+            values[self.gap:gap] = [value + shift for value in values[self.gap:gap]]
+        else:
+            values[gap:self.gap] = [value - shift for value in values[gap:self.gap]]
+
+        self.gap = gap
+
+    def replace(self, first: int, last: int, new_values: List[int], shift: int):
+        """ Заменяет элементы с first по last включительно на new_values и сдвигает следующие элементы на shift. """
+        self.move_gap(last + 1)
+        self.values[first:last + 1] = new_values
+        self.gap = first + len(new_values)
+        self.shift += shift
+
+
+class IncrementalParser:
+    """
+    Синтаксический анализатор для редактора и сборки при изменении файлов: после изменения исходного кода заново
+    разбираются только объявления верхнего уровня, промежутки которых (Root.spans) затрагивает изменение, а их новые
+    АСД заменяют старые в корне АСД.
+
+    Начала и первые строки объявлений хранятся в ShiftedList, а номера строк узлов следующих объявлений и Root.spans
+    обновляются только при обращении к root. Если изменение затрагивает заголовок модуля или измененные объявления не
+    разбираются отдельно от остального кода, то модуль разбирается заново целиком.
+
+    Об ошибках разбора всего модуля сообщается в context.errors. Ошибки в измененных объявлениях не сохраняются: после
+    них модуль разбирается целиком.
+    """
+
+    def __init__(self, text: str, context: Optional[CompilationContext] = None):
+        self.text = text
+        self.context = CompilationContext() if context is None else context
+        self.full_parses = 0
+        self._root: Optional[Root] = None
+        self._starts = ShiftedList([])
+        self._lines = ShiftedList([])
+        self._parse_all()
+
+    @property
+    def root(self) -> Optional[Root]:
+        """ Корень АСД текущего исходного кода (None, если в нем есть синтаксические ошибки). """
+        root = self._root
+        if root is None:
+            return None
+
+        for definition, line in zip(root.definitions, self._lines.to_list()):
+            if definition.line != line:
+                shift_lines(definition, line - definition.line)
+
+        starts = self._starts.to_list()
+        root.spans = list(zip(starts, starts[1:] + [len(self.text)]))
+
+        return root
+
+    def edit(self, edit: TextEdit) -> Optional[List[Definition]]:
+        """
+        Применяет изменение к исходному коду. Возвращает новые АСД заново разобранных объявлений или None, если модуль
+        был разобран целиком.
+        """
+        self.text = self.text[:edit.start] + edit.new_text + self.text[edit.end:]
+
+        definitions = self._reparse(edit)
+        if definitions is None:
+            self._parse_all()
+
+        return definitions
+
+    def _parse_all(self):
+        self.full_parses += 1
+        errors_count = len(self.context.errors.list)
+        root = parse(self.text, self.context)
+
+        if len(self.context.errors.list) > errors_count:
+            self._root = None
+            self._starts = ShiftedList([])
+            self._lines = ShiftedList([])
+        else:
+            self._root = root
+            self._starts = ShiftedList([start for start, end in root.spans])
+            self._lines = ShiftedList([definition.line for definition in root.definitions])
+
+    def _reparse(self, edit: TextEdit) -> Optional[List[Definition]]:
+        """
+        Разбирает заново объявления, промежутки которых пересекаются с изменением (включая их границы). Возвращает None,
+        если их нужно разобрать вместе со всем модулем.
+        """
+        starts, lines = self._starts, self._lines
+        if self._root is None or not len(starts) or edit.start <= starts[0]:
+            return None
+
+        # Изменяемые объявления: с first по last включительно. Исходный код до начала first и после конца last не
+        # изменяется.
+        first = starts.bisect_left(edit.start) - 1
+        last = starts.bisect_right(edit.end) - 1
+
+        delta = len(edit.new_text) - (edit.end - edit.start)
+        start = starts[first]
+        end = starts[last + 1] + delta if last + 1 < len(starts) else len(self.text)
+
+        # Последняя лексема фрагмента не должна продолжаться в следующем объявлении.
+        if end < len(self.text) and not self.text[end - 1].isspace():
+            return None
+
+        lexer = MasterLexer()
+        lexer.lineno = lines[first]
+        context = CompilationContext(self.context.args)
+        fragment = parse(FRAGMENT_HEADER + self.text[start:end], context, lexer=lexer)
+
+        if not context.errors.is_ok():
+            return None
+
+        offset = start - len(FRAGMENT_HEADER)
+        # Переходы на новую строку внутри строковых литералов не учитываются в номерах строк, поэтому сдвиг строк
+        # следующих объявлений определяется по номеру строки, на которой закончился разбор фрагмента.
+        lines_delta = lexer.lineno - lines[last + 1] if last + 1 < len(lines) else 0
+
+        self._root.definitions[first:last + 1] = fragment.definitions
+        starts.replace(first, last, [s + offset for s, e in fragment.spans], delta)
+        lines.replace(first, last, [definition.line for definition in fragment.definitions], lines_delta)
+
+        return fragment.definitions
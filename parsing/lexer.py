@@ -1,7 +1,7 @@
 import ply.lex as lex
 import sys
 
-from errors import CompilationException, Error
+from errors import CompilationException, Error, Errors
 from position import Position
 
 
@@ -102,9 +102,26 @@ t_ignore = '\t \r'
 
 
 def t_error(t):
-    """ Обработчик лексических ошибок. Для продолжения лексического разбора пропускает токен с ошибкой. """
-    LexException(t).handle()
+    """
+    Обработчик лексических ошибок. Сообщает об ошибке в errors анализатора и для продолжения лексического разбора
+    пропускает токен с ошибкой.
+    """
+    LexException(t).handle(t.lexer.errors)
     t.lexer.skip(1)
 
 
-lexer = lex.lex()
+_lexer = None
+
+
+def get_lexer() -> lex.Lexer:
+    """
+    Лексический анализатор. Создается при первом обращении. Для разбора нужно использовать его копию (clone), которой
+    синтаксический анализатор передает список ошибок компиляции (errors).
+    """
+    global _lexer
+
+    if _lexer is None:
+        _lexer = lex.lex(module=sys.modules[__name__])
+        _lexer.errors = Errors()
+
+    return _lexer
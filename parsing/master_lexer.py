@@ -0,0 +1,245 @@
+import re
+from codecs import getincrementaldecoder
+from functools import partial
+from mmap import mmap
+from types import MappingProxyType
+from typing import Iterator, Optional, Union
+
+from errors import Errors
+from . import lexer as rules
+from .lexer import LexException
+
+# Наибольшее количество байтов исходного кода после лексической ошибки, которое выводится в сообщении о ней при разборе
+# байтов.
+ERROR_CONTEXT_SIZE = 64
+
+
+def decode_error_context(data: Union[bytes, mmap], pos: int) -> str:
+    """
+    Исходный код в байтах, начиная с позиции ошибки: не более ERROR_CONTEXT_SIZE байтов. Незавершенный последний символ
+    отбрасывается, а некорректные последовательности байтов заменяются.
+    """
+    return getincrementaldecoder('utf-8')('replace').decode(data[pos:pos + ERROR_CONTEXT_SIZE])
+
+
+class Token:
+    """ Лексема. Имеет те же атрибуты, что и лексема PLY (lexer устанавливается анализатором при ошибке). """
+
+    __slots__ = ('type', 'value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type_: str, value: str, lineno: int, lexpos: int):
+        self.type = type_
+        self.value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    def __repr__(self) -> str:
+        return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+
+class BytesToken:
+    """ Лексема исходного кода в байтах. Её значение декодируется только при первом обращении к нему. """
+
+    __slots__ = ('type', '_value', 'lineno', 'lexpos', 'lexer')
+
+    def __init__(self, type_: str, value: bytes, lineno: int, lexpos: int):
+        self.type = type_
+        self._value = value
+        self.lineno = lineno
+        self.lexpos = lexpos
+
+    @property
+    def value(self) -> str:
+        value = self._value
+        if type(value) is bytes:
+            value = self._value = value.decode()
+
+        return value
+
+    def __repr__(self) -> str:
+        return f'LexToken({self.type},{self.value!r},{self.lineno},{self.lexpos})'
+
+
+def is_literal(regex: str) -> bool:
+    """ Является ли регулярное выражение экранированной строкой без метасимволов. """
+    return re.fullmatch(r'(?:\\\W|[^\\.^$*+?{}\[\]()|])+', regex) is not None
+
+
+def unescape(regex: str) -> str:
+    return re.sub(r'\\(.)', r'\1', regex)
+
+
+# Правила-строки из parsing.lexer в порядке PLY: по убыванию длины регулярного выражения, при равной длине — по имени.
+string_rules = sorted((name[2:] for name, value in vars(rules).items()
+                       if name.startswith('t_') and isinstance(value, str) and name != 't_ignore'),
+                      key=lambda name: (-len(getattr(rules, 't_' + name)), name))
+
+# Типы лексем, заданных строками без метасимволов (операторов и знаков препинания).
+operators = {unescape(getattr(rules, 't_' + name)): name for name in string_rules
+             if is_literal(getattr(rules, 't_' + name))}
+bytes_operators = {operator.encode(): name for operator, name in operators.items()}
+
+
+def master_pattern(for_bytes: bool = False) -> str:
+    """
+    Общее регулярное выражение для всех правил из parsing.lexer. Альтернативы упорядочены так же, как в PLY: сначала
+    правила-функции в порядке объявления, затем правила-строки по убыванию длины регулярного выражения. Отличия,
+    не меняющие результат разбора:
+
+    * пропускаемые символы перед лексемой входят в совпадение, а переходы на новую строку вместе с окружающими их
+      пробельными символами образуют одно совпадение, поэтому строки считаются сразу для всей последовательности;
+    * операторы объединены в одну группу без вложенных именованных групп (их тип определяется по таблице), в которой
+      более длинные операторы идут раньше — так же, как при упорядочивании PLY по длине (ни одно другое правило не
+      может начинаться с тех же символов, что и оператор);
+    * последняя альтернатива соответствует ошибочному символу.
+
+    Если for_bytes, то выражение предназначено для исходного кода в кодировке UTF-8: байты многобайтовых символов
+    допускаются везде, где допускается \\w, а ошибочный символ занимает всю свою последовательность байтов.
+    """
+    functions = sorted((value for name, value in vars(rules).items() if name.startswith('t_') and callable(value)
+                        and name not in ('t_NEWLINE', 't_error')), key=lambda f: f.__code__.co_firstlineno)
+    ignore = re.escape(rules.t_ignore)
+
+    alternatives = [f'(?P<_SPACE>[{ignore}\\n]+)']
+    alternatives += [f'(?P<{f.__name__[2:]}>{f.__doc__})' for f in functions]
+
+    if for_bytes:
+        alternatives = [alternative.replace('\\w', '\\w\\x80-\\xff') for alternative in alternatives]
+
+    operators_added = False
+    for name in string_rules:
+        regex = getattr(rules, 't_' + name)
+
+        if not is_literal(regex):
+            alternatives.append(f'(?P<{name}>{regex})')
+        elif not operators_added:
+            operators_added = True
+            alternatives.append('(?P<_OPERATOR>' + '|'.join(map(re.escape, operators)) + ')')
+
+    if for_bytes:
+        alternatives.append('(?P<_ERROR>[\\x00-\\xbf]|[\\xc0-\\xff][\\x80-\\xbf]*)')
+    else:
+        alternatives.append('(?P<_ERROR>[\\s\\S])')
+
+    return f'[{ignore}]*(?:' + '|'.join(alternatives) + ')'
+
+
+class MasterLexer:
+    """
+    Лексический анализатор, выдающий те же лексемы, что и анализатор PLY из parsing.lexer, но использующий одно заранее
+    скомпилированное регулярное выражение с именованными группами вместо вызова функций-правил на каждую лексему.
+    Имеет интерфейс лексического анализатора PLY, необходимый синтаксическому анализатору.
+
+    Кроме строки, может разбирать исходный код в кодировке UTF-8 в виде байтов (bytes или mmap файла): тогда декодируются
+    только значения лексем, к которым обращается синтаксический анализатор, а не весь исходный код. В этом случае lexpos
+    лексем — смещения в байтах.
+
+    О лексических ошибках анализатор сообщает в errors (синтаксический анализатор заменяет его списком ошибок контекста
+    компиляции).
+    """
+
+    master = re.compile(master_pattern(), re.VERBOSE)
+    bytes_master = re.compile(master_pattern(for_bytes=True).encode(), re.VERBOSE)
+    # Регулярное выражение идентификатора: в байтах идентификатор может продолжаться любыми многобайтовыми символами, а
+    # не только буквами и цифрами, поэтому идентификаторы с такими символами проверяются после декодирования.
+    identifier = re.compile(rules.t_ID.__doc__, re.VERBOSE)
+    # Таблица ключевых слов (только для чтения).
+    keywords = MappingProxyType(dict(rules.lc_keywords))
+    bytes_keywords = MappingProxyType({keyword.encode(): name for keyword, name in rules.lc_keywords.items()})
+
+    def __init__(self):
+        self.lexdata = ''
+        self.lexpos = 0
+        self.lineno = 1
+        self.tokens: Optional[Iterator[Token]] = None
+        self.errors = Errors()
+
+    def input(self, data: Union[str, bytes, mmap]):
+        self.lexdata = data
+        self.lexpos = 0
+        self.tokens = self.generate_tokens() if isinstance(data, str) else self.generate_tokens_from_bytes()
+        # Метод token заменяется функцией без промежуточного вызова метода: она вызывается для каждой лексемы.
+        self.token = partial(next, self.tokens, None)
+
+    def token(self) -> Optional[Token]:
+        return next(self.tokens, None)
+
+    def clone(self) -> 'MasterLexer':
+        return MasterLexer()
+
+    def __iter__(self) -> Iterator[Token]:
+        return self.tokens
+
+    def generate_tokens(self) -> Iterator[Token]:
+        data = self.lexdata
+        keywords_get = self.keywords.get
+        operators_get = operators.__getitem__
+        lineno = self.lineno
+
+        for m in self.master.finditer(data):
+            kind = m.lastgroup
+            value = m.group(kind)
+
+            if kind == '_SPACE':
+                lineno += value.count('\n')
+                self.lineno = lineno
+                continue
+
+            pos = m.start(kind)
+            self.lexpos = pos + len(value)
+
+            if kind == 'ID':
+                yield Token(keywords_get(value, 'ID'), value, lineno, pos)
+            elif kind == '_OPERATOR':
+                yield Token(operators_get(value), value, lineno, pos)
+            elif kind == '_ERROR':
+                # Как и PLY, сообщает об ошибке с оставшейся частью исходного кода и пропускает один символ.
+                LexException(Token('error', data[pos:], lineno, pos)).handle(self.errors)
+            elif kind != 'COMMENT':
+                yield Token(kind, value, lineno, pos)
+
+        self.lexpos = len(data)
+
+    def generate_tokens_from_bytes(self) -> Iterator[BytesToken]:
+        data = self.lexdata
+        keywords_get = self.bytes_keywords.get
+        operators_get = bytes_operators.__getitem__
+        lineno = self.lineno
+        # Позиция, с которой нужно продолжить поиск лексем, если идентификатор оказался короче найденного совпадения.
+        restart = 0
+
+        while restart is not None:
+            matches = self.bytes_master.finditer(data, restart)
+            restart = None
+
+            for m in matches:
+                kind = m.lastgroup
+                value = m.group(kind)
+
+                if kind == '_SPACE':
+                    lineno += value.count(b'\n')
+                    self.lineno = lineno
+                    continue
+
+                pos = m.start(kind)
+                self.lexpos = pos + len(value)
+
+                if kind == 'ID':
+                    if not value.isascii():
+                        identifier = self.identifier.match(value.decode()).group()
+                        if len(identifier.encode()) < len(value):
+                            value = identifier.encode()
+                            restart = self.lexpos = pos + len(value)
+
+                    yield BytesToken(keywords_get(value, 'ID'), value, lineno, pos)
+
+                    if restart is not None:
+                        break
+                elif kind == '_OPERATOR':
+                    yield BytesToken(operators_get(value), value, lineno, pos)
+                elif kind == '_ERROR':
+                    LexException(Token('error', decode_error_context(data, pos), lineno, pos)).handle(self.errors)
+                elif kind != 'COMMENT':
+                    yield BytesToken(kind, value, lineno, pos)
+
+        self.lexpos = len(data)
@@ -1,11 +1,24 @@
+import sys
+from copy import copy
+from functools import partial
+from mmap import mmap
+from pathlib import Path
+from typing import Callable, Optional, Union
+
 from ply import yacc
 
-from errors import CompilationException, Error
+from context import CompilationContext
+from errors import CompilationException, Error, Errors
 from tml_ast import *
 
 # Без этого импорта не будет работать ply.yacc
 # noinspection PyUnresolvedReferences
 from .lexer import tokens
+from .master_lexer import MasterLexer
+
+# Модуль с заранее сгенерированными таблицами LALR-анализатора. После изменения грамматики их нужно сгенерировать
+# заново: python -m parsing.parser
+TABLES_MODULE = 'parsing.parsetab'
 
 
 class InvalidSyntaxException(CompilationException):
@@ -34,22 +47,20 @@ precedence = (
 )
 
 
-def list_rule(p, el_i=1, list_i=3, el_len=1):
+def list_rule(p):
     """
-    Вспомогательная функция для разбора списков.
+    Вспомогательная функция для разбора списков, заданных леворекурсивными правилами вида list : el | list SEP el или
+    list : el | list el. Элемент добавляется в конец уже построенного списка, поэтому разбор списка из N элементов
+    занимает O(N) времени, а глубина стека анализатора не зависит от N.
 
     :param p: массив терминалов и нетерминалов.
-    :param el_i: индекс элемента.
-    :param list_i: индекс вложенного списка.
-    :param el_len: количество терминалов и нетерминалов для режима работы с единственным элементом.
-    :return:
+    :return: список.
     """
-    if len(p) == 1:
-        p[0] = []
-    elif len(p) == el_len + 1:
-        p[0] = [p[el_i]]
+    if len(p) == 2:
+        p[0] = [p[1]]
     else:
-        p[0] = [p[el_i]] + p[list_i]
+        p[0] = p[1]
+        p[0].append(p[len(p) - 1])
 
     return p[0]
 
@@ -66,8 +77,22 @@ def pass_or_empty(p):
 
 
 def p_root(p):
-    """ root : MODULE ID import_or_none open_or_none defs_or_none """
-    p[0] = Root(p[2], p[3], p[4], p[5])
+    """ root : module_header defs_or_none """
+    p[0] = p[1]
+    p[0].definitions = p[2]
+
+    # Объявление занимает исходный код от своего начала до начала следующего объявления (или до конца исходного кода),
+    # поэтому пробельные символы и комментарии после объявления входят в его промежуток.
+    starts = p.parser.definition_starts
+    p[0].spans = list(zip(starts, starts[1:] + [p.lexer.lexpos]))
+
+
+def p_module_header(p):
+    """ module_header : MODULE ID import_or_none open_or_none """
+    p[0] = Root(p[2], p[3], p[4], [])
+
+    if p.parser.stream is not None:
+        p.parser.stream.on_header(p[0])
 
 
 def p_import_or_none(p):
@@ -90,8 +115,14 @@ def p_defs_or_none(p):
 
 def p_defs(p):
     """ defs    : def
-                | def defs """
-    list_rule(p, list_i=2)
+                | defs def """
+    if p.parser.stream is None:
+        list_rule(p)
+        p.parser.definition_starts.append(p.lexpos(len(p) - 1))
+    else:
+        # Объявление сразу передается дальше и не сохраняется в АСД.
+        p.parser.stream.on_definition(p[len(p) - 1])
+        p[0] = []
 
 
 def p_def(p):
@@ -134,13 +165,13 @@ def p_polymorph_type_params(p):
 
 def p_polymorph_types_list(p):
     """ polymorph_types_list    : polymorph_type
-                                | polymorph_type COMMA polymorph_types_list """
+                                | polymorph_types_list COMMA polymorph_type """
     list_rule(p)
 
 
 def p_type_constructors(p):
     """ type_constructors   : type_constructor
-                            | type_constructor COMMA type_constructors """
+                            | type_constructors COMMA type_constructor """
     list_rule(p)
 
 
@@ -162,7 +193,7 @@ def p_types_product_with_eq(p):
 
 def p_types_product(p):
     """ types_product   : type
-                        | type MUL types_product """
+                        | types_product MUL type """
     list_rule(p)
 
 
@@ -178,7 +209,7 @@ def p_import(p):
 
 def p_modules_list(p):
     """ modules_list    : str
-                        | str COMMA modules_list """
+                        | modules_list COMMA str """
     list_rule(p)
 
 
@@ -208,7 +239,7 @@ def p_param_type(p):
 
 def p_types_list(p):
     """ types_list  : type
-                    | type COMMA types_list """
+                    | types_list COMMA type """
     list_rule(p)
 
 
@@ -353,7 +384,7 @@ def p_match(p):
 
 def p_match_branches(p):
     """ match_branches  : match_branch
-                        | match_branch COMMA match_branches """
+                        | match_branches COMMA match_branch """
     list_rule(p)
 
 
@@ -379,7 +410,7 @@ def p_match_branch_body_expr_group(p):
 
 def p_expr_semicolon_list(p):
     """ expr_semicolon_list : expr
-                            | expr SEMICOLON expr_semicolon_list """
+                            | expr_semicolon_list SEMICOLON expr """
     list_rule(p)
 
 
@@ -398,7 +429,7 @@ def p_expr_comma_list_or_none(p):
 
 def p_expr_comma_list(p):
     """ expr_comma_list  : expr
-                        | expr COMMA expr_comma_list """
+                        | expr_comma_list COMMA expr """
     list_rule(p)
 
 
@@ -416,13 +447,13 @@ def p_args_list_or_none(p):
 
 def p_args_list(p):
     """ args_list   : ID
-                    | ID COMMA args_list """
+                    | args_list COMMA ID """
     list_rule(p)
 
 
 def p_fun_body(p):
     """ fun_body    : fun_body_stmt
-                    | fun_body_stmt SEMICOLON fun_body """
+                    | fun_body SEMICOLON fun_body_stmt """
     list_rule(p)
 
 
@@ -479,11 +510,79 @@ def p_str(p):
     p[0] = p[1][1:-1]
 
 
-def p_error(p):
+def p_error(p, *, errors: Errors):
+    # Список ошибок передается в каждом разборе (см. parse).
     if p is None:
-        UnexpectedEofException().handle()
+        UnexpectedEofException().handle(errors)
     else:
-        InvalidSyntaxException(p).handle()
+        InvalidSyntaxException(p).handle(errors)
+
+
+class DefinitionsStream:
+    """
+    Получатель частей модуля в потоковом режиме разбора: заголовок модуля (имя, импорты и открытые модули) передается в
+    on_header, а каждое объявление верхнего уровня — в on_definition сразу после его разбора.
+    """
+
+    def __init__(self, on_header: Callable[[Root], None], on_definition: Callable[[Definition], None]):
+        self.on_header = on_header
+        self.on_definition = on_definition
+
+
+_parser = None
+
+
+def get_parser() -> yacc.LRParser:
+    """
+    Синтаксический анализатор. Создается при первом обращении из заранее сгенерированных таблиц: грамматика не
+    проверяется, таблицы не строятся заново, а отладочные файлы и файлы таблиц не записываются.
+
+    Для разбора используется копия анализатора (см. parse): копии используют общие таблицы, но состояние разбора у
+    каждой своё.
+    """
+    global _parser
+
+    if _parser is None:
+        _parser = yacc.yacc(module=sys.modules[__name__], tabmodule=TABLES_MODULE,
+                            outputdir=str(Path(__file__).parent), optimize=True, debug=False, write_tables=False)
+
+    return _parser
+
+
+def parse(text: Union[str, bytes, mmap], context: Optional[CompilationContext] = None, lexer=None,
+          stream: Optional[DefinitionsStream] = None) -> Root:
+    """
+    Синтаксический разбор исходного кода модуля. По умолчанию используется MasterLexer; lexer — новый лексический
+    анализатор с интерфейсом анализатора PLY (например, parsing.lexer.get_lexer().clone()). Исходный код в кодировке
+    UTF-8 может быть передан в виде байтов (в том числе mmap файла), если его поддерживает лексический анализатор.
+
+    Об ошибках сообщается в context.errors. Если контекст не задан, то разбор выполняется в новом контексте, а ошибки
+    не сохраняются.
+
+    Если задан stream, то объявления верхнего уровня передаются в него по мере разбора и не входят в возвращаемый
+    корень АСД, поэтому в памяти одновременно находится АСД только одного объявления.
+    """
+    if context is None:
+        context = CompilationContext()
+
+    lexer = lexer or MasterLexer()
+    lexer.errors = context.errors
+
+    parser = copy(get_parser())
+    parser.errorfunc = partial(p_error, errors=context.errors)
+    parser.stream = stream
+    parser.definition_starts = []
+
+    return parser.parse(text, lexer=lexer, tracking=True)
+
+
+def generate_tables():
+    """ Генерирует таблицы анализатора в пакете parsing. """
+    # yacc не перезаписывает таблицы с той же сигнатурой грамматики, а номера строк правил в них могут устареть.
+    (Path(__file__).parent / 'parsetab.py').unlink(missing_ok=True)
+    yacc.yacc(module=sys.modules[__name__], tabmodule='parsetab', outputdir=str(Path(__file__).parent),
+              debug=False, write_tables=True)
 
 
-parser = yacc.yacc()
+if __name__ == '__main__':
+    generate_tables()
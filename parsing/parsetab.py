@@ -0,0 +1,175 @@
+
+# parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'leftPUTleftNEWleftTHENELSEleftORleftANDleftEQNEQBIGGERLESSBEQLEQBIGGER_FLOATLESS_FLOATBEQ_FLOATLEQ_FLOATleftCONSCONCATleftRSHIFTLSHIFTleftBORBANDleftPLUSMINUSFLOAT_PLUSFLOAT_MINUSleftMULDIVMODFLOAT_MULFLOAT_DIVrightUMINUSNOTGETVALBNOTAND ARROW BAND BEQ BEQ_FLOAT BIGGER_FLOAT BNOT BOR COLON COMMA CONCAT CONS DIV ELSE EQ FLOAT FLOAT_DIV FLOAT_MINUS FLOAT_MUL FLOAT_PLUS FUN GETVAL ID IF IMPORT INT LANGLE LBRACE LBRACK LEQ LEQ_FLOAT LESS_FLOAT LET LPAR LSHIFT MATCH MINUS MOD MODULE MUL NEQ NEW NOT OPEN OR PLUS POLYMORPH_TYPE PUT RANGLE RBRACE RBRACK RPAR RSHIFT SEMICOLON STR THEN TYPE root : module_header defs_or_none  module_header : MODULE ID import_or_none open_or_none  import_or_none  : _empty\n                        | import  open_or_none    : _empty\n                        | open  defs_or_none    : defs\n                        | _empty_list  defs    : def\n                | defs def  def : let\n            | type_def  let : LET ID type_hint_or_none EQ expr  type_hint_or_none   : type_hint\n                            | _empty  type_hint : COLON type  type_def : TYPE ID polymorph_type_params_or_none EQ LBRACE type_constructors RBRACE polymorph_type_params_or_none   : polymorph_type_params\n                                        | _empty_list  polymorph_type_params : LANGLE polymorph_types_list RANGLE  polymorph_types_list    : polymorph_type\n                                | polymorph_types_list COMMA polymorph_type  type_constructors   : type_constructor\n                            | type_constructors COMMA type_constructor  type_constructor : ID types_product_or_none  types_product_or_none   : _empty\n                                | types_product_with_eq  types_product_with_eq   : EQ types_product  types_product   : type\n                        | types_product MUL type  open : OPEN modules_list  import : IMPORT modules_list  modules_list    : str\n                        | modules_list COMMA str  type    : atomic_type\n                | fun_type  atomic_type : simple_type\n                    | param_type\n                    | polymorph_type\n                    | type_in_par  simple_type : ID  param_type : ID LANGLE types_list RANGLE  types_list  : type\n                    | types_list COMMA type  fun_type    : fun_type_arg\n                    | fun_type_args  fun_type_arg : ARROW single_type_to_list  single_type_to_list : atomic_type  fun_type_args : atomic_type ARROW right_arg_type  right_arg_type  : fun_type_args\n                        | single_type_to_list  polymorph_type : POLYMORPH_TYPE  type_in_par : LPAR type RPAR  expr    : const\n                | var\n                | if\n                | group\n                | apply\n                | match\n                | fun\n                | bin_op\n                | un_op\n                | list\n                | get_el  bin_op  : expr PUT expr\n                | expr EQ expr\n                | expr LANGLE expr %prec LESS\n                | expr RANGLE expr %prec BIGGER\n                | expr LESS_FLOAT expr\n                | expr BIGGER_FLOAT expr\n                | expr NEQ expr\n                | expr BEQ expr\n                | expr LEQ expr\n                | expr BEQ_FLOAT expr\n                | expr LEQ_FLOAT expr\n                | expr FLOAT_PLUS expr\n                | expr FLOAT_MINUS expr\n                | expr FLOAT_MUL expr\n                | expr FLOAT_DIV expr\n                | expr PLUS expr\n                | expr MINUS expr\n                | expr MUL expr\n                | expr DIV expr\n                | expr MOD expr\n                | expr CONS expr\n                | expr CONCAT expr\n                | expr OR expr\n                | expr AND expr\n                | expr BOR expr\n                | expr BAND expr\n                | expr LSHIFT expr\n                | expr RSHIFT expr  un_op   : NOT expr\n                | MINUS expr %prec UMINUS\n                | FLOAT_MINUS expr %prec UMINUS\n                | BNOT expr\n                | NEW expr\n                | GETVAL expr list : LBRACK expr_comma_list_or_none RBRACK  get_el : list_expr LBRACK expr RBRACK  list_expr   : group\n                    | apply\n                    | get_el\n                    | var\n                    | list  group : LPAR expr RPAR  var : ID  if : IF group THEN expr ELSE expr  apply : apply_fun_expr LPAR expr_comma_list_or_none RPAR match : MATCH expr LBRACE match_branches RBRACE  match_branches  : match_branch\n                        | match_branches COMMA match_branch  match_branch : expr ARROW match_branch_body  match_branch_body   : expr\n                            | match_branch_body_expr_group  match_branch_body_expr_group : LBRACE expr_semicolon_list RBRACE  expr_semicolon_list : expr\n                            | expr_semicolon_list SEMICOLON expr  apply_fun_expr  : group\n                        | apply\n                        | var  expr_comma_list_or_none  : expr_comma_list\n                                | _empty_list  expr_comma_list  : expr\n                        | expr_comma_list COMMA expr  fun : FUN LPAR args_list_or_none RPAR ARROW LBRACE fun_body RBRACE  args_list_or_none   : args_list\n                            | _empty_list  args_list   : ID\n                    | args_list COMMA ID  fun_body    : fun_body_stmt\n                    | fun_body SEMICOLON fun_body_stmt  fun_body_stmt   : expr\n                        | let  _empty :  _empty_list :  const   : str_const\n                | int_const\n                | float_const\n                | unit  str_const : str  int_const : INT  float_const : FLOAT  unit : LPAR RPAR  str : STR '
+    
+_lr_action_items = {'MODULE':([0,],[3,]),'$end':([1,2,4,5,6,7,8,9,12,13,16,17,18,28,29,30,32,33,34,52,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,95,127,131,132,133,134,135,136,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,198,201,208,215,220,236,],[0,-136,-1,-7,-8,-9,-11,-12,-135,-10,-135,-3,-4,-2,-5,-6,-32,-33,-145,-31,-107,-13,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-34,-144,-95,-94,-93,-96,-97,-98,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,-17,-109,-100,-110,-108,-126,]),'LET':([2,5,7,8,9,12,13,16,17,18,28,29,30,32,33,34,52,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,95,127,131,132,133,134,135,136,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,198,201,208,215,220,226,236,237,],[10,10,-9,-11,-12,-135,-10,-135,-3,-4,-2,-5,-6,-32,-33,-145,-31,-107,-13,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-34,-144,-95,-94,-93,-96,-97,-98,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,-17,-109,-100,-110,-108,10,-126,10,]),'TYPE':([2,5,7,8,9,12,13,16,17,18,28,29,30,32,33,34,52,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,95,127,131,132,133,134,135,136,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,198,201,208,215,220,236,],[11,11,-9,-11,-12,-135,-10,-135,-3,-4,-2,-5,-6,-32,-33,-145,-31,-107,-13,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-34,-144,-95,-94,-93,-96,-97,-98,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,-17,-109,-100,-110,-108,-126,]),'ID':([3,10,11,23,35,47,48,72,74,76,77,78,79,80,81,82,87,88,92,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,130,141,181,184,190,193,197,199,206,213,214,216,219,224,226,235,237,],[12,14,15,45,54,45,45,54,54,54,54,54,54,54,54,54,45,45,149,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,188,54,54,54,54,45,45,149,218,54,54,54,45,54,54,54,54,]),'OPEN':([12,16,17,18,32,33,34,95,],[-135,31,-3,-4,-32,-33,-145,-34,]),'IMPORT':([12,],[19,]),'COLON':([14,],[23,]),'EQ':([14,15,20,21,22,24,25,26,34,36,37,38,39,40,41,42,43,44,45,46,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,90,91,93,126,127,129,131,132,133,134,135,136,140,142,143,144,145,148,149,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,192,200,201,202,207,208,215,220,221,229,232,236,238,],[-135,-136,35,-14,-15,49,-18,-19,-145,-16,-35,-36,-37,-38,-39,-40,-45,-46,-41,-52,-107,96,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-47,-48,-20,96,-144,96,-95,-94,-93,-96,96,-98,96,-48,-49,-50,-51,-53,197,-66,96,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,96,96,-89,-90,-91,-92,-106,-99,96,-42,96,-109,96,96,-100,-110,96,96,96,96,-126,96,]),'LANGLE':([15,34,45,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[27,-145,88,-107,98,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,98,-144,98,-95,-94,-93,-96,-97,-98,98,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,98,98,-109,98,98,-100,-110,-108,98,98,98,-126,98,]),'STR':([19,31,35,53,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'POLYMORPH_TYPE':([23,27,47,48,87,88,94,193,197,219,],[46,46,46,46,46,46,46,46,46,46,]),'LPAR':([23,35,47,48,54,57,59,60,71,72,73,74,75,76,77,78,79,80,81,82,87,88,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,182,184,190,193,197,201,213,214,216,219,224,226,235,237,],[47,72,47,47,-107,-121,-119,-120,125,72,128,72,130,72,72,72,72,72,72,72,47,47,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,72,-106,72,72,47,47,-109,72,72,72,47,72,72,72,72,]),'ARROW':([23,34,37,39,40,41,42,45,46,47,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,88,127,131,132,133,134,135,136,142,148,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,192,193,197,201,202,205,208,215,219,220,236,],[48,-145,87,-37,-38,-39,-40,-41,-52,48,-107,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,48,-144,-95,-94,-93,-96,-97,-98,87,-53,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,-42,48,48,-109,214,217,-100,-110,48,-108,-126,]),'COMMA':([32,33,34,37,38,39,40,41,42,43,44,45,46,50,51,52,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,90,91,95,127,131,132,133,134,135,136,138,140,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,186,188,189,192,194,195,196,201,203,204,207,208,209,210,211,212,215,218,220,221,222,223,225,227,234,236,],[53,-33,-145,-35,-36,-37,-38,-39,-40,-45,-46,-41,-52,94,-21,53,-107,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-47,-48,-34,-144,-95,-94,-93,-96,-97,-98,190,-124,-48,-49,-50,-51,193,-43,-53,-135,199,-23,-22,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,206,-129,-99,-42,-25,-26,-27,-109,216,-111,-125,-100,-44,-28,-29,-24,-110,-130,-108,-114,-113,-115,-112,-30,-116,-126,]),'PUT':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,97,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,97,-144,97,-95,-94,-93,-96,-97,-98,97,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,97,97,-109,97,97,-100,-110,-108,97,97,97,-126,97,]),'RANGLE':([34,37,38,39,40,41,42,43,44,45,46,50,51,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,90,91,126,127,129,131,132,133,134,135,136,140,142,143,144,145,146,147,148,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,192,200,201,202,207,208,209,215,220,221,229,232,236,238,],[-145,-35,-36,-37,-38,-39,-40,-45,-46,-41,-52,93,-21,-107,99,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-47,-48,99,-144,99,-95,-94,-93,-96,-97,-98,99,-48,-49,-50,-51,192,-43,-53,-22,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,99,-42,99,-109,99,99,-100,-44,-110,-108,99,99,99,-126,99,]),'LESS_FLOAT':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,100,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,100,-144,100,-95,-94,-93,-96,100,-98,100,-66,100,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,100,100,-89,-90,-91,-92,-106,-99,100,100,-109,100,100,-100,-110,100,100,100,100,-126,100,]),'BIGGER_FLOAT':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,101,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,101,-144,101,-95,-94,-93,-96,101,-98,101,-66,101,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,101,101,-89,-90,-91,-92,-106,-99,101,101,-109,101,101,-100,-110,101,101,101,101,-126,101,]),'NEQ':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,102,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,102,-144,102,-95,-94,-93,-96,102,-98,102,-66,102,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,102,102,-89,-90,-91,-92,-106,-99,102,102,-109,102,102,-100,-110,102,102,102,102,-126,102,]),'BEQ':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,103,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,103,-144,103,-95,-94,-93,-96,103,-98,103,-66,103,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,103,103,-89,-90,-91,-92,-106,-99,103,103,-109,103,103,-100,-110,103,103,103,103,-126,103,]),'LEQ':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,104,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,104,-144,104,-95,-94,-93,-96,104,-98,104,-66,104,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,104,104,-89,-90,-91,-92,-106,-99,104,104,-109,104,104,-100,-110,104,104,104,104,-126,104,]),'BEQ_FLOAT':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,105,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,105,-144,105,-95,-94,-93,-96,105,-98,105,-66,105,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,105,105,-89,-90,-91,-92,-106,-99,105,105,-109,105,105,-100,-110,105,105,105,105,-126,105,]),'LEQ_FLOAT':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,106,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,106,-144,106,-95,-94,-93,-96,106,-98,106,-66,106,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,106,106,-89,-90,-91,-92,-106,-99,106,106,-109,106,106,-100,-110,106,106,106,106,-126,106,]),'FLOAT_PLUS':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,107,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,107,-144,107,-95,-94,-93,-96,107,-98,107,107,107,107,107,107,107,107,107,107,107,107,-76,-77,-78,-79,-80,-81,-82,-83,-84,107,107,107,107,107,107,107,107,-106,-99,107,107,-109,107,107,-100,-110,107,107,107,107,-126,107,]),'FLOAT_MINUS':([34,35,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,74,76,77,78,79,80,81,82,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,127,128,129,131,132,133,134,135,136,140,141,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,200,201,202,207,208,213,214,215,216,220,221,224,226,229,232,235,236,237,238,],[-145,76,-107,108,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,76,76,76,76,76,76,76,76,76,-141,-142,-143,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,108,-144,76,108,-95,-94,-93,-96,108,-98,108,76,108,108,108,108,108,108,108,108,108,108,108,-76,-77,-78,-79,-80,-81,-82,-83,-84,108,108,108,108,108,108,108,108,76,-106,76,-99,76,108,108,-109,108,108,-100,76,76,-110,76,108,108,76,76,108,108,76,-126,76,108,]),'FLOAT_MUL':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,109,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,109,-144,109,-95,-94,-93,-96,109,-98,109,109,109,109,109,109,109,109,109,109,109,109,109,109,-78,-79,109,109,-82,-83,-84,109,109,109,109,109,109,109,109,-106,-99,109,109,-109,109,109,-100,-110,109,109,109,109,-126,109,]),'FLOAT_DIV':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,110,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,110,-144,110,-95,-94,-93,-96,110,-98,110,110,110,110,110,110,110,110,110,110,110,110,110,110,-78,-79,110,110,-82,-83,-84,110,110,110,110,110,110,110,110,-106,-99,110,110,-109,110,110,-100,-110,110,110,110,110,-126,110,]),'PLUS':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,111,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,111,-144,111,-95,-94,-93,-96,111,-98,111,111,111,111,111,111,111,111,111,111,111,111,-76,-77,-78,-79,-80,-81,-82,-83,-84,111,111,111,111,111,111,111,111,-106,-99,111,111,-109,111,111,-100,-110,111,111,111,111,-126,111,]),'MINUS':([34,35,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,74,76,77,78,79,80,81,82,84,85,86,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,126,127,128,129,131,132,133,134,135,136,140,141,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,184,189,190,191,200,201,202,207,208,213,214,215,216,220,221,224,226,229,232,235,236,237,238,],[-145,77,-107,112,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,77,77,77,77,77,77,77,77,77,-141,-142,-143,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,112,-144,77,112,-95,-94,-93,-96,112,-98,112,77,112,112,112,112,112,112,112,112,112,112,112,-76,-77,-78,-79,-80,-81,-82,-83,-84,112,112,112,112,112,112,112,112,77,-106,77,-99,77,112,112,-109,112,112,-100,77,77,-110,77,112,112,77,77,112,112,77,-126,77,112,]),'MUL':([34,37,38,39,40,41,42,43,44,45,46,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,90,91,126,127,129,131,132,133,134,135,136,140,142,143,144,145,148,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,192,200,201,202,207,208,210,211,215,220,221,227,229,232,236,238,],[-145,-35,-36,-37,-38,-39,-40,-45,-46,-41,-52,-107,113,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-47,-48,113,-144,113,-95,-94,-93,-96,113,-98,113,-48,-49,-50,-51,-53,113,113,113,113,113,113,113,113,113,113,113,113,113,-78,-79,113,113,-82,-83,-84,113,113,113,113,113,113,113,113,-106,-99,113,-42,113,-109,113,113,-100,219,-29,-110,113,113,-30,113,113,-126,113,]),'DIV':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,114,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,114,-144,114,-95,-94,-93,-96,114,-98,114,114,114,114,114,114,114,114,114,114,114,114,114,114,-78,-79,114,114,-82,-83,-84,114,114,114,114,114,114,114,114,-106,-99,114,114,-109,114,114,-100,-110,114,114,114,114,-126,114,]),'MOD':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,115,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,115,-144,115,-95,-94,-93,-96,115,-98,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-78,-79,115,115,-82,-83,-84,115,115,115,115,115,115,115,115,-106,-99,115,115,-109,115,115,-100,-110,115,115,115,115,-126,115,]),'CONS':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,116,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,116,-144,116,-95,-94,-93,-96,116,-98,116,116,116,116,116,116,116,116,116,116,116,116,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,116,116,-89,-90,-91,-92,-106,-99,116,116,-109,116,116,-100,-110,116,116,116,116,-126,116,]),'CONCAT':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,117,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,117,-144,117,-95,-94,-93,-96,117,-98,117,117,117,117,117,117,117,117,117,117,117,117,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,117,117,-89,-90,-91,-92,-106,-99,117,117,-109,117,117,-100,-110,117,117,117,117,-126,117,]),'OR':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,118,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,118,-144,118,-95,-94,-93,-96,118,-98,118,-66,118,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,118,118,-109,118,118,-100,-110,118,118,118,118,-126,118,]),'AND':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,119,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,119,-144,119,-95,-94,-93,-96,119,-98,119,-66,119,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,119,-88,-89,-90,-91,-92,-106,-99,119,119,-109,119,119,-100,-110,119,119,119,119,-126,119,]),'BOR':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,120,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,120,-144,120,-95,-94,-93,-96,120,-98,120,120,120,120,120,120,120,120,120,120,120,120,-76,-77,-78,-79,-80,-81,-82,-83,-84,120,120,120,120,-89,-90,120,120,-106,-99,120,120,-109,120,120,-100,-110,120,120,120,120,-126,120,]),'BAND':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,121,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,121,-144,121,-95,-94,-93,-96,121,-98,121,121,121,121,121,121,121,121,121,121,121,121,-76,-77,-78,-79,-80,-81,-82,-83,-84,121,121,121,121,-89,-90,121,121,-106,-99,121,121,-109,121,121,-100,-110,121,121,121,121,-126,121,]),'LSHIFT':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,122,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,122,-144,122,-95,-94,-93,-96,122,-98,122,122,122,122,122,122,122,122,122,122,122,122,-76,-77,-78,-79,-80,-81,-82,-83,-84,122,122,122,122,-89,-90,-91,-92,-106,-99,122,122,-109,122,122,-100,-110,122,122,122,122,-126,122,]),'RSHIFT':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,126,127,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,200,201,202,207,208,215,220,221,229,232,236,238,],[-145,-107,123,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,123,-144,123,-95,-94,-93,-96,123,-98,123,123,123,123,123,123,123,123,123,123,123,123,-76,-77,-78,-79,-80,-81,-82,-83,-84,123,123,123,123,-89,-90,-91,-92,-106,-99,123,123,-109,123,123,-100,-110,123,123,123,123,-126,123,]),'RBRACE':([34,37,38,39,40,41,42,43,44,45,46,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,90,91,127,131,132,133,134,135,136,142,143,144,145,148,149,150,151,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,192,194,195,196,201,203,204,208,210,211,212,215,220,221,222,223,225,227,228,229,230,231,232,233,234,236,238,239,],[-145,-35,-36,-37,-38,-39,-40,-45,-46,-41,-52,-107,-13,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-47,-48,-144,-95,-94,-93,-96,-97,-98,-48,-49,-50,-51,-53,-135,198,-23,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,-42,-25,-26,-27,-109,215,-111,-100,-28,-29,-24,-110,-108,-114,-113,-115,-112,-30,234,-117,236,-131,-133,-134,-116,-126,-118,-132,]),'SEMICOLON':([34,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,127,131,132,133,134,135,136,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,201,208,215,220,228,229,230,231,232,233,236,238,239,],[-145,-107,-13,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-144,-95,-94,-93,-96,-97,-98,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,-109,-100,-110,-108,235,-117,237,-131,-133,-134,-126,-118,-132,]),'RPAR':([34,37,38,39,40,41,42,43,44,45,46,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,72,84,85,86,89,90,91,126,127,128,130,131,132,133,134,135,136,138,139,140,142,143,144,145,148,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,183,185,186,187,188,189,192,201,207,208,215,218,220,236,],[-145,-35,-36,-37,-38,-39,-40,-45,-46,-41,-52,-107,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,127,-141,-142,-143,148,-47,-48,182,-144,-136,-136,-95,-94,-93,-96,-97,-98,-122,-123,-124,-48,-49,-50,-51,-53,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,201,205,-127,-128,-129,-99,-42,-109,-125,-100,-110,-130,-108,-126,]),'LBRACE':([34,49,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,127,129,131,132,133,134,135,136,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,201,208,214,215,217,220,236,],[-145,92,-107,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-144,184,-95,-94,-93,-96,-97,-98,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,-109,-100,224,-110,226,-108,-126,]),'RBRACK':([34,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,82,84,85,86,127,131,132,133,134,135,136,137,138,139,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,191,201,207,208,215,220,236,],[-145,-107,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-136,-141,-142,-143,-144,-95,-94,-93,-96,-97,-98,189,-122,-123,-124,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,208,-109,-125,-100,-110,-108,-126,]),'ELSE':([34,54,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,84,85,86,127,131,132,133,134,135,136,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,182,189,200,201,208,215,220,236,],[-145,-107,-54,-55,-56,-57,-58,-59,-60,-61,-62,-63,-64,-137,-138,-139,-140,-141,-142,-143,-144,-95,-94,-93,-96,-97,-98,-66,-65,-67,-68,-69,-70,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,-89,-90,-91,-92,-106,-99,213,-109,-100,-110,-108,-126,]),'IF':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,71,]),'MATCH':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,74,]),'FUN':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'NOT':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'BNOT':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,79,]),'NEW':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,80,]),'GETVAL':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,81,]),'LBRACK':([35,54,57,59,60,65,66,72,74,76,77,78,79,80,81,82,83,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,182,184,189,190,201,208,213,214,216,224,226,235,237,],[82,-107,-104,-101,-102,-105,-103,82,82,82,82,82,82,82,82,82,141,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,82,-106,82,-99,82,-109,-100,82,82,82,82,82,82,82,]),'INT':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,]),'FLOAT':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,86,]),'THEN':([124,182,],[181,-106,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'root':([0,],[1,]),'module_header':([0,],[2,]),'defs_or_none':([2,],[4,]),'defs':([2,],[5,]),'_empty_list':([2,15,82,128,130,],[6,26,139,139,187,]),'def':([2,5,],[7,13,]),'let':([2,5,226,237,],[8,8,233,233,]),'type_def':([2,5,],[9,9,]),'import_or_none':([12,],[16,]),'_empty':([12,14,16,149,],[17,22,29,195,]),'import':([12,],[18,]),'type_hint_or_none':([14,],[20,]),'type_hint':([14,],[21,]),'polymorph_type_params_or_none':([15,],[24,]),'polymorph_type_params':([15,],[25,]),'open_or_none':([16,],[28,]),'open':([16,],[30,]),'modules_list':([19,31,],[32,52,]),'str':([19,31,35,53,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[33,33,84,95,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,84,]),'type':([23,47,88,193,197,219,],[36,89,147,209,211,227,]),'atomic_type':([23,47,48,87,88,193,197,219,],[37,37,91,142,37,37,37,37,]),'fun_type':([23,47,88,193,197,219,],[38,38,38,38,38,38,]),'simple_type':([23,47,48,87,88,193,197,219,],[39,39,39,39,39,39,39,39,]),'param_type':([23,47,48,87,88,193,197,219,],[40,40,40,40,40,40,40,40,]),'polymorph_type':([23,27,47,48,87,88,94,193,197,219,],[41,51,41,41,41,41,152,41,41,41,]),'type_in_par':([23,47,48,87,88,193,197,219,],[42,42,42,42,42,42,42,42,]),'fun_type_arg':([23,47,88,193,197,219,],[43,43,43,43,43,43,]),'fun_type_args':([23,47,87,88,193,197,219,],[44,44,144,44,44,44,44,]),'polymorph_types_list':([27,],[50,]),'expr':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[55,126,129,131,132,133,134,135,136,140,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,126,140,191,200,202,207,220,221,202,229,232,238,232,]),'const':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'var':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'if':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,]),'group':([35,71,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[59,124,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,]),'apply':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,]),'match':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,]),'fun':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,]),'bin_op':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,63,]),'un_op':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,]),'list':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,]),'get_el':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,]),'str_const':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,]),'int_const':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,68,]),'float_const':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,69,]),'unit':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,70,]),'apply_fun_expr':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,73,]),'list_expr':([35,72,74,76,77,78,79,80,81,82,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,125,128,141,181,184,190,213,214,216,224,226,235,237,],[83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,83,]),'single_type_to_list':([48,87,],[90,145,]),'expr_comma_list_or_none':([82,128,],[137,183,]),'expr_comma_list':([82,128,],[138,138,]),'right_arg_type':([87,],[143,]),'types_list':([88,],[146,]),'type_constructors':([92,],[150,]),'type_constructor':([92,199,],[151,212,]),'args_list_or_none':([130,],[185,]),'args_list':([130,],[186,]),'types_product_or_none':([149,],[194,]),'types_product_with_eq':([149,],[196,]),'match_branches':([184,],[203,]),'match_branch':([184,216,],[204,225,]),'types_product':([197,],[210,]),'match_branch_body':([214,],[222,]),'match_branch_body_expr_group':([214,],[223,]),'expr_semicolon_list':([224,],[228,]),'fun_body':([226,],[230,]),'fun_body_stmt':([226,237,],[231,239,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> root","S'",1,None,None,None),
+  ('root -> module_header defs_or_none','root',2,'p_root','parser.py',80),
+  ('module_header -> MODULE ID import_or_none open_or_none','module_header',4,'p_module_header','parser.py',91),
+  ('import_or_none -> _empty','import_or_none',1,'p_import_or_none','parser.py',99),
+  ('import_or_none -> import','import_or_none',1,'p_import_or_none','parser.py',100),
+  ('open_or_none -> _empty','open_or_none',1,'p_open_or_none','parser.py',105),
+  ('open_or_none -> open','open_or_none',1,'p_open_or_none','parser.py',106),
+  ('defs_or_none -> defs','defs_or_none',1,'p_defs_or_none','parser.py',111),
+  ('defs_or_none -> _empty_list','defs_or_none',1,'p_defs_or_none','parser.py',112),
+  ('defs -> def','defs',1,'p_defs','parser.py',117),
+  ('defs -> defs def','defs',2,'p_defs','parser.py',118),
+  ('def -> let','def',1,'p_def','parser.py',129),
+  ('def -> type_def','def',1,'p_def','parser.py',130),
+  ('let -> LET ID type_hint_or_none EQ expr','let',5,'p_let','parser.py',135),
+  ('type_hint_or_none -> type_hint','type_hint_or_none',1,'p_type_hint_or_none','parser.py',140),
+  ('type_hint_or_none -> _empty','type_hint_or_none',1,'p_type_hint_or_none','parser.py',141),
+  ('type_hint -> COLON type','type_hint',2,'p_type_hint','parser.py',146),
+  ('type_def -> TYPE ID polymorph_type_params_or_none EQ LBRACE type_constructors RBRACE','type_def',7,'p_type_def','parser.py',151),
+  ('polymorph_type_params_or_none -> polymorph_type_params','polymorph_type_params_or_none',1,'p_polymorph_type_params_or_none','parser.py',156),
+  ('polymorph_type_params_or_none -> _empty_list','polymorph_type_params_or_none',1,'p_polymorph_type_params_or_none','parser.py',157),
+  ('polymorph_type_params -> LANGLE polymorph_types_list RANGLE','polymorph_type_params',3,'p_polymorph_type_params','parser.py',162),
+  ('polymorph_types_list -> polymorph_type','polymorph_types_list',1,'p_polymorph_types_list','parser.py',167),
+  ('polymorph_types_list -> polymorph_types_list COMMA polymorph_type','polymorph_types_list',3,'p_polymorph_types_list','parser.py',168),
+  ('type_constructors -> type_constructor','type_constructors',1,'p_type_constructors','parser.py',173),
+  ('type_constructors -> type_constructors COMMA type_constructor','type_constructors',3,'p_type_constructors','parser.py',174),
+  ('type_constructor -> ID types_product_or_none','type_constructor',2,'p_type_constructor','parser.py',179),
+  ('types_product_or_none -> _empty','types_product_or_none',1,'p_types_product_or_none','parser.py',184),
+  ('types_product_or_none -> types_product_with_eq','types_product_or_none',1,'p_types_product_or_none','parser.py',185),
+  ('types_product_with_eq -> EQ types_product','types_product_with_eq',2,'p_types_product_with_eq','parser.py',190),
+  ('types_product -> type','types_product',1,'p_types_product','parser.py',195),
+  ('types_product -> types_product MUL type','types_product',3,'p_types_product','parser.py',196),
+  ('open -> OPEN modules_list','open',2,'p_open','parser.py',201),
+  ('import -> IMPORT modules_list','import',2,'p_import','parser.py',206),
+  ('modules_list -> str','modules_list',1,'p_modules_list','parser.py',211),
+  ('modules_list -> modules_list COMMA str','modules_list',3,'p_modules_list','parser.py',212),
+  ('type -> atomic_type','type',1,'p_type','parser.py',217),
+  ('type -> fun_type','type',1,'p_type','parser.py',218),
+  ('atomic_type -> simple_type','atomic_type',1,'p_atomic_type','parser.py',223),
+  ('atomic_type -> param_type','atomic_type',1,'p_atomic_type','parser.py',224),
+  ('atomic_type -> polymorph_type','atomic_type',1,'p_atomic_type','parser.py',225),
+  ('atomic_type -> type_in_par','atomic_type',1,'p_atomic_type','parser.py',226),
+  ('simple_type -> ID','simple_type',1,'p_simple_type','parser.py',231),
+  ('param_type -> ID LANGLE types_list RANGLE','param_type',4,'p_param_type','parser.py',236),
+  ('types_list -> type','types_list',1,'p_types_list','parser.py',241),
+  ('types_list -> types_list COMMA type','types_list',3,'p_types_list','parser.py',242),
+  ('fun_type -> fun_type_arg','fun_type',1,'p_fun_type','parser.py',247),
+  ('fun_type -> fun_type_args','fun_type',1,'p_fun_type','parser.py',248),
+  ('fun_type_arg -> ARROW single_type_to_list','fun_type_arg',2,'p_fun_type_arg','parser.py',253),
+  ('single_type_to_list -> atomic_type','single_type_to_list',1,'p_single_type_to_list','parser.py',258),
+  ('fun_type_args -> atomic_type ARROW right_arg_type','fun_type_args',3,'p_fun_type_args','parser.py',263),
+  ('right_arg_type -> fun_type_args','right_arg_type',1,'p_right_arg_type','parser.py',268),
+  ('right_arg_type -> single_type_to_list','right_arg_type',1,'p_right_arg_type','parser.py',269),
+  ('polymorph_type -> POLYMORPH_TYPE','polymorph_type',1,'p_polymorph_type','parser.py',274),
+  ('type_in_par -> LPAR type RPAR','type_in_par',3,'p_type_in_par','parser.py',279),
+  ('expr -> const','expr',1,'p_expr','parser.py',284),
+  ('expr -> var','expr',1,'p_expr','parser.py',285),
+  ('expr -> if','expr',1,'p_expr','parser.py',286),
+  ('expr -> group','expr',1,'p_expr','parser.py',287),
+  ('expr -> apply','expr',1,'p_expr','parser.py',288),
+  ('expr -> match','expr',1,'p_expr','parser.py',289),
+  ('expr -> fun','expr',1,'p_expr','parser.py',290),
+  ('expr -> bin_op','expr',1,'p_expr','parser.py',291),
+  ('expr -> un_op','expr',1,'p_expr','parser.py',292),
+  ('expr -> list','expr',1,'p_expr','parser.py',293),
+  ('expr -> get_el','expr',1,'p_expr','parser.py',294),
+  ('bin_op -> expr PUT expr','bin_op',3,'p_binop','parser.py',299),
+  ('bin_op -> expr EQ expr','bin_op',3,'p_binop','parser.py',300),
+  ('bin_op -> expr LANGLE expr','bin_op',3,'p_binop','parser.py',301),
+  ('bin_op -> expr RANGLE expr','bin_op',3,'p_binop','parser.py',302),
+  ('bin_op -> expr LESS_FLOAT expr','bin_op',3,'p_binop','parser.py',303),
+  ('bin_op -> expr BIGGER_FLOAT expr','bin_op',3,'p_binop','parser.py',304),
+  ('bin_op -> expr NEQ expr','bin_op',3,'p_binop','parser.py',305),
+  ('bin_op -> expr BEQ expr','bin_op',3,'p_binop','parser.py',306),
+  ('bin_op -> expr LEQ expr','bin_op',3,'p_binop','parser.py',307),
+  ('bin_op -> expr BEQ_FLOAT expr','bin_op',3,'p_binop','parser.py',308),
+  ('bin_op -> expr LEQ_FLOAT expr','bin_op',3,'p_binop','parser.py',309),
+  ('bin_op -> expr FLOAT_PLUS expr','bin_op',3,'p_binop','parser.py',310),
+  ('bin_op -> expr FLOAT_MINUS expr','bin_op',3,'p_binop','parser.py',311),
+  ('bin_op -> expr FLOAT_MUL expr','bin_op',3,'p_binop','parser.py',312),
+  ('bin_op -> expr FLOAT_DIV expr','bin_op',3,'p_binop','parser.py',313),
+  ('bin_op -> expr PLUS expr','bin_op',3,'p_binop','parser.py',314),
+  ('bin_op -> expr MINUS expr','bin_op',3,'p_binop','parser.py',315),
+  ('bin_op -> expr MUL expr','bin_op',3,'p_binop','parser.py',316),
+  ('bin_op -> expr DIV expr','bin_op',3,'p_binop','parser.py',317),
+  ('bin_op -> expr MOD expr','bin_op',3,'p_binop','parser.py',318),
+  ('bin_op -> expr CONS expr','bin_op',3,'p_binop','parser.py',319),
+  ('bin_op -> expr CONCAT expr','bin_op',3,'p_binop','parser.py',320),
+  ('bin_op -> expr OR expr','bin_op',3,'p_binop','parser.py',321),
+  ('bin_op -> expr AND expr','bin_op',3,'p_binop','parser.py',322),
+  ('bin_op -> expr BOR expr','bin_op',3,'p_binop','parser.py',323),
+  ('bin_op -> expr BAND expr','bin_op',3,'p_binop','parser.py',324),
+  ('bin_op -> expr LSHIFT expr','bin_op',3,'p_binop','parser.py',325),
+  ('bin_op -> expr RSHIFT expr','bin_op',3,'p_binop','parser.py',326),
+  ('un_op -> NOT expr','un_op',2,'p_un_op','parser.py',331),
+  ('un_op -> MINUS expr','un_op',2,'p_un_op','parser.py',332),
+  ('un_op -> FLOAT_MINUS expr','un_op',2,'p_un_op','parser.py',333),
+  ('un_op -> BNOT expr','un_op',2,'p_un_op','parser.py',334),
+  ('un_op -> NEW expr','un_op',2,'p_un_op','parser.py',335),
+  ('un_op -> GETVAL expr','un_op',2,'p_un_op','parser.py',336),
+  ('list -> LBRACK expr_comma_list_or_none RBRACK','list',3,'p_list','parser.py',341),
+  ('get_el -> list_expr LBRACK expr RBRACK','get_el',4,'p_get_el','parser.py',347),
+  ('list_expr -> group','list_expr',1,'p_list_expr','parser.py',352),
+  ('list_expr -> apply','list_expr',1,'p_list_expr','parser.py',353),
+  ('list_expr -> get_el','list_expr',1,'p_list_expr','parser.py',354),
+  ('list_expr -> var','list_expr',1,'p_list_expr','parser.py',355),
+  ('list_expr -> list','list_expr',1,'p_list_expr','parser.py',356),
+  ('group -> LPAR expr RPAR','group',3,'p_group','parser.py',361),
+  ('var -> ID','var',1,'p_var','parser.py',366),
+  ('if -> IF group THEN expr ELSE expr','if',6,'p_if','parser.py',371),
+  ('apply -> apply_fun_expr LPAR expr_comma_list_or_none RPAR','apply',4,'p_apply','parser.py',376),
+  ('match -> MATCH expr LBRACE match_branches RBRACE','match',5,'p_match','parser.py',381),
+  ('match_branches -> match_branch','match_branches',1,'p_match_branches','parser.py',386),
+  ('match_branches -> match_branches COMMA match_branch','match_branches',3,'p_match_branches','parser.py',387),
+  ('match_branch -> expr ARROW match_branch_body','match_branch',3,'p_match_branch','parser.py',392),
+  ('match_branch_body -> expr','match_branch_body',1,'p_match_branch_body','parser.py',401),
+  ('match_branch_body -> match_branch_body_expr_group','match_branch_body',1,'p_match_branch_body','parser.py',402),
+  ('match_branch_body_expr_group -> LBRACE expr_semicolon_list RBRACE','match_branch_body_expr_group',3,'p_match_branch_body_expr_group','parser.py',407),
+  ('expr_semicolon_list -> expr','expr_semicolon_list',1,'p_expr_semicolon_list','parser.py',412),
+  ('expr_semicolon_list -> expr_semicolon_list SEMICOLON expr','expr_semicolon_list',3,'p_expr_semicolon_list','parser.py',413),
+  ('apply_fun_expr -> group','apply_fun_expr',1,'p_apply_fun_expr','parser.py',418),
+  ('apply_fun_expr -> apply','apply_fun_expr',1,'p_apply_fun_expr','parser.py',419),
+  ('apply_fun_expr -> var','apply_fun_expr',1,'p_apply_fun_expr','parser.py',420),
+  ('expr_comma_list_or_none -> expr_comma_list','expr_comma_list_or_none',1,'p_expr_comma_list_or_none','parser.py',425),
+  ('expr_comma_list_or_none -> _empty_list','expr_comma_list_or_none',1,'p_expr_comma_list_or_none','parser.py',426),
+  ('expr_comma_list -> expr','expr_comma_list',1,'p_expr_comma_list','parser.py',431),
+  ('expr_comma_list -> expr_comma_list COMMA expr','expr_comma_list',3,'p_expr_comma_list','parser.py',432),
+  ('fun -> FUN LPAR args_list_or_none RPAR ARROW LBRACE fun_body RBRACE','fun',8,'p_fun','parser.py',437),
+  ('args_list_or_none -> args_list','args_list_or_none',1,'p_args_list_or_none','parser.py',443),
+  ('args_list_or_none -> _empty_list','args_list_or_none',1,'p_args_list_or_none','parser.py',444),
+  ('args_list -> ID','args_list',1,'p_args_list','parser.py',449),
+  ('args_list -> args_list COMMA ID','args_list',3,'p_args_list','parser.py',450),
+  ('fun_body -> fun_body_stmt','fun_body',1,'p_fun_body','parser.py',455),
+  ('fun_body -> fun_body SEMICOLON fun_body_stmt','fun_body',3,'p_fun_body','parser.py',456),
+  ('fun_body_stmt -> expr','fun_body_stmt',1,'p_fun_body_stmt','parser.py',461),
+  ('fun_body_stmt -> let','fun_body_stmt',1,'p_fun_body_stmt','parser.py',462),
+  ('_empty -> <empty>','_empty',0,'p__empty','parser.py',467),
+  ('_empty_list -> <empty>','_empty_list',0,'p__empty_list','parser.py',472),
+  ('const -> str_const','const',1,'p_const','parser.py',477),
+  ('const -> int_const','const',1,'p_const','parser.py',478),
+  ('const -> float_const','const',1,'p_const','parser.py',479),
+  ('const -> unit','const',1,'p_const','parser.py',480),
+  ('str_const -> str','str_const',1,'p_str_const','parser.py',485),
+  ('int_const -> INT','int_const',1,'p_int_const','parser.py',491),
+  ('float_const -> FLOAT','float_const',1,'p_float_const','parser.py',497),
+  ('unit -> LPAR RPAR','unit',2,'p_unit','parser.py',503),
+  ('str -> STR','str',1,'p_str','parser.py',509),
+]
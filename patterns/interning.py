@@ -0,0 +1,34 @@
+from threading import Lock
+from weakref import WeakValueDictionary
+
+
+class Interned(type):
+    """
+    Метакласс для неизменяемых объектов (hash-consing): объекты с одинаковым ключом intern_key(...) создаются один раз,
+    а при повторном создании возвращается уже существующий объект. Если intern_key(...) возвращает None, то объект
+    создается как обычно.
+
+    Поиск и добавление объекта в таблицу выполняются под блокировкой класса, поэтому и при компиляции в разных потоках
+    объекту с данным ключом соответствует ровно один объект: на этом основано сравнение замкнутых типов по identity.
+    """
+
+    def __init__(cls, name, bases, dic):
+        super().__init__(name, bases, dic)
+        cls._interned = WeakValueDictionary()
+        cls._interned_lock = Lock()
+
+    def __call__(cls, *args, **kwargs):
+        key = cls.intern_key(*args, **kwargs)
+        if key is None:
+            return super().__call__(*args, **kwargs)
+
+        instance = cls._interned.get(key)
+        if instance is None:
+            with cls._interned_lock:
+                # Объект мог быть создан в другом потоке, пока блокировка была занята.
+                instance = cls._interned.get(key)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    cls._interned[key] = instance
+
+        return instance
@@ -1,13 +1,117 @@
-import inflection
+import re
+from types import GeneratorType
+from typing import Callable, Dict
+
+
+def visit_method_name(class_name: str) -> str:
+    """ Имя метода обхода узлов класса: visit_ и имя класса в snake_case (например, visit_type_constructor). """
+    name = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1_\2', class_name)
+    name = re.sub(r'([a-z\d])([A-Z])', r'\1_\2', name)
+
+    return 'visit_' + name.replace('-', '_').lower()
 
 
 class Visitor:
+    """
+    Обходчик узлов. Узел класса C обрабатывается методом visit_c, а если его нет — методом visit_default. Метод ищется
+    один раз для каждой пары (класс обходчика, класс узла) и сохраняется в таблице методов класса обходчика.
+    """
+
+    # Таблица методов обхода: класс узла -> функция. У каждого подкласса своя таблица.
+    visit_methods: Dict[type, Callable] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.visit_methods = {}
+
     def visit(self, node, *args, **kwargs):
-        name = 'visit_' + inflection.underscore(node.__class__.__name__)
-        if not hasattr(self, name):
-            return self.visit_default(node, *args, **kwargs)
+        try:
+            method = self.visit_methods[node.__class__]
+        except KeyError:
+            method = self.find_visit_method(node.__class__)
+
+        return method(self, node, *args, **kwargs)
 
-        return getattr(self, name)(node, *args, **kwargs)
+    @classmethod
+    def find_visit_method(cls, node_class: type) -> Callable:
+        method = getattr(cls, visit_method_name(node_class.__name__), cls.visit_default)
+        cls.visit_methods[node_class] = method
+
+        return method
 
     def visit_default(self, node, *args, **kwargs):
         raise NotImplementedError('No visit method found for \'%s\'.' % node.__class__.__name__)
+
+
+class Visit:
+    """ Запрос обхода дочернего узла из метода обхода StackVisitor: results = yield Visit(node, ...). """
+
+    __slots__ = ('node', 'args', 'kwargs')
+
+    def __init__(self, node, *args, **kwargs):
+        self.node = node
+        self.args = args
+        self.kwargs = kwargs
+
+
+class StackVisitor(Visitor):
+    """
+    Обходчик без рекурсии: глубина обхода ограничена только памятью, а не стеком Python.
+
+    Метод обхода может быть обычной функцией или генератором. Чтобы обойти дочерний узел, генератор выдает
+    yield Visit(child, ...) и получает результат обхода дочернего узла как значение выражения yield (исключение при
+    обходе дочернего узла возбуждается в месте yield). Оставшаяся часть генератора — продолжение, которое выполняется
+    после обхода дочернего узла, а значение return генератора — результат обхода узла. Незавершенные генераторы хранятся
+    в явном стеке, поэтому вложенность узлов не увеличивает глубину рекурсии.
+
+    Вызов self.visit внутри метода обхода начинает отдельный обход, поэтому дочерние узлы нужно обходить через Visit.
+    """
+
+    def begin_visit(self, node, *args, **kwargs):
+        """ Начало обхода узла: результат метода обхода (значение или генератор). """
+        try:
+            method = self.visit_methods[node.__class__]
+        except KeyError:
+            method = self.find_visit_method(node.__class__)
+
+        return method(self, node, *args, **kwargs)
+
+    def visit(self, node, *args, **kwargs):
+        result = self.begin_visit(node, *args, **kwargs)
+        if not isinstance(result, GeneratorType):
+            return result
+
+        stack = [result]
+        result = None
+        error = None
+
+        while stack:
+            try:
+                if error is None:
+                    request = stack[-1].send(result)
+                else:
+                    thrown, error = error, None
+                    request = stack[-1].throw(thrown)
+            except StopIteration as e:
+                stack.pop()
+                result = e.value
+                continue
+            except Exception as e:
+                stack.pop()
+                if not stack:
+                    raise
+
+                error = e
+                continue
+
+            try:
+                result = self.begin_visit(request.node, *request.args, **request.kwargs)
+            except Exception as e:
+                error = e
+                continue
+
+            if isinstance(result, GeneratorType):
+                stack.append(result)
+                result = None
+
+        return result
@@ -1,13 +1,40 @@
+from threading import Lock
+from typing import List
+
+
 class Position:
+    """
+    Позиция в исходном коде (номер строки). Узлы АСД и семантического дерева хранят только номер строки, а объект
+    Position берется из общей таблицы строк (Position.of) при обращении к позиции узла, поэтому позиции не изменяются
+    после создания.
+    """
+
+    __slots__ = ('line',)
+
+    # Общая таблица позиций: lines[i] — позиция строки i. Дополняется под блокировкой, так как её могут использовать
+    # компиляции в разных потоках.
+    lines: List['Position'] = []
+    lines_lock = Lock()
+
     def __init__(self, line: int):
         self.line = line
 
     def __str__(self) -> str:
         return str(self.line)
 
+    @staticmethod
+    def of(line: int) -> 'Position':
+        """ Позиция строки line из общей таблицы строк. """
+        lines = Position.lines
+        if line >= len(lines):
+            with Position.lines_lock:
+                lines.extend(Position(i) for i in range(len(lines), line + 1))
+
+        return lines[line]
+
     @staticmethod
     def start():
-        return Position(1)
+        return Position.of(1)
 
     @staticmethod
     def from_parser_ctx(p):
@@ -15,8 +42,8 @@ class Position:
 
     @staticmethod
     def from_parser_token(p):
-        return Position(p.lineno)
+        return Position.of(p.lineno)
 
     @staticmethod
     def from_lex_token(t):
-        return Position(t.lineno)
+        return Position.of(t.lineno)
@@ -1,18 +1,20 @@
-import json
 from pathlib import Path
 
 import tml_ast as ast
+from context import CompilationContext
 from errors import CompilationException, Error
 from header_reader import HeaderReader
-from patterns.visitor import Visitor
+from json_reader import read_json
+from patterns.visitor import StackVisitor, Visit
 from position import Position
-from .builtins import t_if, builtin_types, un_ops_types, bin_ops_types
+from .builtins import s_if, builtin_types, un_ops_schemes, bin_ops_schemes
 from .defs import Let, FakeArg, Typedef, TypeConstructor
 from .expressions import *
 from .match_builder import MatchBuilder
 from .module import GlobalModule, Scope, RedefinitionException
 from .typing.ast_type_visitor import AstTypeVisitor
-from .typing.inferer import GlobalTypeInferer, Constraint
+from .typing.incremental import environment_fingerprint, fingerprint
+from .typing.inferer import Constraint, InstanceConstraint, LetConstraint, OperatorConstraint
 from .typing.types import PolymorphType, fun_type, t_int
 
 
@@ -21,10 +23,27 @@ class InvalidUsageException(CompilationException):
         super().__init__(Error(f"неправильно количество аргументов у '{name}'", position))
 
 
-class SemanticVisitor(Visitor):
+class SemanticVisitor(StackVisitor):
+    """ Семантический анализ АСД модуля: строит модуль контекста компиляции и собирает ограничения для вывода типов. """
+
+    def __init__(self, context: CompilationContext):
+        self.context = context
+
     def visit_root(self, n: ast.Root) -> GlobalModule:
-        GlobalModule().name = n.module_name
-        GlobalModule().open_module(builtin_types)
+        self.visit_module_header(n)
+
+        if self.context.type_inferer.cache is not None:
+            self.context.type_inferer.cache.load(environment_fingerprint(n))
+
+        for definition in n.definitions:
+            self.visit_top_level_definition(definition)
+
+        return self.context.module
+
+    def visit_module_header(self, n: ast.Root):
+        """ Имя модуля, импорты и открытые модули (объявления верхнего уровня обходятся отдельно). """
+        self.context.module.name = n.module_name
+        self.context.module.open_module(builtin_types)
 
         if n.imports is not None:
             self.visit(n.imports)
@@ -32,115 +51,117 @@ class SemanticVisitor(Visitor):
         if n.opens is not None:
             self.visit(n.opens)
 
-        for definition in n.definitions:
-            try:
-                self.visit(definition, GlobalModule().top_scope)
-            except CompilationException as e:
-                e.handle()
-
-        return GlobalModule()
+    def visit_top_level_definition(self, n: ast.Definition):
+        try:
+            self.visit(n, self.context.module.top_scope)
+        except CompilationException as e:
+            e.handle(self.context.errors)
 
     def visit_import(self, n: ast.Import):
         for module_path in n.modules:
             with open(Path(module_path).with_suffix('.tmlh'), 'r') as f:
                 json_text = f.read()
 
-            module = HeaderReader().read_module(json.loads(json_text))
+            module = HeaderReader().read_module(read_json(json_text))
 
             if n.do_open_namespace:
-                GlobalModule().open_module(module)
+                self.context.module.open_module(module)
             else:
-                GlobalModule().import_module(module)
+                self.context.module.import_module(module)
 
     def visit_let(self, n: ast.Let, scope: Scope):
-        e = Let(n.name).at(n.position)
-        scope.lets.add(e, e.position)
+        # Ограничения объявлений верхнего уровня собираются отдельно, чтобы выводить их типы в порядке зависимостей.
+        is_top_level = scope is self.context.module.top_scope
 
-        if n.type_hint is not None:
-            e.with_type(AstTypeVisitor(scope).visit(n.type_hint))
+        # Переменные типа, созданные внутри объявления (включая его собственный тип), получают уровень больше уровня
+        # объявления. При обобщении квантифицируются только они.
+        level = PolymorphType.current_level()
+        PolymorphType.enter_level()
+        try:
+            e = Let(n.name, level).at(n.position)
+            scope.lets.add(e, e.position)
 
-        e.lock_rec = True
-        e.value = self.visit(n.expression, scope)
-        e.lock_rec = False
+            if is_top_level:
+                # Отпечаток вычисляется до анализа значения, так как при анализе АСД может изменяться.
+                self.context.type_inferer.begin_definition(
+                    e, fingerprint(n) if self.context.type_inferer.cache is not None else None)
 
-        # e = (let a = x), t(a) = t(x)
-        GlobalTypeInferer().add_constraint(Constraint(
-            e.type_wrapper,
-            e.value.type_wrapper,
-            e
-        ))
+            if n.type_hint is not None:
+                e.with_type(AstTypeVisitor(scope).visit(n.type_hint))
+
+            e.value = yield Visit(n.expression, scope)
+
+            # e = (let a = x), t(a) = t(x). Объявления верхнего уровня обобщаются после вывода всей их компоненты.
+            self.context.type_inferer.add_constraint(LetConstraint(e, do_generalize=not is_top_level))
+        finally:
+            PolymorphType.leave_level()
+
+            if is_top_level:
+                self.context.type_inferer.end_definition()
 
     def visit_literal(self, n: ast.Literal, scope: Scope) -> Literal:
         return Literal(n.value).with_type(AstTypeVisitor(scope).visit(n.type)).at(n.position)
 
     def visit_var(self, n: ast.Var, scope: Scope) -> Var:
         let = scope.lets.find_or_fail(n.name, n.position)
+        self.context.type_inferer.add_dependency(let)
+
+        e = Var(let).at(n.position)
 
-        return Var(let).at(n.position)
+        # t(e) = t(let) или экземпляр схемы типа let, если let обобщен.
+        self.context.type_inferer.add_constraint(InstanceConstraint(let, e.type_wrapper, e))
+
+        return e
 
     def visit_apply(self, n: ast.Apply, scope: Scope):
-        args = [self.visit(arg, scope) for arg in n.args]
+        args = []
+        for arg in n.args:
+            args.append((yield Visit(arg, scope)))
+
         args_t = [arg.type for arg in args]
 
-        e = Apply(self.visit(n.fun, scope), args).at(n.position)
+        e = Apply((yield Visit(n.fun, scope)), args).at(n.position)
 
         # t(f) = [t(a)] -> t(e).
-        GlobalTypeInferer().add_constraint(Constraint(
+        self.context.type_inferer.add_constraint(Constraint(
             e.fun.type_wrapper,
             TypeWrapper(fun_type(args_t, e.type)),
-            e,
-            do_use_local_inferer=e.fun.is_const_fun(),
-            args=args
+            e
         ))
 
         return e
 
     def visit_if(self, n: ast.If, scope: Scope):
-        condition = self.visit(n.condition, scope)
-        then_branch = self.visit(n.then_branch, scope)
-        else_branch = self.visit(n.else_branch, scope)
+        condition = yield Visit(n.condition, scope)
+        then_branch = yield Visit(n.then_branch, scope)
+        else_branch = yield Visit(n.else_branch, scope)
 
         e = If(condition, then_branch, else_branch).at(n.position)
 
         # t(if) = t(cond) -> t(then) -> t(else) -> t(e).
-        GlobalTypeInferer().add_constraint(Constraint(
-            TypeWrapper(t_if),
-            TypeWrapper(fun_type([condition.type, then_branch.type, else_branch.type], e.type)),
-            e,
-            do_use_local_inferer=True
-        ))
+        self.context.type_inferer.add_constraint(OperatorConstraint(s_if, [condition, then_branch, else_branch], e))
 
         return e
 
     def visit_unary_operator(self, n: ast.UnaryOperator, scope: Scope):
-        operand = self.visit(n.operand, scope)
+        operand = yield Visit(n.operand, scope)
 
         e = UnaryOperator(n.operation, operand).at(n.position)
 
         # t(un_op(operation)) = t(a) -> t(e), a - операнд.
-        GlobalTypeInferer().add_constraint(Constraint(
-            TypeWrapper(un_ops_types[e.operation]),
-            TypeWrapper(fun_type([e.operand.type], e.type)),
-            e,
-            do_use_local_inferer=True
-        ))
+        self.context.type_inferer.add_constraint(OperatorConstraint(un_ops_schemes[e.operation], [e.operand], e))
 
         return e
 
     def visit_binary_operator(self, n: ast.BinaryOperator, scope: Scope):
-        left = self.visit(n.left, scope)
-        right = self.visit(n.right, scope)
+        left = yield Visit(n.left, scope)
+        right = yield Visit(n.right, scope)
 
         # TODO: здесь не учитываются операторы списков. Исправить это.
         e = BinaryOperator(n.operation, left, right).at(n.position)
 
         # t(bin_op(operation)) = t(a) -> t(b) -> t(e), a - левый операнд, b - правый.
-        GlobalTypeInferer().add_constraint(Constraint(
-            TypeWrapper(bin_ops_types[e.operation]),
-            TypeWrapper(fun_type([left.type, right.type], e.type)),
-            e,
-            do_use_local_inferer=True
-        ))
+        self.context.type_inferer.add_constraint(OperatorConstraint(bin_ops_schemes[e.operation], [left, right], e))
 
         return e
 
@@ -149,11 +170,11 @@ class SemanticVisitor(Visitor):
 
         for expr in n:
             try:
-                expr = self.visit(expr, scope)
+                expr = yield Visit(expr, scope)
                 if expr is not None:
                     body.append(expr)
             except CompilationException as e:
-                e.handle()
+                e.handle(self.context.errors)
 
         return Group(body).at(n.position)
 
@@ -164,10 +185,13 @@ class SemanticVisitor(Visitor):
             try:
                 fun.add_arg(Arg(arg_name))
             except CompilationException as e:
-                e.handle()
+                e.handle(self.context.errors)
                 fun.args.append(FakeArg())
 
-        fun.body = self.visit(n.body, fun)
+        fun.body = yield Visit(n.body, fun)
+        # Тип функции строится сразу после её тела: тогда типы вложенных функций уже построены, и построение типа
+        # глубоко вложенных функций не требует рекурсии.
+        fun.get_type_wrapper()
 
         return fun
 
@@ -180,13 +204,16 @@ class SemanticVisitor(Visitor):
             # _TODO: тождество t(list_create) = t(l0) -> t(e) = ... = t(l(i-1)) -> t(e), где ln - элемент с индексом
             #  n, i - количество элементов в списке.
             create_list = Apply(Var(scope.lets.find_or_fail('::')).at(n.position),
-                                [self.visit(element), create_list]).at(n.position)
+                                [(yield Visit(element, scope)), create_list]).at(n.position)
 
         return create_list
 
     def visit_get_element_from_list(self, n: ast.GetElementFromList, scope: Scope):
         # _TODO: тождество t(get_element_from_list) = t(l) -> t(e).
-        return GetElementFromList(self.visit(n.list, scope), self.visit(n.index, scope)).at(n.position)
+        lst = yield Visit(n.list, scope)
+        index = yield Visit(n.index, scope)
+
+        return GetElementFromList(lst, index).at(n.position)
 
     def visit_typedef(self, n: ast.Typedef, scope: Scope):
         params = {}
@@ -200,7 +227,7 @@ class SemanticVisitor(Visitor):
         scope.typedefs.add(typedef, n.position)
 
         for constructor in n.constructors:
-            typedef.constructors.append(self.visit(constructor, scope, typedef, params))
+            typedef.constructors.append((yield Visit(constructor, scope, typedef, params)))
 
         return typedef
 
@@ -219,10 +246,11 @@ class SemanticVisitor(Visitor):
         return type_constructor
 
     def visit_match(self, n: ast.Match, scope: Scope):
-        builder = MatchBuilder(n, scope, self)
+        builder = MatchBuilder(n, scope)
 
+        yield from builder.visit_expression()
         builder.process_patterns()
-        builder.visit_branches()
+        yield from builder.visit_branches()
         builder.check_exhaustivity()
 
         return builder.result().at(n.position)
@@ -233,11 +261,12 @@ class SemanticVisitor(Visitor):
             pattern = Arg(n.pattern.name)
             body_scope.lets.add(pattern, n.pattern.position)
 
-            body = self.visit(n.body, body_scope)
+            body = yield Visit(n.body, body_scope)
         elif builder.patterns_are_type_variants:
             if isinstance(n.pattern, ast.Var):
                 constructor = scope.lets.find(n.pattern.name)
-                body = self.visit(n.body, scope)
+                fields = []
+                body = yield Visit(n.body, scope)
             else:
                 constructor = scope.lets.find_or_fail(n.pattern.fun.name, n.pattern.position)
 
@@ -245,34 +274,35 @@ class SemanticVisitor(Visitor):
                     raise InvalidUsageException(constructor.name, n.pattern.position)
 
                 body_scope = ScopeWithParent(scope)
-                for field in n.pattern.args:
-                    body_scope.lets.add(Arg(field.name), n.pattern.position)
+                fields = [Arg(field.name) for field in n.pattern.args]
+                for field in fields:
+                    body_scope.lets.add(field, n.pattern.position)
 
-                body = self.visit(n.body, body_scope)
+                body = yield Visit(n.body, body_scope)
 
             pattern = Literal(constructor.index).with_type(t_int).at(n.position)
 
-            # t(c) = t(m_e)
-            GlobalTypeInferer().add_constraint(Constraint(
-                constructor.type_wrapper,
-                builder.match.expression,
-                pattern,
-                do_use_local_inferer=True
-            ))
+            # t(c) = t(m_e), если у конструктора нет полей, иначе t(c) = [t(f)] -> t(m_e), f - поля образца.
+            if fields:
+                matched_wrapper = TypeWrapper(fun_type([field.type for field in fields], builder.match.expression.type))
+            else:
+                matched_wrapper = builder.match.expression.type_wrapper
+
+            self.context.type_inferer.add_constraint(InstanceConstraint(constructor, matched_wrapper, pattern))
         else:
-            pattern = self.visit(n.pattern, scope)
+            pattern = yield Visit(n.pattern, scope)
 
             # t(p) = t(m_e)
-            GlobalTypeInferer().add_constraint(Constraint(
+            self.context.type_inferer.add_constraint(Constraint(
                 pattern.type_wrapper,
                 builder.match.expression,
                 pattern,
             ))
 
-            body = self.visit(n.body, scope)
+            body = yield Visit(n.body, scope)
 
         # t(m) = t(b_e)
-        GlobalTypeInferer().add_constraint(Constraint(
+        self.context.type_inferer.add_constraint(Constraint(
             body.type_wrapper,
             builder.match.type_wrapper,
             body
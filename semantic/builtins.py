@@ -1,6 +1,7 @@
 from position import Position
 from .defs import Typedef, spec_name, InvalidParamTypeUsageException, ForeignLet
 from .module import Module
+from .typing.scheme import TypeScheme
 from .typing.types import fun_type, t_int, t_float, t_bool, t_a, t_ref_a
 
 
@@ -83,3 +84,8 @@ un_ops_types = {
     '$': fun_type([t_ref_a], t_a),
     'new': fun_type([t_a], t_ref_a)
 }
+
+# Схемы типов операторов компилируются один раз и инстанцируются при каждом использовании оператора.
+s_if = TypeScheme(t_if)
+bin_ops_schemes = {operation: TypeScheme(t) for operation, t in bin_ops_types.items()}
+un_ops_schemes = {operation: TypeScheme(t) for operation, t in un_ops_types.items()}
@@ -1,7 +1,10 @@
+from typing import Optional
+
 from errors import CompilationException, Error
 from position import Position
-from .node import TypedNode
+from .node import TypedNode, TYPED_NODE_SLOTS
 from .typing.inferer import TypeWrapper
+from .typing.scheme import TypeScheme
 from .typing.types import SimpleType, ParameterizedType, fun_type
 
 
@@ -11,23 +14,39 @@ class InvalidParamTypeUsageException(CompilationException):
 
 
 class TypeConstructor(TypedNode):
+    __slots__ = TYPED_NODE_SLOTS + ('name', 'field_types', 'typedef', 'scheme')
+
+    is_generalizable = True
+
     def __init__(self, name: str, field_types: list, typedef):
         super().__init__()
         self.name = name
         self.field_types = field_types
         self.typedef = typedef
+        self.scheme = None
 
     def get_type_wrapper(self):
-        if not self.field_types:
-            t = self.typedef.type
-        else:
-            t = fun_type(self.field_types, self.typedef.type)
+        # Тип конструктора строится один раз, при первом обращении (к этому моменту поля и тип уже известны). Тип
+        # конструктора из заголовка модуля задается через with_type.
+        if self._type_wrapper is None:
+            if not self.field_types:
+                t = self.typedef.type
+            else:
+                t = fun_type(self.field_types, self.typedef.type)
 
-        return TypeWrapper(t)
+            self._type_wrapper = TypeWrapper(t)
+
+        return self._type_wrapper
 
     def is_const_fun(self) -> bool:
         return True
 
+    def get_scheme(self):
+        if self.scheme is None:
+            self.scheme = TypeScheme(self.type)
+
+        return self.scheme
+
     def get_index(self):
         return self.typedef.constructors.index(self)
 
@@ -36,10 +55,12 @@ class TypeConstructor(TypedNode):
 
 
 class Typedef(TypedNode):
-    def __init__(self, name: str, params: list = []):
+    __slots__ = TYPED_NODE_SLOTS + ('name', 'params', 'constructors')
+
+    def __init__(self, name: str, params: Optional[list] = None):
         super().__init__()
         self.name = name
-        self.params = params
+        self.params = [] if params is None else params
         self.constructors = []
 
     def check_params_or_fail(self, params: list, position: Position):
@@ -49,43 +70,84 @@ class Typedef(TypedNode):
             raise InvalidParamTypeUsageException(self.name, position)
 
     def get_type_wrapper(self):
-        if not self.params:
-            return TypeWrapper(SimpleType(self.name))
-        else:
-            return TypeWrapper(ParameterizedType(self.name, self.params))
+        # Тип строится один раз, при первом обращении.
+        if self._type_wrapper is None:
+            if not self.params:
+                self._type_wrapper = TypeWrapper(SimpleType(self.name))
+            else:
+                self._type_wrapper = TypeWrapper(ParameterizedType(self.name, self.params))
+
+        return self._type_wrapper
 
     type_wrapper = property(get_type_wrapper)
 
 
 class BaseLet(TypedNode):
+    __slots__ = TYPED_NODE_SLOTS + ('name', 'scheme')
+
+    # Может ли объявление иметь схему типа.
+    is_generalizable = True
+
     def __init__(self, name: str):
         super().__init__()
         self.name = name
+        # Схема типа обобщенного объявления (None, если объявление еще не обобщено или не может быть обобщено).
+        self.scheme = None
+
+    def get_scheme(self):
+        return self.scheme
 
 
 class Let(BaseLet):
-    def __init__(self, name: str):
+    __slots__ = ('value', 'level', 'lock_rec')
+
+    def __init__(self, name: str, level: int = 0):
         super().__init__(name)
         self.value = None
+        # Уровень, на котором находится объявление. Обобщаются только переменные типа с большим уровнем.
+        self.level = level
+        # Защита от бесконечной рекурсии при проверке значений вида let a = b; let b = a.
         self.lock_rec = False
 
     def is_const_fun(self) -> bool:
-        if self.lock_rec:
-            return True
+        if self.lock_rec or self.value is None:
+            return False
 
-        return self.value.is_const_fun()
+        self.lock_rec = True
+        try:
+            return self.value.is_const_fun()
+        finally:
+            self.lock_rec = False
+
+    def generalize(self):
+        """ Вызывается после вывода типа объявления. Обобщаются только константные функции. """
+        if self.is_const_fun():
+            self.scheme = TypeScheme(self.type, self.level)
 
 
 class ForeignLet(BaseLet):
+    __slots__ = ()
+
     def is_const_fun(self) -> bool:
         return True
 
+    def get_scheme(self):
+        # Тип внешнего объявления уже выведен, поэтому его можно обобщить при первом использовании.
+        if self.scheme is None:
+            self.scheme = TypeScheme(self.type)
+
+        return self.scheme
+
 
 class Arg(BaseLet):
-    pass
+    __slots__ = ()
+
+    is_generalizable = False
 
 
 class FakeArg(Arg):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__('')
 
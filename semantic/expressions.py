@@ -2,16 +2,18 @@ from typing import List, Optional
 
 from .defs import Arg
 from .module import ScopeWithParent
-from .node import TypedNode
+from .node import TypedNode, TYPED_NODE_SLOTS
 from .typing.inferer import TypeWrapper
-from .typing.types import PolymorphType, fun_type
+from .typing.types import fun_type
 
 
 class BaseExpression(TypedNode):
-    pass
+    __slots__ = ()
 
 
 class Group(BaseExpression, list):
+    __slots__ = TYPED_NODE_SLOTS
+
     def __init__(self, body):
         BaseExpression.__init__(self)
         list.__init__(self, body)
@@ -24,7 +26,7 @@ class Group(BaseExpression, list):
 
     def get_type_wrapper(self):
         if not self:
-            return TypeWrapper(PolymorphType())
+            return super().get_type_wrapper()
         else:
             return self[-1].type_wrapper
 
@@ -32,6 +34,8 @@ class Group(BaseExpression, list):
 
 
 class Var(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('let',)
+
     def __init__(self, let):
         super().__init__()
         self.let = let
@@ -39,13 +43,10 @@ class Var(BaseExpression):
     def is_const_fun(self) -> bool:
         return self.let.is_const_fun()
 
-    def get_type_wrapper(self):
-        return self.let.type_wrapper
-
-    type_wrapper = property(get_type_wrapper)
-
 
 class Apply(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('fun', 'args')
+
     def __init__(self, fun, args: list):
         super().__init__()
         self.fun = fun
@@ -53,6 +54,8 @@ class Apply(BaseExpression):
 
 
 class BinaryOperator(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('operation', 'left_operand', 'right_operand')
+
     def __init__(self, operation: str, left_operand, right_operand):
         super().__init__()
         self.operation = operation
@@ -61,6 +64,8 @@ class BinaryOperator(BaseExpression):
 
 
 class UnaryOperator(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('operation', 'operand')
+
     def __init__(self, operation: str, operand):
         super().__init__()
         self.operation = operation
@@ -68,6 +73,8 @@ class UnaryOperator(BaseExpression):
 
 
 class If(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('condition', 'then_branch', 'else_branch')
+
     def __init__(self, condition, then_branch, else_branch):
         super().__init__()
         self.condition = condition
@@ -76,6 +83,8 @@ class If(BaseExpression):
 
 
 class MatchBranch(TypedNode):
+    __slots__ = TYPED_NODE_SLOTS + ('pattern', 'body')
+
     def __init__(self, pattern, body):
         super().__init__()
         self.pattern = pattern
@@ -83,6 +92,8 @@ class MatchBranch(TypedNode):
 
 
 class Match(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('expression', 'branches', 'default_branch')
+
     def __init__(self, expression):
         super().__init__()
         self.expression = expression
@@ -91,11 +102,14 @@ class Match(BaseExpression):
 
 
 class LambdaFun(BaseExpression, ScopeWithParent):
+    __slots__ = TYPED_NODE_SLOTS + ('args', 'body', 'fun_type_wrapper')
+
     def __init__(self, parent_scope):
         BaseExpression.__init__(self)
         ScopeWithParent.__init__(self, parent_scope)
         self.args = []
         self.body = Group([])
+        self.fun_type_wrapper = None
 
     def is_const_fun(self) -> bool:
         return True
@@ -105,18 +119,26 @@ class LambdaFun(BaseExpression, ScopeWithParent):
         self.args.append(arg)
 
     def get_type_wrapper(self):
-        return TypeWrapper(fun_type([arg.type for arg in self.args], self.body.type), True)
+        # Тип функции строится один раз, при первом обращении (к этому моменту тело функции уже построено).
+        if self.fun_type_wrapper is None:
+            self.fun_type_wrapper = TypeWrapper(fun_type([arg.type for arg in self.args], self.body.type))
+
+        return self.fun_type_wrapper
 
     type_wrapper = property(get_type_wrapper)
 
 
 class ListCreate(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('values',)
+
     def __init__(self, values: list):
         super().__init__()
         self.values = values
 
 
 class GetElementFromList(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('list', 'index')
+
     def __init__(self, lst, index):
         super().__init__()
         self.list = lst
@@ -124,12 +146,16 @@ class GetElementFromList(BaseExpression):
 
 
 class Literal(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('value',)
+
     def __init__(self, value):
         super().__init__()
         self.value = value
 
 
 class CreateTuple(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('variant_index', 'values')
+
     def __init__(self, variant_index: int, values: list):
         super().__init__()
         self.variant_index = variant_index
@@ -137,6 +163,8 @@ class CreateTuple(BaseExpression):
 
 
 class GetValueFromTuple(BaseExpression):
+    __slots__ = TYPED_NODE_SLOTS + ('tuple', 'value_index')
+
     def __init__(self, _tuple, value_index: int):
         super().__init__()
         self.tuple = _tuple
@@ -1,17 +1,25 @@
 import tml_ast as ast
+from patterns.visitor import Visit
 from semantic.expressions import Match
 from semantic.module import Scope
 
 
 class MatchBuilder:
-    def __init__(self, ast_match: ast.Match, scope: Scope, visitor):
+    """
+    Построение узла match. Методы visit_expression и visit_branches — части метода обхода SemanticVisitor.visit_match
+    (генераторы, которые обходят дочерние узлы через Visit).
+    """
+
+    def __init__(self, ast_match: ast.Match, scope: Scope):
         self.ast_match = ast_match
         self.scope = scope
-        self.visitor = visitor
-        self.match = Match(visitor.visit(ast_match.expr, scope)).at(ast_match.position)
+        self.match = None
         self.patterns_are_type_variants = False
         self.ast_default_branch = None
 
+    def visit_expression(self):
+        self.match = Match((yield Visit(self.ast_match.expr, self.scope))).at(self.ast_match.position)
+
     def process_patterns(self):
         for branch in self.ast_match.branches:
             pattern = branch.pattern
@@ -29,10 +37,10 @@ class MatchBuilder:
     def visit_branches(self):
         for branch in self.ast_match.branches:
             if branch == self.ast_default_branch:
-                self.match.default_branch = self.visitor.visit(branch, self.scope, self, is_default_branch=True)
+                self.match.default_branch = yield Visit(branch, self.scope, self, is_default_branch=True)
                 continue
 
-            branch = self.visitor.visit(branch, self.scope, self)
+            branch = yield Visit(branch, self.scope, self)
 
             self.match.branches.append(branch)
 
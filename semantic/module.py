@@ -2,7 +2,6 @@ from copy import copy
 from typing import Optional, Dict
 
 from errors import Error, CompilationException
-from patterns.singleton import Singleton
 from position import Position
 from .defs import FakeArg
 
@@ -38,13 +37,16 @@ class DefSearchStrategy:
 class DefSearchStrategyForCurrentModule(DefSearchStrategy):
     """ Стратегия поиска объявления в текущем модуле.  """
 
+    def __init__(self, module: 'GlobalModule'):
+        self.module = module
+
     def find(self, defs: dict, name: str):
         if '.' not in name:
             definition = super().find(defs, name)
             if definition is not None:
                 return definition
 
-            for module in GlobalModule().opened_modules.values():
+            for module in self.module.opened_modules.values():
                 defs = module.top_scope.typedefs if self.is_typedefs else module.top_scope.lets
                 definition = defs.find(name)
 
@@ -56,10 +58,10 @@ class DefSearchStrategyForCurrentModule(DefSearchStrategy):
             splitted_name = name.split('.')
             module_name, def_name = '.'.join(splitted_name[:-1]), splitted_name[-1]
 
-            if module_name not in GlobalModule().included_modules:
+            if module_name not in self.module.included_modules:
                 return None
 
-            module = GlobalModule().included_modules[module_name]
+            module = self.module.included_modules[module_name]
 
             defs = module.top_scope.typedefs if self.is_typedefs else module.top_scope.lets
             return defs.find(def_name)
@@ -71,13 +73,20 @@ class DefSearchStrategyWithParent(DefSearchStrategy):
         self.do_search_in_parent = True
 
     def find(self, defs: dict, name: str):
-        definition = super().find(defs, name)
+        # Поиск по цепочке родительских областей видимости без рекурсии: у глубоко вложенных функций она длинная.
+        strategy = self
 
-        if definition is None and (self.parent_scope is not None) and self.do_search_in_parent:
-            defs = self.parent_scope.typedefs if self.is_typedefs else self.parent_scope.lets
-            definition = defs.find(name)
+        while True:
+            definition = DefSearchStrategy.find(strategy, defs, name)
 
-        return definition
+            if definition is not None or strategy.parent_scope is None or not strategy.do_search_in_parent:
+                return definition
+
+            parent_defs = strategy.parent_scope.typedefs if self.is_typedefs else strategy.parent_scope.lets
+            if not isinstance(parent_defs.search_strategy, DefSearchStrategyWithParent):
+                return parent_defs.find(name)
+
+            strategy, defs = parent_defs.search_strategy, parent_defs.defs
 
 
 class Definitions:
@@ -126,10 +135,12 @@ class Module:
         self.top_scope = Scope()
 
 
-class GlobalModule(Module, metaclass=Singleton):
+class GlobalModule(Module):
+    """ Компилируемый модуль (вместе с импортированными и открытыми в нем модулями). """
+
     def __init__(self, name: Optional[str] = None):
         super().__init__(name)
-        self.top_scope = Scope(DefSearchStrategyForCurrentModule())
+        self.top_scope = Scope(DefSearchStrategyForCurrentModule(self))
         self.included_modules: Dict[str, Module] = {}
         self.opened_modules: Dict[str, Module] = {}
 
@@ -1,27 +1,54 @@
+from typing import Optional
+
 from position import Position
 from .typing.inferer import TypeWrapper
 from .typing.types import Type, PolymorphType
 
+# Слоты узла с типом. Как и в АСД, слоты объявляются в конечных классах: Group наследуется от list, поэтому у общих
+# базовых классов слоты пустые.
+TYPED_NODE_SLOTS = ('line', '_type_wrapper', '_level')
+
 
 class Node:
-    def __init__(self):
-        self.position = None
+    """ Узел семантического дерева. Позиция хранится в виде номера строки (None, если позиция неизвестна). """
+
+    __slots__ = ()
 
     def at(self, position: Position):
-        self.position = position
+        self.line = position.line
         return self
 
+    @property
+    def position(self) -> Optional[Position]:
+        return None if self.line is None else Position.of(self.line)
+
 
 class TypedNode(Node):
+    """
+    Узел с типом. Обертка типа и полиморфный тип создаются только при первом обращении к типу узла (многие узлы
+    получают тип через with_type или берут его у других узлов). Полиморфный тип создается на уровне, на котором был
+    создан узел.
+    """
+
+    __slots__ = ()
+
     def __init__(self):
-        super().__init__()
-        self._type_wrapper = TypeWrapper(PolymorphType())
+        self.line = None
+        self._type_wrapper = None
+        self._level = PolymorphType.current_level()
 
     def with_type(self, t: Type):
-        self._type_wrapper.type = t
+        if self._type_wrapper is None:
+            self._type_wrapper = TypeWrapper(t)
+        else:
+            self._type_wrapper.type = t
+
         return self
 
     def get_type_wrapper(self):
+        if self._type_wrapper is None:
+            self._type_wrapper = TypeWrapper(PolymorphType(self._level))
+
         return self._type_wrapper
 
     def get_type(self):
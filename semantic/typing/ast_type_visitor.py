@@ -1,3 +1,5 @@
+from typing import Optional
+
 from patterns.visitor import Visitor
 import tml_ast as ast
 from semantic.module import NotFoundException, Scope
@@ -5,11 +7,12 @@ from semantic.typing.types import PolymorphType, SimpleType, ParameterizedType
 
 
 class AstTypeVisitor(Visitor):
-    def __init__(self, scope: Scope, accept_pol_types=True, polymorph_params: dict = {},
+    def __init__(self, scope: Scope, accept_pol_types=True, polymorph_params: Optional[dict] = None,
                  fail_if_pol_type_not_found=False):
         self.scope = scope
         self.accept_pol_types = accept_pol_types
-        self.polymorph_params = polymorph_params
+        # Полиморфные типы по именам: у каждого обходчика свои, если они не переданы явно.
+        self.polymorph_params = {} if polymorph_params is None else polymorph_params
         self.fail_if_pol_type_found = fail_if_pol_type_not_found
 
     def visit_polymorph_type(self, n: ast.PolymorphType):
@@ -33,7 +36,24 @@ class AstTypeVisitor(Visitor):
         return SimpleType(n.name)
 
     def visit_parameterized_type(self, n: ast.ParameterizedType):
-        self.scope.typedefs.find_or_fail(n.name, n.position).check_params_or_fail(n.params, n.position)
-
-        type_params = [self.visit(t) for t in n.params]
-        return ParameterizedType(n.name, type_params)
+        # Обход без рекурсии: в стеке находятся еще не построенные типы, а в results — построенные типы параметров.
+        results = []
+        stack = [(n, False)]
+
+        while stack:
+            n, is_built = stack.pop()
+
+            if is_built:
+                start = len(results) - len(n.params)
+                t = ParameterizedType(n.name, results[start:])
+                del results[start:]
+                results.append(t)
+            elif isinstance(n, ast.ParameterizedType):
+                self.scope.typedefs.find_or_fail(n.name, n.position).check_params_or_fail(n.params, n.position)
+
+                stack.append((n, True))
+                stack.extend((p, False) for p in reversed(n.params))
+            else:
+                results.append(self.visit(n))
+
+        return results[0]
@@ -0,0 +1,74 @@
+from typing import Any, Dict, List
+
+
+class DependencyGraph:
+    """ Граф зависимостей между объявлениями верхнего уровня (ребро a -> b означает, что в a используется b). """
+
+    def __init__(self):
+        # Вершины в порядке добавления (то есть в порядке объявления в исходном коде) и их зависимости.
+        self.edges: Dict[Any, Dict[Any, None]] = {}
+
+    def add_node(self, node):
+        self.edges.setdefault(node, {})
+
+    def add_edge(self, node, dependency):
+        self.edges[node][dependency] = None
+
+    def __contains__(self, node) -> bool:
+        return node in self.edges
+
+    def strongly_connected_components(self) -> List[List[Any]]:
+        """
+        Возвращает компоненты сильной связности в топологическом порядке: каждая компонента идет после всех компонент,
+        от которых она зависит. Вершины внутри компоненты и независимые компоненты сохраняют порядок объявления.
+        Алгоритм Тарьяна, реализованный без рекурсии.
+        """
+        position = {node: i for i, node in enumerate(self.edges)}
+        index = {}
+        low_link = {}
+        on_stack = set()
+        stack = []
+        components = []
+
+        for root in self.edges:
+            if root in index:
+                continue
+
+            index[root] = low_link[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            # Стек обхода в глубину: вершина и итератор по её зависимостям.
+            work = [(root, iter(self.edges[root]))]
+
+            while work:
+                node, dependencies = work[-1]
+
+                for dependency in dependencies:
+                    if dependency not in index:
+                        index[dependency] = low_link[dependency] = len(index)
+                        stack.append(dependency)
+                        on_stack.add(dependency)
+                        work.append((dependency, iter(self.edges[dependency])))
+                        break
+                    elif dependency in on_stack:
+                        low_link[node] = min(low_link[node], index[dependency])
+                else:
+                    work.pop()
+
+                    if work:
+                        parent = work[-1][0]
+                        low_link[parent] = min(low_link[parent], low_link[node])
+
+                    if low_link[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.remove(member)
+                            component.append(member)
+
+                            if member is node:
+                                break
+
+                        components.append(sorted(component, key=position.__getitem__))
+
+        return components
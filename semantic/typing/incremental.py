@@ -0,0 +1,166 @@
+from hashlib import sha1
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import tml_ast as ast
+from ast_json_writer import COMPACT_SEPARATORS, AstJsonWriter
+from header_gen import HeaderGenerator
+from header_reader import HeaderReader
+from json_reader import read_json
+from .scheme import TypeScheme
+from .types import PolymorphType, Type
+
+# Версия формата кэша. Должна меняться при любом изменении вывода типов, которое может изменить выведенные типы.
+CACHE_VERSION = 1
+
+
+class HashFile:
+    """ Файл, в который можно только писать: вместо записи текст добавляется к отпечатку. """
+
+    def __init__(self):
+        self.hash = sha1()
+
+    def write(self, text: str):
+        self.hash.update(text.encode())
+
+
+class AstFingerprintWriter(AstJsonWriter):
+    """ JSON АСД без позиций: перемещение объявления в файле не меняет его отпечаток. """
+
+    omitted_fields = AstJsonWriter.omitted_fields + ('line',)
+
+
+def fingerprint(*values) -> str:
+    """
+    Отпечаток значений, представимых в JSON (в том числе узлов АСД). JSON не строится целиком, а по частям добавляется
+    к отпечатку, причем без рекурсии, поэтому глубина вложенности АСД не ограничена.
+    """
+    file = HashFile()
+    AstFingerprintWriter(file).write(list(values))
+
+    return file.hash.hexdigest()
+
+
+def environment_fingerprint(root) -> str:
+    """ Отпечаток окружения модуля: импортируемых модулей (вместе с их заголовками) и объявлений типов. """
+    headers = []
+    for imports in (root.imports, root.opens):
+        if imports is not None:
+            for module_path in imports.modules:
+                with open(Path(module_path).with_suffix('.tmlh'), 'r') as f:
+                    headers.append(f.read())
+
+    typedefs = [definition for definition in root.definitions if isinstance(definition, ast.Typedef)]
+
+    return fingerprint(CACHE_VERSION, root.module_name, root.imports, root.opens, typedefs, headers)
+
+
+def type_to_dict(t: Type) -> dict:
+    """ Каноническое представление типа: полиморфные типы нумеруются в порядке их появления в типе. """
+    generator = HeaderGenerator()
+    dic = generator.visit(t)
+    dic['pols'] = len(generator.polymorph_types)
+
+    return dic
+
+
+def type_from_dict(dic: dict, level: int) -> Type:
+    reader = HeaderReader()
+    reader.polymorph_types = [PolymorphType(level) for _ in range(dic['pols'])]
+
+    return reader.read_type(dic)
+
+
+def is_closed(definition) -> bool:
+    """
+    Является ли тип объявления верхнего уровня замкнутым: все его полиморфные типы квантифицированы схемой. Тип такого
+    объявления не может измениться при выводе типов зависящих от него объявлений.
+    """
+    variables = TypeScheme(definition.type).variables
+    if not variables:
+        return True
+
+    return definition.get_scheme() is not None and all(v.level > definition.level for v in variables)
+
+
+class InferenceCache:
+    """
+    Кэш типов объявлений верхнего уровня для инкрементального вывода типов. Ключом является отпечаток компоненты
+    сильной связности: отпечатки АСД её объявлений и типы объявлений, от которых она зависит. Поэтому компонента
+    выводится заново, только если изменилась она сама или изменился тип одной из её зависимостей.
+
+    Кэшируются только компоненты с замкнутыми типами, зависящие только от объявлений с замкнутыми типами: типы
+    остальных объявлений могут уточняться при выводе типов других объявлений. Весь кэш сбрасывается, если изменилось
+    окружение модуля (импортируемые модули или объявления типов).
+
+    Кэш экономит только решение ограничений: синтаксический и семантический анализ и вычисление отпечатков АСД
+    выполняются для всех объявлений модуля, поэтому время компиляции не пропорционально размеру изменения.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.environment = None
+        self.entries: Dict[str, List[dict]] = {}
+        # Записи, использованные или добавленные при текущей компиляции. Только они сохраняются в файл.
+        self.used_entries: Dict[str, List[dict]] = {}
+        # Объявления верхнего уровня текущего модуля с замкнутыми типами.
+        self.closed_definitions = set()
+
+    def load(self, environment: str):
+        self.environment = environment
+
+        if not Path(self.path).exists():
+            return
+
+        with open(self.path, 'r') as f:
+            dic = read_json(f.read())
+
+        if dic.get('version') == CACHE_VERSION and dic.get('env') == environment:
+            self.entries = dic['entries']
+
+    def save(self):
+        with open(self.path, 'w') as f:
+            AstJsonWriter(f, separators=COMPACT_SEPARATORS).write(
+                {'version': CACHE_VERSION, 'env': self.environment, 'entries': self.used_entries})
+
+    def component_key(self, component: list, fingerprints: dict, dependencies: dict) -> Optional[str]:
+        """ Ключ компоненты или None, если компонента не может быть закэширована. """
+        if any(definition not in fingerprints for definition in component):
+            return None
+
+        external = {}
+        for definition in component:
+            for dependency in dependencies[definition]:
+                if dependency in component:
+                    continue
+
+                if dependency not in self.closed_definitions:
+                    return None
+
+                external[dependency.name] = type_to_dict(dependency.type)
+
+        return fingerprint([fingerprints[definition] for definition in component], sorted(external.items()))
+
+    def get(self, key: str, component: list) -> bool:
+        """ Восстанавливает типы объявлений компоненты из кэша. Возвращает False, если их нет в кэше. """
+        types = self.entries.get(key)
+        if types is None:
+            return False
+
+        self.used_entries[key] = types
+
+        for definition, t in zip(component, types):
+            # Полиморфные типы создаются на уровне выше уровня объявления, чтобы они были квантифицированы при
+            # обобщении.
+            definition.type = type_from_dict(t, definition.level + 1)
+            self.closed_definitions.add(definition)
+
+        return True
+
+    def put(self, key: str, component: list):
+        """ Сохраняет выведенные (и уже обобщенные) типы объявлений компоненты, если они замкнуты. """
+        if not all(is_closed(definition) for definition in component):
+            return
+
+        self.closed_definitions.update(component)
+        self.used_entries[key] = [type_to_dict(definition.type) for definition in component]
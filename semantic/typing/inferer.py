@@ -1,231 +1,215 @@
-from itertools import zip_longest
-from typing import List
+from typing import Dict, Any
 
 from errors import CompilationException, Error
-from patterns.singleton import Singleton
 from position import Position
-from semantic.typing.global_to_local import GlobalToLocalTypeVisitor
+from semantic.typing.dependency_graph import DependencyGraph
 from semantic.typing.polym_type_name_setter import PolymorphTypeNameSetter
-from semantic.typing.types import is_polymorph_t, is_param_t
+from semantic.typing.types import PolymorphType, Mismatch, unify, unify_pairs, fun_type, is_polymorph_t
 
 
 class TypesNotCompatibleException(CompilationException):
-    def __init__(self, t1, t2, position: Position):
-        super().__init__(Error(f'тип {t1} несовместим с типом {t2}', position))
+    def __init__(self, t1, t2, position: Position, mismatch: Mismatch = None):
+        message = f'тип {t1} несовместим с типом {t2}'
+        if mismatch is not None and (mismatch.t1, mismatch.t2) != (t1.find(), t2.find()):
+            message += f' (несовместимы {mismatch.t1} и {mismatch.t2})'
+
+        super().__init__(Error(message, position))
 
 
 class TypeWrapper:
-    def __init__(self, t, do_replace_globals_with_locals=False):
-        self.type = t
-        self.do_replace_globals_with_locals = do_replace_globals_with_locals
+    __slots__ = ('_type',)
+
+    def __init__(self, t):
+        self._type = t
 
-        GlobalTypeInferer().type_wrappers.append(self)
+    def get_type(self):
+        # Тип читается по требованию: переменная типа заменяется на представителя своего класса эквивалентности.
+        self._type = self._type.find()
+        return self._type
 
-    def replace_type(self, original, new):
-        self.type.replace_type(original, new)
+    def set_type(self, t):
+        self._type = t
 
-        if self.type == original:
-            self.type = new
+    type = property(get_type, set_type)
 
 
 class TypeInferer:
     def __init__(self):
         self.constraints = []
-        self.type_wrappers: List[TypeWrapper] = []
+        # Количество ограничений, удаленных при упрощении системы уравнений.
+        self.removed_constraints_count = 0
+        # Количество решенных ограничений.
+        self.solved_constraints_count = 0
 
     def infer(self):
-        for constraint in self.constraints:
-            if is_param_t(constraint.left) and is_param_t(constraint.right) and \
-                    not constraint.is_converted_to_simple_constraints:
-                # Иногда при создании ограничения один или оба типа являются полиморфными, но когда вывод доходит до
-                # них, то они могут состоять из двух параметрических типов, в таком случая необходимо создать новое
-                # ограничение на основе данного и обработать именно новое.
-                constraint = self.recreate_constraint(constraint)
+        self.removed_constraints_count += self.simplify()
+        self.solved_constraints_count += len(self.constraints)
 
+        for constraint in self.constraints:
             constraint.unify()
 
-    def recreate_constraint(self, constraint):
+    def simplify(self) -> int:
         """
-        Возвращает новое ограничения на основе данного (причину см. в infer() и Constraint.__init__()).
+        Упрощает систему уравнений перед её решением и возвращает количество удаленных ограничений. Удаляются тождества
+        вида t = t и повторы уже встречавшихся ограничений (например, t(p) = t(m_e) для каждого образца-литерала типа
+        int), а ограничения между двумя свободными переменными сразу решаются объединением их классов эквивалентности.
         """
-        # TODO: см. комментарий к Constraint.__init__.
-        return Constraint(constraint.left_wrapper,
-                          constraint.right_wrapper,
-                          constraint.expression,
-                          constraint.do_use_local_inferer,
-                          constraint.local_inferer,
-                          constraint.not_part_of_global,
-                          is_first_local_constraint=True,
-                          args=constraint.args,
-                          replace_right_globals=constraint.replace_right_globals)
-
-    def replace_type(self, original, new):
-        if original == new:
-            return
-
-        for wrapper in self.type_wrappers:
-            wrapper.replace_type(original, new)
+        seen = set()
+        constraints = []
+
+        for constraint in self.constraints:
+            key = constraint.get_simplification_key()
+
+            if key is not None:
+                left, right = key
+
+                if left is right or key in seen:
+                    continue
+
+                if is_polymorph_t(left) and is_polymorph_t(right):
+                    left.bind(right)
+                    continue
+
+                seen.add(key)
+                seen.add((right, left))
+
+            constraints.append(constraint)
+
+        removed_count = len(self.constraints) - len(constraints)
+        self.constraints[:] = constraints
+
+        return removed_count
 
     def add_constraint(self, constraint):
         self.constraints.append(constraint)
 
-        # self.type_wrappers.append(constraint.left_wrapper)
-        # self.type_wrappers.append(constraint.right_wrapper)
-
     def dump(self) -> str:
         ns = PolymorphTypeNameSetter()
         return '\n'.join([constraint.dump(ns) for constraint in self.constraints])
 
 
-class GlobalTypeInferer(TypeInferer, metaclass=Singleton):
-    """ Синглтон, глобальный вывод типов. """
+class GlobalTypeInferer(TypeInferer):
+    """
+    Вывод типов компилируемого модуля. Ограничения собираются отдельно для каждого объявления верхнего уровня, а вывод
+    проводится по компонентам сильной связности графа зависимостей между ними в топологическом порядке.
+    """
 
     def __init__(self):
         super().__init__()
+        # Ограничения, не относящиеся ни к одному объявлению верхнего уровня.
+        self.module_constraints = self.constraints
+        # Ограничения каждого объявления верхнего уровня (в порядке объявления).
+        self.definitions_constraints: Dict[Any, list] = {}
+        self.dependencies = DependencyGraph()
+        self.current_definition = None
+        # Кэш для инкрементального вывода типов (InferenceCache) и отпечатки АСД объявлений верхнего уровня.
+        self.cache = None
+        self.fingerprints: Dict[Any, str] = {}
+        # Количество объявлений, типы которых были взяты из кэша.
+        self.reused_definitions_count = 0
+
+    def begin_definition(self, definition, fingerprint: str = None):
+        """ Начинает сбор ограничений объявления верхнего уровня. """
+        self.dependencies.add_node(definition)
+        self.constraints = self.definitions_constraints[definition] = []
+        self.current_definition = definition
+
+        if fingerprint is not None:
+            self.fingerprints[definition] = fingerprint
+
+    def end_definition(self):
+        self.constraints = self.module_constraints
+        self.current_definition = None
+
+    def add_dependency(self, definition):
+        """ Отмечает, что текущее объявление верхнего уровня использует definition. """
+        if self.current_definition is not None and definition in self.dependencies:
+            self.dependencies.add_edge(self.current_definition, definition)
+
+    def infer(self):
+        super().infer()
+        self.module_constraints.clear()
 
-    def replace(self, original, new):
-        super().replace_type(original, new)
+        for component in self.dependencies.strongly_connected_components():
+            self.constraints = []
+            for definition in component:
+                self.constraints += self.definitions_constraints.pop(definition)
 
-        # Замена типа в локальных выводах типов.
-        for constraint in self.constraints:
-            if constraint.do_use_local_inferer:
-                constraint.local_inferer.replace_type(original, new, do_not_replace_in_global=True)
+            key = None
+            if self.cache is not None:
+                key = self.cache.component_key(component, self.fingerprints, self.dependencies.edges)
 
+            if key is not None and self.cache.get(key, component):
+                # Типы компоненты не изменились: её ограничения не решаются.
+                self.reused_definitions_count += len(component)
+                self.finish_component(component)
+                continue
 
-class LocalTypeInferer(TypeInferer):
-    """ Локальный вывод типов. """
+            super().infer()
+            self.finish_component(component)
 
-    def __init__(self, first_local_constraint):
-        super().__init__()
-        self.first_local_constraint = first_local_constraint
+            if key is not None:
+                self.cache.put(key, component)
 
-    def global_to_locals(self):
-        visitor = GlobalToLocalTypeVisitor()
+        self.dependencies = DependencyGraph()
+        self.fingerprints = {}
+        self.constraints = self.module_constraints
 
-        for constraint in self.constraints:
-            # TODO: без not_part_of_global все тесты проходятся успешно. Возможно что-то без этого работать не будет.
-            #   Попробовать найти такой случай, добавить его в тесты и раскомментировать эти строки, иначе убрать из
-            #   Constraint.
-
-            # if constraint.not_part_of_global:
-            #     continue
-
-            constraint.left = visitor.visit(constraint.left)
-
-            if constraint.replace_right_globals:
-                constraint.right = visitor.visit(constraint.right)
-
-    def recreate_constraint(self, constraint):
-        # Отличие от TypeInferer.recreate_constraint() в том, что здесь ограничение всегда не являются первыми
-        # локальными, а типы всегда сохранены в локальном выводе.
-        return Constraint(constraint.left_wrapper,
-                          constraint.right_wrapper,
-                          constraint.expression,
-                          constraint.do_use_local_inferer,
-                          constraint.local_inferer,
-                          constraint.not_part_of_global,
-                          is_first_local_constraint=False,
-                          args=constraint.args,
-                          replace_right_globals=constraint.replace_right_globals)
+    def finish_component(self, component: list):
+        """
+        Вызывается после вывода типов компоненты: её объявления обобщаются, а ограничения больше не нужны и
+        освобождаются.
+        """
+        for definition in component:
+            definition.generalize()
 
-    def infer(self):
-        self.global_to_locals()
-        super().infer()
+        self.constraints = []
 
-    def replace_type(self, original, new, do_not_replace_in_global=False):
-        super().replace_type(original, new)
+    def dump(self) -> str:
+        ns = PolymorphTypeNameSetter()
+        constraints = self.module_constraints + [c for cs in self.definitions_constraints.values() for c in cs]
 
-        if not do_not_replace_in_global:
-            GlobalTypeInferer().replace_type(original, new)
+        return '\n'.join([constraint.dump(ns) for constraint in constraints])
 
 
 class Constraint:
     """ Ограничение, тождество типов. """
 
-    def __init__(self, left_wrapper: TypeWrapper, right_wrapper: TypeWrapper, expression,
-                 do_use_local_inferer=False, local_inferer=None, not_part_of_global=False,
-                 is_first_local_constraint=False, args=[], replace_right_globals=False):
-        # TODO: конструктор имеет слишком большое количество аргументов. Один из вариантов решения: использовать паттерн
-        #  "строитель".
-        self.not_part_of_global = not_part_of_global
+    __slots__ = ('expression', 'left_wrapper', 'right_wrapper')
 
-        self.expression = expression
+    # Является ли левый тип экземпляром схемы типа.
+    is_instance = False
 
-        self.do_use_local_inferer = do_use_local_inferer
-        self.local_inferer = local_inferer
+    def __init__(self, left_wrapper: TypeWrapper, right_wrapper: TypeWrapper, expression):
+        self.expression = expression
 
         self.left_wrapper = left_wrapper
         self.right_wrapper = right_wrapper
 
-        self.is_first_local_constraint = is_first_local_constraint
-        self.args = args
-        self.replace_right_globals = replace_right_globals
-
-        # Определение текущего вывода типов.
-        if self.do_use_local_inferer:
-            if self.local_inferer is None:
-                # Это тождество параметрических типов, необходимо создать новый локальные вывод типов.
-                # Оно также является первым локальным.
-                self.is_first_local_constraint = True
-                self.local_inferer = LocalTypeInferer(self)
-
-            self.cur_inferer = self.local_inferer
-        else:
-            self.cur_inferer = GlobalTypeInferer()
-
-        self.is_converted_to_simple_constraints = False
-        self.param_to_simple_constraints()
+    def get_left_to_unify(self):
+        """ Возвращает тип, который будет унифицирован с правым. """
+        return self.left
 
-    def param_to_simple_constraints(self):
+    def get_simplification_key(self):
         """
-        Преобразует тождество из двух параметрических типов в тождества каждых соответствующих типов параметров.
+        Возвращает пару типов, по которой ограничение сравнивается с другими при упрощении системы уравнений, или
+        None, если ограничение нельзя удалять.
         """
-        if is_param_t(self.left) and is_param_t(self.right):
-            # Если оба типа являются параметрическими, то добавить в текущий вывод типов тождества каждых
-            # соответствующих типов-параметров.
-            for p_left, p_right, arg in zip_longest(self.left.params, self.right.params, self.args):
-                if arg is not None:
-                    replace_right_globals = arg.is_const_fun()
-                else:
-                    replace_right_globals = self.replace_right_globals
+        return self.left, self.right
 
-                constraint = Constraint(TypeWrapper(p_left), TypeWrapper(p_right), self.expression,
-                                        do_use_local_inferer=self.do_use_local_inferer, local_inferer=self.cur_inferer,
-                                        not_part_of_global=not self.is_first_local_constraint,
-                                        replace_right_globals=replace_right_globals)
+    def unify(self):
+        left, right = self.get_left_to_unify(), self.right
 
-                self.cur_inferer.constraints.append(constraint)
+        mismatch = unify(left, right)
+        if mismatch is not None:
+            self.fail(left, right, mismatch)
 
-            self.is_converted_to_simple_constraints = True
+    def fail(self, left, right, mismatch: Mismatch):
+        name_setter = PolymorphTypeNameSetter()
+        name_setter.visit(left)
+        name_setter.visit(right)
 
-    def unify(self):
-        if not self.left.is_compatible(self.right):
-            name_setter = PolymorphTypeNameSetter()
-            name_setter.visit(self.left)
-            name_setter.visit(self.right)
-
-            raise TypesNotCompatibleException(self.left, self.right, self.expression.position)
-
-        if self.do_use_local_inferer and self.is_first_local_constraint:
-            # Это первое тождество с локальным выводом типов, значит необходимо провести этот вывод.
-            # Может сложиться такая ситуация, что is_first_local_constraint == True, а текущий вывод типов является
-            # глобальным, поэтому необходимо также проверить на то, используется ли именно локальный вывод типов,
-            # иначе в некоторых случаях будет бесконечная рекурсия (например: let f = fun(f) -> {f(f(x))}).
-            self.cur_inferer.infer()
-        elif not (is_param_t(self.left) and is_param_t(self.right)):
-            original, new = self.get_original_and_new()
-            self.cur_inferer.replace_type(original, new)
-
-    def get_original_and_new(self):
-        """ Возвращает кортеж из двух типов, первый из которых будет заменен на второй """
-        # Этот метод будет вызван только в случае если оба типа полиморфны или один полиморфный, а другой - простой или
-        # параметрический.
-        if is_polymorph_t(self.left):
-            # Если левый является полиморфным, то он будет заменен первым.
-            return self.left, self.right
-        else:
-            # Иначе полиморфным является правый или они оба полиморфны и порядок замены не имеет значения.
-            return self.right, self.left
+        raise TypesNotCompatibleException(left, right, self.expression.position, mismatch)
 
     def get_left(self):
         return self.left_wrapper.type
@@ -240,18 +224,110 @@ class Constraint:
         return self.right_wrapper.type
 
     def dump(self, ns: PolymorphTypeNameSetter) -> str:
-        ns.visit(self.left)
-        ns.visit(self.right)
+        # Типы читаются один раз: левый тип ограничения оператора — каждый раз новый экземпляр схемы.
+        left, right = self.left, self.right
+        ns.visit(left)
+        ns.visit(right)
 
         expr = self.expression.__class__.__name__
 
         if hasattr(self.expression, 'name'):
             expr += f" '{self.expression.name}'"
+        elif hasattr(self.expression, 'let'):
+            expr += f" '{self.expression.let.name}'"
         elif hasattr(self.expression, 'fun') and hasattr(self.expression.fun, 'let'):
             expr += f" '{self.expression.fun.let.name}'"
 
-        return f'line {self.expression.position} {"*" if self.do_use_local_inferer else ""} {expr}\n\t{self.left} =' \
-            f'{self.right} '
+        return f'line {self.expression.position} {"*" if self.is_instance else ""} {expr}\n\t{left} =' \
+            f'{right} '
 
     left = property(get_left, set_left)
     right = property(get_right, set_right)
+
+
+class InstanceConstraint(Constraint):
+    """
+    Ограничение t(d) = t(e), где e — выражение, ссылающееся на объявление d (let, внешнее объявление или конструктор
+    типа). Если объявление уже обобщено, то с t(e) унифицируется новый экземпляр его схемы типа, иначе сам тип t(d).
+    """
+
+    __slots__ = ('declaration', 'level')
+
+    is_instance = True
+
+    def __init__(self, declaration, right_wrapper: TypeWrapper, expression):
+        super().__init__(declaration.type_wrapper, right_wrapper, expression)
+        self.declaration = declaration
+        # Уровень, на котором находится выражение. На нем создаются переменные экземпляра схемы.
+        self.level = PolymorphType.current_level()
+
+    def get_simplification_key(self):
+        # Если объявление может быть обобщено, то левый тип ограничения — новый экземпляр схемы. Иначе (например, для
+        # аргументов функций) это обычное тождество типов.
+        if self.declaration.is_generalizable:
+            return None
+
+        return super().get_simplification_key()
+
+    def get_left_to_unify(self):
+        scheme = self.declaration.get_scheme()
+        if scheme is None:
+            return self.left
+
+        return scheme.instantiate(self.level)
+
+
+class LetConstraint(Constraint):
+    """ Ограничение t(a) = t(x) объявления let a = x. После его решения вложенное объявление обобщается. """
+
+    __slots__ = ('do_generalize',)
+
+    def __init__(self, let, do_generalize: bool):
+        super().__init__(let.type_wrapper, let.value.type_wrapper, let)
+        self.do_generalize = do_generalize
+
+    def get_simplification_key(self):
+        # После решения ограничения объявление обобщается, поэтому его нельзя удалять.
+        return None
+
+    def unify(self):
+        super().unify()
+
+        if self.do_generalize:
+            self.expression.generalize()
+
+
+class OperatorConstraint(Constraint):
+    """
+    Ограничение t(op) = [t(a)] -> t(e) встроенного оператора op (или if), a - операнды. Типы операндов и результата
+    унифицируются напрямую с параметрами экземпляра схемы типа оператора, без построения функционального типа. Схема
+    мономорфного оператора не содержит переменных, поэтому её экземпляр — это сам тип оператора.
+    """
+
+    __slots__ = ('scheme', 'operands', 'level')
+
+    def __init__(self, scheme, operands: list, expression):
+        super().__init__(None, None, expression)
+        self.scheme = scheme
+        self.operands = operands
+        self.level = PolymorphType.current_level()
+
+    def get_simplification_key(self):
+        return None
+
+    def unify(self):
+        left = self.get_left()
+        types = [operand.type for operand in self.operands] + [self.expression.type]
+
+        mismatch = unify_pairs(zip(left.params, types))
+        if mismatch is not None:
+            self.fail(left, fun_type(types), mismatch)
+
+    def get_left(self):
+        return self.scheme.instantiate(self.level)
+
+    def get_right(self):
+        return fun_type([operand.type for operand in self.operands], self.expression.type)
+
+    left = property(get_left)
+    right = property(get_right)
@@ -1,13 +1,16 @@
 from patterns.visitor import Visitor
-from semantic.typing.types import PolymorphType, ParameterizedType, SimpleType
+from semantic.typing.types import PolymorphType, ParameterizedType, SimpleType, is_param_t
 
 
 class PolymorphTypeNameSetter(Visitor):
     def __init__(self):
-        self.already_visited = []
+        self.already_visited = set()
         # Счетчик полиморфных типов. Нужен для того, чтобы каждому полиморфному типу было дано уникальное имя.
         self.polymorph_types_counter = 0
 
+    def visit(self, n, *args, **kwargs):
+        return super().visit(n.find(), *args, **kwargs)
+
     def visit_simple_type(self, n: SimpleType):
         pass
 
@@ -20,10 +23,19 @@ class PolymorphTypeNameSetter(Visitor):
         else:
             n.name = f'`t{self.polymorph_types_counter}'
 
-        self.already_visited.append(n)
+        self.already_visited.add(n)
 
         self.polymorph_types_counter += 1
 
     def visit_parameterized_type(self, n: ParameterizedType):
-        for p in n.params:
-            self.visit(p)
+        # Обход без рекурсии. Параметры кладутся в стек в обратном порядке, чтобы имена давались слева направо.
+        stack = [n]
+
+        while stack:
+            t = stack.pop().find()
+
+            if is_param_t(t):
+                if not t.is_ground:
+                    stack.extend(reversed(t.params))
+            else:
+                self.visit(t)
@@ -0,0 +1,86 @@
+from typing import List, Optional
+
+from .types import Type, BaseType, PolymorphType, ParameterizedType, fold_type
+
+
+class TypeScheme:
+    """
+    Схема типа: тип, в котором квантифицированы свободные полиморфные типы с уровнем больше level (если level равен
+    None, то квантифицируются все свободные полиморфные типы). Остальные полиморфные типы связаны с внешними
+    объявлениями и остаются общими для всех экземпляров.
+
+    При создании схемы тип один раз компилируется в шаблон: квантифицированные переменные заменяются их номерами в
+    векторе подстановки, а замкнутые подтипы сохраняются как есть (они интернированы и общие для всех экземпляров).
+    Поэтому для инстанцирования не нужен обход типа посетителем: достаточно вектора подстановки и копии тех частей
+    шаблона, которые содержат квантифицированные переменные.
+    """
+
+    def __init__(self, t: Type, level: Optional[int] = None):
+        self.level = level
+        # Квантифицированные переменные в порядке их появления в типе.
+        self.variables: List[PolymorphType] = []
+        self.template = self.compile(t, {})
+
+    def compile(self, t: Type, indices: dict):
+        """
+        Шаблон типа: тип без квантифицированных переменных (общий для всех экземпляров), номер квантифицированной
+        переменной или пара из имени параметрического типа и шаблонов его параметров.
+        """
+        def compile_leaf(t: Type):
+            if t.is_ground or (self.level is not None and t.level <= self.level):
+                return t
+
+            if t not in indices:
+                indices[t] = len(self.variables)
+                self.variables.append(t)
+
+            return indices[t]
+
+        def compile_param(t: Type, params: list):
+            if all(isinstance(p, BaseType) for p in params):
+                return t
+
+            return t.name, params
+
+        return fold_type(t, compile_leaf, compile_param, lambda t: t.is_ground)
+
+    def instantiate(self, level: Optional[int] = None) -> Type:
+        """
+        Возвращает новый экземпляр схемы, в котором квантифицированные переменные заменены новыми переменными уровня
+        level (по умолчанию — текущего уровня).
+        """
+        if not self.variables:
+            # Схема без квантифицированных переменных всегда дает один и тот же тип.
+            return self.template
+
+        # Вектор подстановки. Новые переменные создаются только при первом обращении к ним.
+        return self.build(self.template, [None] * len(self.variables), level)
+
+    def build(self, template, substitution: list, level: Optional[int] = None) -> Type:
+        # Шаблон обходится без рекурсии: в стеке находятся еще не построенные шаблоны, а в results — построенные
+        # типы параметров.
+        results = []
+        stack = [(template, False)]
+
+        while stack:
+            template, is_built = stack.pop()
+
+            if is_built:
+                name, params = template
+                start = len(results) - len(params)
+                t = ParameterizedType(name, results[start:])
+                del results[start:]
+                results.append(t)
+            elif isinstance(template, int):
+                t = substitution[template]
+                if t is None:
+                    t = substitution[template] = PolymorphType(level)
+
+                results.append(t)
+            elif isinstance(template, tuple):
+                stack.append((template, True))
+                stack.extend((p, False) for p in reversed(template[1]))
+            else:
+                results.append(template)
+
+        return results[0]
@@ -1,77 +1,261 @@
-from typing import List, Union, NewType, Any, Optional
+from threading import local
+from typing import List, Union, NewType, Any, Optional, Dict
+
+from patterns.interning import Interned
 
 Type = Union[NewType('SimpleType', Any), NewType('PolymorphType', Any), NewType('ParameterizedType', Any)]
 
 
 class BaseType:
+    # Является ли тип замкнутым (не содержащим полиморфных типов). Замкнутые типы интернируются, поэтому равные замкнутые
+    # типы — это один и тот же объект.
+    is_ground = False
+
     def __init__(self, name: Optional[str]):
         self.name = name
 
     def is_compatible(self, t2: Type) -> bool:
         return False
 
-    def replace_type(self, old_t: Type, new_t: Type):
-        pass
+    def find(self) -> Type:
+        """ Возвращает тип, которым представлен этот тип после унификации (для неполиморфных типов — сам тип). """
+        return self
+
+    def limit_level(self, level: int, var=None) -> bool:
+        """
+        Понижает до level уровни всех свободных полиморфных типов, входящих в этот тип. Заодно проверяет вхождение:
+        возвращает False, если в тип входит полиморфный тип var.
+        """
+        return True
 
     def __str__(self) -> str:
         return self.name
 
 
-class SimpleType(BaseType):
+class SimpleType(BaseType, metaclass=Interned):
+    is_ground = True
+
+    @staticmethod
+    def intern_key(name: str):
+        return name
+
     def is_compatible(self, t2: Type) -> bool:
-        return is_polymorph_t(t2) or (is_simple_t(t2) and t2.name == self.name)
+        t2 = t2.find()
+        return t2 is self or is_polymorph_t(t2)
+
+    def __reduce__(self):
+        return SimpleType, (self.name,)
+
+
+class Levels(local):
+    current = 0
 
 
 class PolymorphType(BaseType):
-    def __init__(self):
+    """
+    Полиморфный тип (переменная типа). Переменные типов объединяются в классы эквивалентности с помощью системы
+    непересекающихся множеств: instance указывает на тип, с которым переменная была унифицирована, а find() возвращает
+    представителя класса (со сжатием путей). Объединение двух переменных выполняется по рангу.
+
+    Каждая переменная имеет уровень — глубину вложенности let-объявлений, в которой она была создана. При унификации
+    уровни переменных понижаются до уровня переменной, с которой они унифицируются, поэтому после вывода типа
+    let-объявления на уровне n обобщаются (квантифицируются) только переменные с уровнем больше n: остальные связаны с
+    внешними объявлениями.
+    """
+
+    # Уровень, на котором сейчас создаются новые полиморфные типы (levels.current). Хранится отдельно в каждом потоке,
+    # чтобы модули можно было компилировать в параллельных потоках.
+    levels = Levels()
+
+    def __init__(self, level: Optional[int] = None):
         super().__init__(None)
+        self.instance: Optional[Type] = None
+        self.rank = 0
+        self.level = PolymorphType.levels.current if level is None else level
+
+    @staticmethod
+    def current_level() -> int:
+        return PolymorphType.levels.current
+
+    @staticmethod
+    def enter_level():
+        PolymorphType.levels.current += 1
+
+    @staticmethod
+    def leave_level():
+        PolymorphType.levels.current -= 1
 
     def is_compatible(self, t2: Type) -> bool:
+        t = self.find()
+        if t is not self:
+            return t.is_compatible(t2)
+
+        return True
+
+    def find(self) -> Type:
+        root = self
+        while is_polymorph_t(root) and root.instance is not None:
+            root = root.instance
+
+        # Сжатие путей: все переменные цепочки начинают указывать сразу на представителя.
+        t = self
+        while t is not root:
+            t.instance, t = root, t.instance
+
+        return root
+
+    def bind(self, t: Type) -> bool:
+        """
+        Унифицирует эту (свободную) переменную с типом t. Возвращает False, если t содержит эту переменную (иначе
+        получился бы бесконечный тип).
+        """
+        t = t.find()
+        if t is self:
+            return True
+
+        if not is_polymorph_t(t):
+            if not t.limit_level(self.level, self):
+                return False
+
+            self.instance = t
+            return True
+
+        level = min(self.level, t.level)
+
+        if self.rank < t.rank:
+            self.instance = t
+            t.level = level
+        elif self.rank > t.rank:
+            t.instance = self
+            self.level = level
+        else:
+            self.instance = t
+            t.rank += 1
+            t.level = level
+
         return True
 
+    def limit_level(self, level: int, var=None) -> bool:
+        t = self.find()
+        if t is not self:
+            return t.limit_level(level, var)
+
+        if self is var:
+            return False
+
+        if self.level > level:
+            self.level = level
+
+        return True
+
+    def __str__(self) -> str:
+        t = self.find()
+        if t is not self:
+            return str(t)
+
+        return self.name
+
 
-class ParameterizedType(BaseType):
+class ParameterizedType(BaseType, metaclass=Interned):
     def __init__(self, name: str, params: List[Type]):
         super().__init__(name)
         self.params = params
+        self.is_ground = all(p.is_ground for p in params)
+
+    @staticmethod
+    def intern_key(name: str, params: List[Type]):
+        # Интернируются только замкнутые типы: их параметры уже интернированы, поэтому их можно сравнивать по
+        # идентичности.
+        if all(p.is_ground for p in params):
+            return name, tuple(params)
+
+        return None
 
     def is_compatible(self, t2: Type) -> bool:
-        if is_polymorph_t(t2):
-            return True
+        # Обход пар соответствующих подтипов с явным стеком, чтобы глубина вложенности типов не была ограничена
+        # глубиной рекурсии.
+        stack = [(self, t2)]
 
-        if (not is_param_t(t2)) or len(t2.params) != len(self.params) or t2.name != self.name:
-            return False
+        while stack:
+            t1, t2 = stack.pop()
+            t1, t2 = t1.find(), t2.find()
+
+            if t1 is t2 or is_polymorph_t(t1) or is_polymorph_t(t2):
+                continue
 
-        for p1, p2 in zip(self.params, t2.params):
-            if not p1.is_compatible(p2):
+            if t1.is_ground and t2.is_ground:
+                # Равные замкнутые типы являются одним объектом.
                 return False
 
+            if not (is_param_t(t1) and is_param_t(t2)) or len(t1.params) != len(t2.params) or t1.name != t2.name:
+                return False
+
+            stack.extend(zip(t1.params, t2.params))
+
         return True
 
-    def replace_type(self, old_t: Type, new_t: Type):
-        for p in self.params:
-            p.replace_type(old_t, new_t)
+    def limit_level(self, level: int, var=None) -> bool:
+        stack = [self]
+
+        while stack:
+            t = stack.pop().find()
 
-        self.params = [new_t if p == old_t else p for p in self.params]
+            if t.is_ground:
+                continue
+
+            if is_param_t(t):
+                stack.extend(t.params)
+            elif t is var:
+                return False
+            elif t.level > level:
+                t.level = level
+
+        return True
 
     def __str__(self) -> str:
-        params_str = []
+        # Строка собирается по частям без рекурсии: в стеке находятся еще не выведенные типы и готовые части строки.
+        parts = []
+        stack = [self]
+
+        while stack:
+            t = stack.pop()
+            if isinstance(t, str):
+                parts.append(t)
+                continue
+
+            t = t.find()
+            if not is_param_t(t):
+                parts.append(str(t))
+                continue
+
+            items = []
+
+            if is_fun_t(t):
+                if len(t.params) == 1:
+                    items.append('-> ')
 
-        for p in self.params:
-            if is_fun_t(p) and is_fun_t(self):
-                p_str = f'({str(p)})'
+                for i, p in enumerate(t.params):
+                    if i != 0:
+                        items.append(' -> ')
+
+                    items += ['(', p, ')'] if is_fun_t(p.find()) else [p]
             else:
-                p_str = str(p)
+                items.append(f'{t.name}<')
+
+                for i, p in enumerate(t.params):
+                    if i != 0:
+                        items.append(', ')
+
+                    items.append(p)
 
-            params_str.append(str(p_str))
+                items.append('>')
 
-        if is_fun_t(self):
-            if len(params_str) == 1:
-                return f'-> {params_str[0]}'
+            stack.extend(reversed(items))
 
-            return ' -> '.join(params_str)
+        return ''.join(parts)
 
-        return f'{self.name}<{", ".join(params_str)}>'
+    def __reduce__(self):
+        return ParameterizedType, (self.name, self.params)
 
 
 def is_simple_t(t: Type) -> bool:
@@ -90,6 +274,130 @@ def is_fun_t(t: Type) -> bool:
     return isinstance(t, ParameterizedType) and t.name == 'fun'
 
 
+class Mismatch:
+    """ Результат неудачной унификации: пара несовместимых подтипов. """
+
+    __slots__ = ('t1', 't2')
+
+    def __init__(self, t1: Type, t2: Type):
+        self.t1 = t1
+        self.t2 = t2
+
+
+def unify(t1: Type, t2: Type) -> Optional[Mismatch]:
+    """ Унифицирует два типа. Возвращает None или пару несовместимых подтипов. """
+    t1, t2 = t1.find(), t2.find()
+
+    # Частый случай: одна из сторон — свободная переменная, и она связывается сразу, без обхода.
+    if isinstance(t1, PolymorphType) or isinstance(t2, PolymorphType):
+        var, t = (t1, t2) if isinstance(t1, PolymorphType) else (t2, t1)
+        return None if var.bind(t) else Mismatch(t1, t2)
+
+    return unify_pairs([(t1, t2)])
+
+
+def unify_pairs(pairs) -> Optional[Mismatch]:
+    """
+    Унифицирует типы в каждой паре за один обход без рекурсии: совместимость проверяется одновременно с разбором
+    параметрических типов на параметры и связыванием переменных. Возвращает None или пару несовместимых подтипов.
+
+    Связывания переменных сначала накапливаются и применяются только после успешного обхода, поэтому при ошибке типы
+    остаются такими, какими были до унификации. Бесконечные типы обнаруживаются при добавлении связывания с учетом уже
+    накопленных связываний, поэтому связывания никогда не образуют цикл.
+    """
+    # Накопленные связывания. Ключами могут быть только свободные переменные.
+    bindings: Dict[PolymorphType, Type] = {}
+
+    # Пары подтипов, которые еще нужно унифицировать. Параметры кладутся в обратном порядке, чтобы унифицироваться
+    # слева направо.
+    stack = list(pairs)
+    stack.reverse()
+
+    while stack:
+        t1, t2 = stack.pop()
+
+        t1 = t1.find()
+        while t1 in bindings:
+            t1 = bindings[t1].find()
+
+        t2 = t2.find()
+        while t2 in bindings:
+            t2 = bindings[t2].find()
+
+        if t1 is t2:
+            continue
+
+        if isinstance(t1, PolymorphType) or isinstance(t2, PolymorphType):
+            var, t = (t1, t2) if isinstance(t1, PolymorphType) else (t2, t1)
+            if occurs(var, t, bindings):
+                return Mismatch(var, t)
+
+            bindings[var] = t
+        elif (t1.is_ground and t2.is_ground) or not (is_param_t(t1) and is_param_t(t2)) or t1.name != t2.name or \
+                len(t1.params) != len(t2.params):
+            # Равные замкнутые типы являются одним объектом, поэтому разные замкнутые типы несовместимы.
+            return Mismatch(t1, t2)
+        else:
+            params1, params2 = t1.params, t2.params
+            for i in range(len(params1) - 1, -1, -1):
+                stack.append((params1[i], params2[i]))
+
+    for var, t in bindings.items():
+        if not var.find().bind(t):
+            return Mismatch(var, t)
+
+    return None
+
+
+def occurs(var: PolymorphType, t: Type, bindings: Dict[PolymorphType, Type]) -> bool:
+    """ Входит ли свободная переменная var в тип t, если применить к нему накопленные связывания bindings. """
+    stack = [t]
+
+    while stack:
+        t = stack.pop().find()
+        while t in bindings:
+            t = bindings[t].find()
+
+        if t is var:
+            return True
+
+        if is_param_t(t) and not t.is_ground:
+            stack.extend(t.params)
+
+    return False
+
+
+def fold_type(t: Type, leaf, param, is_leaf=lambda t: False):
+    """
+    Свертка типа без рекурсии. Для параметрических типов вызывается param(t, results), где results — результаты
+    свертки параметров, а для остальных типов (и для типов, для которых is_leaf(t) истинно) — leaf(t). Перед сверткой
+    каждый подтип заменяется на своего представителя (find()).
+    """
+    results = []
+    # Стек обхода: тип и признак того, что его параметры уже свернуты.
+    stack = [(t, False)]
+
+    while stack:
+        t, is_folded = stack.pop()
+
+        if is_folded:
+            start = len(results) - len(t.params)
+            params = results[start:]
+            del results[start:]
+            results.append(param(t, params))
+            continue
+
+        t = t.find()
+
+        if is_param_t(t) and not is_leaf(t):
+            stack.append((t, True))
+            stack.extend((p, False) for p in reversed(t.params))
+        else:
+            results.append(leaf(t))
+
+    return results[0]
+
+
 def fun_type(args: List[Type], ret: Optional[Type] = None) -> ParameterizedType:
     params = [*args]
 
@@ -3,30 +3,31 @@ import unittest
 from typing import Dict
 
 from args import Args
+from context import CompilationContext
 from header_gen import HeaderGenerator
 from header_reader import HeaderReader
+from json_reader import read_json_iteratively
 from main import parse_source_code
-from semantic.module import GlobalModule
 from os import remove as remove_file
 
-from semantic.typing.inferer import GlobalTypeInferer
-from semantic.typing.types import fun_type, t_int, t_bool, t_a, t_b, t_c
+from semantic.typing.types import PolymorphType, fun_type, t_int, t_bool, t_a, t_b, t_c
 from tests.helpers import assert_let_types
 
 
 class TestHeader(unittest.TestCase):
 
     def setUp(self) -> None:
-        Args().__init__()
-        Args().skip_code_generation = True
+        self.args = Args()
+        self.args.skip_code_generation = True
 
-        self.reset_module()
+    def compile(self, code: str) -> CompilationContext:
+        context = CompilationContext(self.args)
+        parse_source_code(context, code)
 
-    def reset_module(self):
-        GlobalModule().__init__()
+        return context
 
     def test_header_to_json_and_back(self):
-        Args().skip_header_generation = True
+        self.args.skip_header_generation = True
 
         code = '''  module test
         
@@ -49,16 +50,14 @@ class TestHeader(unittest.TestCase):
                     let bar = fun(a, b) -> { foo(a, b) != 0 }
                     let baz = fun(f, x, y) -> { f(x) = y }'''
 
-        parse_source_code(code)
-        dic = HeaderGenerator().visit(GlobalModule())
+        context = self.compile(code)
+        dic = HeaderGenerator().visit(context.module)
         module2 = HeaderReader().read_module(dic)
         dic2 = HeaderGenerator().visit(module2)
 
         self.assertEqual(json.dumps(dic), json.dumps(dic2))
 
     def test_header_inclusion(self):
-        self.reset_module()
-
         a_code = '''module a
         
                     type a<`a, `b> = {
@@ -90,24 +89,46 @@ class TestHeader(unittest.TestCase):
                     let test2 = baz
                     let test3 = a.bar'''
 
-        Args().source = 'a.tml'
-        parse_source_code(a_code)
-        self.reset_module()
+        self.args.source = 'a.tml'
+        self.compile(a_code)
 
-        Args().source = 'b.tml'
-        parse_source_code(b_code)
-        self.reset_module()
+        self.args.source = 'b.tml'
+        self.compile(b_code)
 
-        Args().source = 'c.tml'
-        Args().skip_header_generation = True
-        parse_source_code(c_code)
+        self.args.source = 'c.tml'
+        self.args.skip_header_generation = True
+        context = self.compile(c_code)
 
-        assert_let_types(self, {
+        assert_let_types(self, context.module, {
             'test1': fun_type([t_int, t_bool, t_bool], t_bool),
             'test2': fun_type([fun_type([t_a], t_b), fun_type([t_c], t_a), t_c], t_b),
             'test3': fun_type([t_int, t_int], t_bool)
         })
 
+    def test_deep_header(self):
+        # Заголовок с типом глубоко вложенных функций записывается и читается без рекурсии.
+        depth = 3000
+        body = ' '.join(f'fun(x{i}) -> {{' for i in range(depth)) + ' x0' + ' }' * depth
+
+        self.args.source = 'deep.tml'
+        self.assertTrue(self.compile(f'module deep let f = {body}').errors.is_ok())
+        self.addCleanup(remove_file, 'deep.tmlh')
+
+        self.args.source = 'b.tml'
+        self.args.skip_header_generation = True
+        context = self.compile('module b import "deep" let g = deep.f')
+
+        a = PolymorphType()
+        t = a
+        for _ in range(depth - 1):
+            t = fun_type([PolymorphType()], t)
+
+        self.assertTrue(context.errors.is_ok())
+        assert_let_types(self, context.module, {'g': fun_type([a], t)})
+
+        text = '{"a": [1, -2.5e3, "ы\\n", true, null, {}, []], "b": {"c": [[{"d": false}]]}}'
+        self.assertEqual(json.loads(text), read_json_iteratively(text))
+
 
 if __name__ == '__main__':
     unittest.main()
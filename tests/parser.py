@@ -0,0 +1,304 @@
+import gc
+import importlib
+import io
+import json
+import os
+import pickle
+import sys
+import unittest
+import zlib
+from mmap import mmap, ACCESS_READ
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from ply import yacc
+
+import parsing.parser
+import tml_ast
+from ast_json_writer import COMPACT_SEPARATORS, AstJsonWriter
+from ast_to_dict_visitor import AstToDictVisitor
+from context import CompilationContext
+from parsing.ast_cache import AstCache
+from parsing.incremental import IncrementalParser, TextEdit
+from parsing.lexer import get_lexer
+from parsing.master_lexer import ERROR_CONTEXT_SIZE, MasterLexer
+from parsing.parser import TABLES_MODULE, DefinitionsStream, parse
+
+
+class TestParser(unittest.TestCase):
+
+    def test_tables_are_up_to_date(self):
+        # Таблицы загружаются без проверки грамматики, поэтому после её изменения их нужно сгенерировать заново:
+        # python -m parsing.parser
+        module = sys.modules[parsing.parser.__name__]
+        grammar = yacc.ParserReflect(dict((k, getattr(module, k)) for k in dir(module)))
+        grammar.get_all()
+
+        self.assertEqual(grammar.signature(), yacc.LRTable().read_table(TABLES_MODULE))
+
+        # Номера строк правил в таблицах (они выводятся в отладочной информации) тоже должны совпадать.
+        lines = [(name, line) for def_line, _, name, doc in grammar.pfuncs
+                 for _, line, _, _ in yacc.parse_grammar(doc, 'parser.py', def_line)]
+        tables = importlib.import_module(TABLES_MODULE)
+        self.assertEqual(lines, [(func, line) for _, _, _, func, _, line in tables._lr_productions[1:]])
+
+    def test_no_files_written(self):
+        directory = Path(parsing.parser.__file__).parent
+        files = set(directory.iterdir())
+
+        root = parse('module test\nlet x = 1\nlet y = x')
+
+        self.assertEqual(['x', 'y'], [let.name for let in root.definitions])
+        self.assertEqual(3, root.definitions[1].position.line)
+        self.assertEqual(files, set(directory.iterdir()))
+
+    def test_master_lexer(self):
+        code = '''module test # комментарий
+            let f1 = fun(x, y) -> { x >=. 1.5 && .5 <=. 2. || !(y ~> 3 != 0) }
+            type t<`a> = { A = `a * ref<int>, B }
+            let s = "a\\nb" ^ "c
+            d" @ 1
+            let f2 = if_x :: [] ; r := $r ~| 1 ~& 2 ~< 3 % 4 -. 1 *. 2 /. 3 +. 4 >. 1 <. 2
+            '''
+
+        self.assertEqual(self.tokens(get_lexer().clone(), code), self.tokens(MasterLexer(), code))
+
+    @staticmethod
+    def tokens(lexer, code: str) -> list:
+        lexer.errors = CompilationContext().errors
+        lexer.input(code)
+
+        tokens = [(t.type, t.value, t.lineno, t.lexpos, lexer.lineno) for t in iter(lexer.token, None)]
+        errors = [str(error) for error in lexer.errors.list]
+
+        return [tokens, errors]
+
+    def test_lists(self):
+        root = parse('''module test
+            let f = fun(a, b, c) -> { let x = [a, b, c]; f(c, b, a); x }
+            let g = match 1 { 1 -> { 2; 3 }, 4 -> 5 }
+            type t<`a, `b> = { A = `a * `b * int, B }
+            ''')
+
+        f, g, t = root.definitions
+        self.assertEqual(['a', 'b', 'c'], f.expression.args)
+        self.assertEqual(['Let', 'Apply', 'Var'], [type(e).__name__ for e in f.expression.body])
+        self.assertEqual(['a', 'b', 'c'], [e.name for e in f.expression.body[0].expression.values])
+        self.assertEqual(['c', 'b', 'a'], [e.name for e in f.expression.body[1].args])
+        self.assertEqual([[2, 3], [5]], [[e.value for e in b.body] for b in g.expression.branches])
+        self.assertEqual(['`a', '`b'], [p.name for p in t.params])
+        self.assertEqual([3, None], [c.types and len(c.types) for c in t.constructors])
+
+        lets_count = 20000
+        root = parse('module test\n' + ''.join(f'let x{i} = {i}\n' for i in range(lets_count)))
+        self.assertEqual([f'x{i}' for i in range(lets_count)], [let.name for let in root.definitions])
+
+    def test_stream(self):
+        events = []
+
+        def on_definition(definition):
+            # АСД уже обработанных объявлений должно освобождаться до разбора следующего объявления.
+            alive = [o for o in gc.get_objects() if isinstance(o, (tml_ast.Let, tml_ast.Typedef))]
+            self.assertEqual([definition], alive)
+            events.append(definition.name)
+
+        stream = DefinitionsStream(lambda root: events.append(root.module_name), on_definition)
+        root = parse('module test\nlet x = 1\ntype t = { A, B }\nlet y = fun(a) -> { [a, x] }', stream=stream)
+
+        self.assertEqual(['test', 'x', 't', 'y'], events)
+        self.assertEqual([], root.definitions)
+
+    def test_bytes_source(self):
+        code = '''module test
+            let s = "строка" ^ "ы" # комментарий ы
+            let xы = 1 + @ 2
+            let y = x«z
+            '''
+
+        def without_lexpos(result: list) -> list:
+            tokens, errors = result
+            return [[token[:3] + token[4:] for token in tokens], errors]
+
+        # Смещения лексем в байтах отличаются от смещений в строке, остальное должно совпадать. В сообщении об ошибке
+        # при разборе байтов выводится только начало исходного кода после ошибки.
+        tokens, errors = without_lexpos(self.tokens(MasterLexer(), code))
+        bytes_tokens, bytes_errors = without_lexpos(self.tokens(MasterLexer(), code.encode()))
+        self.assertEqual(tokens, bytes_tokens)
+        self.assertEqual(len(errors), len(bytes_errors))
+        for error, bytes_error in zip(errors, bytes_errors):
+            context = bytes_error.split("'", 1)[1][:-2]
+            self.assertTrue(error.startswith(bytes_error[:-2]))
+            self.assertLessEqual(len(context.encode()), ERROR_CONTEXT_SIZE)
+
+        # Некорректный UTF-8 — лексическая ошибка.
+        _, errors = self.tokens(MasterLexer(), b'module test\nlet x = \xff\xfe 1')
+        self.assertEqual(2, len(errors))
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'test.tml'
+            path.write_text('module test\nlet s = "строка"\nlet f = fun(x) -> { [x, 1] }')
+
+            with open(path, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as source:
+                root = parse(source)
+                self.assertEqual('строка', root.definitions[0].expression.value)
+                self.assertEqual(3, root.definitions[1].position.line)
+
+    def test_spans(self):
+        code = 'module test\nlet x = 1 # комментарий\n\ntype t = { A }\nlet y = fun(a) -> { let z = a; z }'
+        root = parse(code)
+
+        self.assertEqual(['let x = 1 # комментарий\n\n', 'type t = { A }\n', 'let y = fun(a) -> { let z = a; z }'],
+                         [code[start:end] for start, end in root.spans])
+
+    def test_incremental(self):
+        code = 'module test\nlet x = 1\n\nlet y = "a"\ntype t = { A }\nlet z = fun(a) -> { a }\n'
+        context = CompilationContext()
+        parser = IncrementalParser(code, context)
+
+        def edit(old: str, new: str, start: int = 0):
+            start = parser.text.index(old, start)
+            return parser.edit(TextEdit(start, start + len(old), new))
+
+        def assert_same_as_full_parse():
+            visitor = AstToDictVisitor()
+            root = parse(parser.text)
+            self.assertEqual(visitor.visit(root), visitor.visit(parser.root))
+            self.assertEqual(root.spans, parser.root.spans)
+
+        self.assertEqual(['x'], [d.name for d in edit('1', '2')])
+        # Переход на новую строку внутри строкового литерала не меняет номера строк следующих объявлений.
+        self.assertEqual(['y'], [d.name for d in edit('"a"', '"a\nb"\n\n')])
+        # Изменение на границе объявлений разбирает оба объявления.
+        self.assertEqual(['y', 'u', 't'], [d.name for d in edit('\ntype', '\ntype u = { B }\ntype')])
+        assert_same_as_full_parse()
+
+        self.assertEqual(['t', 'w', 'z'], [d.name for d in edit('\nlet z', ' let w = 1\n\nlet z')])
+        self.assertEqual(['z'], [d.name for d in edit('{ a }', '{ let b = a;\n b }')])
+        assert_same_as_full_parse()
+        self.assertEqual(1, parser.full_parses)
+
+        # Изменение заголовка модуля и синтаксическая ошибка в объявлении требуют разбора всего модуля.
+        self.assertIsNone(edit('test', 'test2'))
+        self.assertIsNone(edit('fun(a) -> {', 'fun(a) -> '))
+        self.assertEqual(3, parser.full_parses)
+        self.assertIsNone(parser.root)
+        # Сохраняется только ошибка разбора всего модуля.
+        self.assertEqual(1, len(context.errors.list))
+
+    def test_ast_cache(self):
+        codes = [f'module test\nlet x = {i}\nlet f = fun(a) -> {{ [a, x] }}\ntype t = {{ A, B = int }}' for i in range(3)]
+
+        with TemporaryDirectory() as directory:
+            cache = AstCache(directory, 2 ** 20)
+            self.assertIsNone(cache.load(codes[0]))
+
+            cache.save(codes[0], parse(codes[0]))
+            visitor = AstToDictVisitor()
+            self.assertEqual(visitor.visit(parse(codes[0])), visitor.visit(cache.load(codes[0])))
+            # Смещения в АСД исходного кода в байтах другие, поэтому для байтов снимок отдельный.
+            self.assertIsNone(cache.load(codes[0].encode()))
+            self.assertIsNone(cache.load(codes[1]))
+
+            # При превышении размера кэша удаляются давно не использованные снимки.
+            snapshot_size = cache.get_path(cache.key(codes[0])).stat().st_size
+            cache.max_size = 2 * snapshot_size + snapshot_size // 2
+            cache.save(codes[1], parse(codes[1]))
+            os.utime(cache.get_path(cache.key(codes[1])), (0, 0))
+            cache.load(codes[0])
+            cache.save(codes[2], parse(codes[2]))
+
+            self.assertEqual([True, False, True], [cache.load(code) is not None for code in codes])
+
+    def test_ast_cache_key(self):
+        code = 'module test\nlet s = "строка"\n' * 1000
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'test.tml'
+            path.write_text(code)
+
+            with open(path, 'rb') as f, mmap(f.fileno(), 0, access=ACCESS_READ) as source:
+                self.assertEqual(AstCache.key(code.encode()), AstCache.key(source))
+
+        self.assertNotEqual(AstCache.key(code), AstCache.key(code.encode()))
+
+    def test_corrupt_ast_cache(self):
+        code = 'module test\nlet x = 1'
+
+        with TemporaryDirectory() as directory:
+            cache = AstCache(directory, 2 ** 20)
+            path = cache.get_path(cache.key(code))
+            pickles = [b'', b'not pickle', pickle.dumps(tml_ast.FlatTree(parse(code)))[:-5], pickle.dumps(1),
+                       b'ctml_ast\nNoSuchNode\n.', b'cno_such_module\nNode\n.']
+            snapshots = [b'not zlib', zlib.compress(b'')[:-3]] + [zlib.compress(data) for data in pickles]
+
+            for snapshot in snapshots:
+                path.write_bytes(snapshot)
+                # Поврежденный снимок удаляется, а модуль разбирается заново.
+                self.assertIsNone(cache.load(code))
+                self.assertFalse(path.exists())
+
+            cache.save(code, parse(code))
+            self.assertIsNotNone(cache.load(code))
+
+    def test_untrusted_ast_cache(self):
+        code = 'module test\nlet x = 1'
+
+        with TemporaryDirectory() as directory:
+            cache = AstCache(str(Path(directory) / 'cache'), 2 ** 20)
+            cache.save(code, parse(code))
+            self.assertEqual(0o700, cache.directory.stat().st_mode & 0o777)
+            path = cache.get_path(cache.key(code))
+            self.assertEqual(0o600, path.stat().st_mode & 0o777)
+
+            # Снимки, которые могут изменить другие пользователи, не загружаются.
+            path.chmod(0o666)
+            self.assertIsNone(cache.load(code))
+            self.assertTrue(path.exists())
+
+            path.chmod(0o600)
+            cache.directory.chmod(0o777)
+            self.assertIsNone(cache.load(code))
+
+            cache.directory.chmod(0o700)
+            self.assertIsNotNone(cache.load(code))
+
+    def test_json_writer(self):
+        root = parse('''module test
+            open "a", "b"
+            let f = fun(x, y) -> { let s = "ы\\n\\"" ^ x; [1.5, -2, ()] ; match y { [] -> { 1; 2 }, z -> z } }
+            type t<`a> = { A = `a * ref<int>, B }
+            ''')
+        file = io.StringIO()
+        AstJsonWriter(file).write(root)
+
+        self.assertEqual(json.dumps(AstToDictVisitor().visit(root)), file.getvalue())
+        # Служебные поля узлов не записываются.
+        self.assertNotIn('spans', file.getvalue())
+
+        value = {'a': [1, {'b': 'ы', 'c': None}, {}], 'd': {'e': (True, 2.5)}, 'f': []}
+        file = io.StringIO()
+        AstJsonWriter(file).write(value)
+        self.assertEqual(json.dumps(value), file.getvalue())
+
+        file = io.StringIO()
+        AstJsonWriter(file, separators=COMPACT_SEPARATORS).write([value, root])
+        self.assertEqual(json.dumps([value, AstToDictVisitor().visit(root)], separators=COMPACT_SEPARATORS),
+                         file.getvalue())
+
+    def test_deep_ast(self):
+        depth = 5000
+        code = f'module test\nlet f = fun(x) -> {{ {"-" * depth}x }}'
+        root = parse(code)
+
+        file = io.StringIO()
+        AstJsonWriter(file).write(root)
+        self.assertEqual(depth, file.getvalue().count('"node_type": "UnaryOperator"'))
+        self.assertEqual(AstToDictVisitor().visit(root)['definitions'][0]['expression']['body'][0]['operation'], '-')
+
+        with TemporaryDirectory() as directory:
+            cache = AstCache(directory, 2 ** 30)
+            cache.save(code, root)
+
+            loaded = io.StringIO()
+            AstJsonWriter(loaded).write(cache.load(code))
+            self.assertEqual(file.getvalue(), loaded.getvalue())
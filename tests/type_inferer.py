@@ -1,17 +1,32 @@
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Dict
 
 from args import Args
+from context import CompilationContext
+from errors import CompilationException
 from main import parse_source_code
+from parallel import split_into_clusters
+from parsing.parser import parse
+from semantic.ast_visitor import SemanticVisitor
+from semantic.typing.dependency_graph import DependencyGraph
+from semantic.typing.inferer import TypeInferer, Constraint, TypeWrapper
+from semantic.typing.polym_type_name_setter import PolymorphTypeNameSetter
+from semantic.typing.scheme import TypeScheme
 from semantic.typing.types import fun_type, t_int, t_bool, t_string, t_float, t_a, t_b, t_c, t_d, ParameterizedType, \
-    t_ref_a, SimpleType
+    t_ref_a, SimpleType, PolymorphType, unify
 from tests.helpers import assert_let_types
 
 
 class TestTypeInferer(unittest.TestCase):
     def setUp(self) -> None:
-        Args().stop_after_type_inferring = True
-        Args().skip_header_generation = True
+        self.args = Args()
+        self.args.stop_after_type_inferring = True
+        self.args.skip_header_generation = True
 
     def test_simple(self):
         self.assert_types(
@@ -147,10 +162,303 @@ class TestTypeInferer(unittest.TestCase):
             }
         )
 
+    def test_let_polymorphism(self):
+        self.assert_types(
+            '''
+            type maybe<`a> = { Nothing, Just = `a }
+            let f28 = fun(x) -> { let g = fun(y) -> { y }; g(1); g(x) }
+            let f29 = fun(m) -> { match m { Nothing -> 0, Just(v) -> v + 1 } }
+            ''',
+            {
+                # `a -> `a
+                'f28': fun_type([t_a], t_a),
+                # maybe<int> -> int
+                'f29': fun_type([ParameterizedType('maybe', [t_int])], t_int)
+            })
+
+    def test_operators(self):
+        self.assert_types(
+            '''
+            let f30 = fun(a, b, r) -> { (a = 1) & (b != "") & ($r +. 1.0 >. 0.0) }
+            let f31 = fun(c, x) -> { new (if (c) then -x else x * 2) }
+            ''',
+            {
+                # int -> string -> ref<float> -> bool
+                'f30': fun_type([t_int, t_string, ParameterizedType('ref', [t_float])], t_bool),
+                # bool -> int -> ref<int>
+                'f31': fun_type([t_bool, t_int], ParameterizedType('ref', [t_int]))
+            })
+
+    def test_constraints_simplification(self):
+        x, y = PolymorphType(), PolymorphType()
+
+        inferer = TypeInferer()
+        for left, right in ((t_int, x), (x, t_int), (x, y), (t_int, t_int), (y, t_bool)):
+            inferer.add_constraint(Constraint(TypeWrapper(left), TypeWrapper(right), None))
+
+        # Удаляются повтор t_int = x, тождество int = int и ограничение x = y, которое решается сразу.
+        self.assertEqual(3, inferer.simplify())
+        self.assertEqual(2, len(inferer.constraints))
+        self.assertIs(x.find(), y.find())
+
+    def test_incremental(self):
+        code = '''
+            module test
+            let f32 = fun(x) -> { x }
+            let f33 = fun(x) -> { f32(x) + 1 }
+            let f34 = fun(x) -> { f32(x) = "" }
+            '''
+
+        with TemporaryDirectory() as directory:
+            self.args.source = str(Path(directory) / 'test.tml')
+            self.args.incremental = True
+
+            type_inferer = self.compile(code).type_inferer
+            self.assertEqual(0, type_inferer.reused_definitions_count)
+            all_constraints_count = type_inferer.solved_constraints_count
+
+            # Изменилось только f33: f32 и f34 берутся из кэша, и решаются только ограничения f33.
+            type_inferer = self.compile(code.replace('+ 1', '* 2')).type_inferer
+            self.assertEqual(2, type_inferer.reused_definitions_count)
+            self.assertLess(0, type_inferer.solved_constraints_count)
+            self.assertLess(type_inferer.solved_constraints_count, all_constraints_count)
+
+            context = self.compile(code.replace('+ 1', '* 2'))
+            self.assertEqual(3, context.type_inferer.reused_definitions_count)
+            # Все типы взяты из кэша: ни одно ограничение не решается.
+            self.assertEqual(0, context.type_inferer.solved_constraints_count)
+
+        assert_let_types(self, context.module, {
+            # `a -> `a
+            'f32': fun_type([t_a], t_a),
+            # int -> int
+            'f33': fun_type([t_int], t_int),
+            # string -> bool
+            'f34': fun_type([t_string], t_bool)
+        })
+
+    def test_parallel(self):
+        code = '''
+            module test
+            let f35 = fun(x) -> { x }
+            let f36 = fun(x) -> { f35(x) + 1 }
+            let f37 = fun(x) -> { x = "" }
+            '''
+
+        root = parse(code)
+        self.assertEqual([['f35', 'f36'], ['f37']],
+                         [[let.name for let in cluster] for cluster in split_into_clusters(root.definitions)])
+
+        self.args.jobs = 2
+        context = self.compile(code)
+
+        assert_let_types(self, context.module, {
+            # `a -> `a
+            'f35': fun_type([t_a], t_a),
+            # int -> int
+            'f36': fun_type([t_int], t_int),
+            # string -> bool
+            'f37': fun_type([t_string], t_bool)
+        })
+
+    def test_stream_definitions(self):
+        code = '''
+            module test
+            type stream<`a> = { End, Next = `a * stream<`a> }
+            let f38 = fun(x) -> { Next(x, End) }
+            let f39 = fun(l) -> { match l { Next(h, t) -> { f38(h + 1) }, End -> { End } } }
+            '''
+
+        self.args.stream_definitions = True
+        context = self.compile(code)
+
+        assert_let_types(self, context.module, {
+            # `a -> stream<`a>
+            'f38': fun_type([t_a], ParameterizedType('stream', [t_a])),
+            # stream<int> -> stream<int>
+            'f39': fun_type([ParameterizedType('stream', [t_int])], ParameterizedType('stream', [t_int]))
+        })
+
+    def test_dependency_components(self):
+        graph = DependencyGraph()
+        for node in 'abcde':
+            graph.add_node(node)
+
+        # a <- b <-> c <- d, e независим.
+        graph.add_edge('b', 'a')
+        graph.add_edge('b', 'c')
+        graph.add_edge('c', 'b')
+        graph.add_edge('d', 'c')
+        graph.add_edge('d', 'd')
+
+        self.assertEqual([['a'], ['b', 'c'], ['d'], ['e']], graph.strongly_connected_components())
+
+    def test_interned_types(self):
+        self.assertIs(t_int, SimpleType('int'))
+        self.assertIs(ParameterizedType('ref', [ParameterizedType('ref', [t_bool])]),
+                      ParameterizedType('ref', [ParameterizedType('ref', [SimpleType('bool')])]))
+        # Типы с полиморфными параметрами не интернируются.
+        self.assertIsNot(t_ref_a, ParameterizedType('ref', [t_a]))
+
+    def test_definition_type_wrappers(self):
+        # Обертки типов объявлений типов и конструкторов создаются один раз.
+        context = self.compile('module test type t<`a> = { A, B = `a * int } let x = B(A, 1)')
+        typedef = context.module.top_scope.typedefs.find('t')
+
+        self.assertIs(typedef.type_wrapper, typedef.type_wrapper)
+        for constructor in typedef.constructors:
+            self.assertIs(constructor.type_wrapper, constructor.type_wrapper)
+
+        self.assertIs(typedef.type, typedef.constructors[0].type)
+        self.assertIs(typedef.type, typedef.constructors[1].type.params[-1])
+
+    def test_scheme_instantiation(self):
+        t_ref_int = ParameterizedType('ref', [t_int])
+        scheme = TypeScheme(fun_type([t_a, t_ref_int, t_b], t_a))
+        instance = scheme.instantiate()
+
+        self.assertEqual([t_a, t_b], scheme.variables)
+        self.assertIs(instance.params[0], instance.params[3])
+        self.assertIsNot(instance.params[0], t_a)
+        self.assertIs(t_ref_int, instance.params[1])
+        self.assertIs(t_ref_int, TypeScheme(t_ref_int).instantiate())
+
+    def test_unify_mismatch(self):
+        x = PolymorphType()
+        mismatch = unify(fun_type([x, t_int], t_bool), fun_type([t_string, t_float], t_bool))
+
+        self.assertIs(t_int, mismatch.t1)
+        self.assertIs(t_float, mismatch.t2)
+        # При ошибке переменные не связываются.
+        self.assertIs(x, x.find())
+
+    def test_unify_pending_occurs_check(self):
+        # p = ref<p> получается только через накопленные связывания q = p и q = ref<q>.
+        p, q, r1, r2 = PolymorphType(), PolymorphType(), PolymorphType(), PolymorphType()
+        mismatch = unify(fun_type([p, q, p], r1),
+                         fun_type([ParameterizedType('ref', [p]), ParameterizedType('ref', [q]), q], r2))
+
+        self.assertIsNotNone(mismatch)
+        self.assertTrue(all(v.find() is v for v in (p, q, r1, r2)))
+
+        context = CompilationContext()
+        SemanticVisitor(context).visit_root(
+            parse('module test let lp = fun(g, h, p, q) -> { g(p, q, p); h(new p, new q, q); g = h }', context))
+
+        with self.assertRaises(CompilationException):
+            context.type_inferer.infer()
+
+    def test_deep_types(self):
+        depth = 100000
+
+        def nested_ref(t):
+            for _ in range(depth):
+                t = ParameterizedType('ref', [t])
+
+            return t
+
+        t1, t2 = PolymorphType(), PolymorphType()
+        deep1, deep2 = nested_ref(t1), nested_ref(fun_type([t_int], t2))
+
+        self.assertTrue(deep1.is_compatible(deep2))
+        self.assertIsNone(unify(deep1, deep2))
+
+        PolymorphTypeNameSetter().visit(deep1)
+        self.assertEqual('ref<' * depth + 'int -> `a' + '>' * depth, str(deep1))
+
+        scheme = TypeScheme(deep1)
+        self.assertEqual([t2], scheme.variables)
+        instance = scheme.instantiate()
+        for _ in range(depth):
+            instance = instance.params[0]
+        self.assertIsNot(t2, instance.params[1])
+
+        # Проверка вхождения: `a = ref<...<int -> `a>...> — бесконечный тип.
+        self.assertIsNotNone(unify(t2, deep1))
+        self.assertIs(nested_ref(t_int), nested_ref(t_int))
+
+    def test_deep_nesting(self):
+        depth = 5000
+        ifs = ''.join(f'if (x > {i}) then {i} else ' for i in range(depth)) + '0'
+        matches = 'match x { 0 -> 1, y -> ' * depth + 'y' + ' }' * depth
+        negations = '-' * depth + 'x'
+
+        self.assert_types(
+            f'''
+            let f40 = fun(x) -> {{ {ifs} }}
+            let f41 = fun(x) -> {{ {matches} }}
+            let f42 = fun(x) -> {{ {negations} }}
+            ''',
+            {
+                # int -> int
+                'f40': fun_type([t_int], t_int),
+                'f41': fun_type([t_int], t_int),
+                'f42': fun_type([t_int], t_int),
+            })
+
+    def test_semantic_errors(self):
+        context = CompilationContext()
+
+        # Ошибки в выражениях группы обрабатываются в группе (в том числе в последнем выражении).
+        SemanticVisitor(context).visit_root(parse('module test let f43 = fun(x) -> { x; -y; --z }', context))
+        errors = [str(error) for error in context.errors.list]
+
+        self.assertEqual(2, len(errors))
+        self.assertIn("'y'", errors[0])
+        self.assertIn("'z'", errors[1])
+
+    def test_compilation_contexts(self):
+        # Модули компилируются в независимых контекстах: друг за другом и в параллельных потоках.
+        codes = {
+            t_int: 'module test let g = fun(x) -> { let h = fun(y) -> { y }; h(x) + 1 }',
+            t_float: 'module test let g = fun(x) -> { let h = fun(y) -> { y }; h(x) +. 1.0 }',
+        }
+        types = list(codes) * 8
+
+        with ThreadPoolExecutor(4) as executor:
+            contexts = list(executor.map(self.compile, [codes[t] for t in types]))
+
+        for t, context in zip(types, contexts):
+            self.assertTrue(context.errors.is_ok())
+            assert_let_types(self, context.module, {'g': fun_type([t], t)})
+
+        # Равные замкнутые типы, построенные в разных потоках одновременно, являются одним объектом.
+        threads = 8
+        barrier = Barrier(threads)
+
+        def build_types(_):
+            barrier.wait()
+            return [ParameterizedType(f'interned{i}', [ParameterizedType('ref', [t_int]), t_float]) for i in range(1000)]
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(threads) as executor:
+                results = list(executor.map(build_types, range(threads)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        for types in results[1:]:
+            self.assertTrue(all(t is first for t, first in zip(types, results[0])))
+            self.assertTrue(all(unify(t, first) is None for t, first in zip(types, results[0])))
+
+        # Полиморфные типы аннотаций не переходят из одной компиляции в другую.
+        self.compile('module test let f: `x -> `x -> bool = fun(a, b) -> { a = 1 }')
+        context = self.compile('module test let g: `x -> `x = fun(a) -> { a }')
+        self.assertTrue(context.errors.is_ok())
+        a = PolymorphType()
+        assert_let_types(self, context.module, {'g': fun_type([a], a)})
+
+    def compile(self, code: str) -> CompilationContext:
+        context = CompilationContext(self.args)
+        parse_source_code(context, code)
+
+        return context
+
     def assert_types(self, code: str, let_names_and_expected_types: dict):
-        parse_source_code(f'module test {code}')
+        context = self.compile(f'module test {code}')
 
-        assert_let_types(self, let_names_and_expected_types)
+        assert_let_types(self, context.module, let_names_and_expected_types)
 
 
 if __name__ == '__main__':
@@ -6,12 +6,16 @@ from .types import Type, PolymorphType
 
 
 class Definition(Node):
+    __slots__ = ('line', 'name')
+
     def __init__(self, position: Position, name: str):
         super().__init__(position)
         self.name = name
 
 
 class Let(Definition):
+    __slots__ = ('expression', 'type_hint')
+
     def __init__(self, position: Position, name: str, expression, type_hint: Optional[Type]):
         super().__init__(position, name)
         self.expression = expression
@@ -19,12 +23,16 @@ class Let(Definition):
 
 
 class TypeConstructor(Definition):
+    __slots__ = ('types',)
+
     def __init__(self, position: Position, name: str, types: List[Type]):
         super().__init__(position, name)
         self.types = types
 
 
 class Typedef(Definition):
+    __slots__ = ('params', 'constructors')
+
     def __init__(self, position: Position, name: str, params: List[PolymorphType], constructors: List[TypeConstructor]):
         super().__init__(position, name)
         self.params = params
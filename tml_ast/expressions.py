@@ -5,16 +5,20 @@ from position import Position
 
 
 class Expression(Node):
-    pass
+    __slots__ = ()
 
 
 class Group(Expression, list):
+    __slots__ = ('line',)
+
     def __init__(self, position: Position, expressions: list):
         Expression.__init__(self, position)
         list.__init__(self, expressions)
 
 
 class Apply(Expression):
+    __slots__ = ('line', 'fun', 'args')
+
     def __init__(self, position: Position, fun, args: list):
         super().__init__(position)
         self.fun = fun
@@ -22,12 +26,16 @@ class Apply(Expression):
 
 
 class Var(Expression):
+    __slots__ = ('line', 'name')
+
     def __init__(self, position: Position, name: str):
         super().__init__(position)
         self.name = name
 
 
 class Literal(Expression):
+    __slots__ = ('line', 'type', 'value')
+
     def __init__(self, position: Position, _type, value: any):
         super().__init__(position)
         self.type = _type
@@ -35,6 +43,8 @@ class Literal(Expression):
 
 
 class BinaryOperator(Expression):
+    __slots__ = ('line', 'operation', 'right', 'left')
+
     def __init__(self, position: Position, operation: str, left, right):
         super().__init__(position)
         self.operation = operation
@@ -43,6 +53,8 @@ class BinaryOperator(Expression):
 
 
 class UnaryOperator(Expression):
+    __slots__ = ('line', 'operation', 'operand')
+
     def __init__(self, position: Position, operation, operand):
         super().__init__(position)
         self.operation = operation
@@ -50,6 +62,8 @@ class UnaryOperator(Expression):
 
 
 class If(Expression):
+    __slots__ = ('line', 'condition', 'then_branch', 'else_branch')
+
     def __init__(self, position: Position, condition, then_branch, else_branch):
         super().__init__(position)
         self.condition = condition
@@ -58,6 +72,8 @@ class If(Expression):
 
 
 class MatchBranch(Node):
+    __slots__ = ('line', 'pattern', 'body')
+
     def __init__(self, position: Position, pattern, body):
         super().__init__(position)
         self.pattern = pattern
@@ -65,6 +81,8 @@ class MatchBranch(Node):
 
 
 class Match(Expression):
+    __slots__ = ('line', 'expr', 'branches')
+
     def __init__(self, position: Position, expr, branches: List[MatchBranch]):
         super().__init__(position)
         self.expr = expr
@@ -72,6 +90,8 @@ class Match(Expression):
 
 
 class LambdaFun(Expression):
+    __slots__ = ('line', 'args', 'body')
+
     def __init__(self, position: Position, args: List[str], body):
         super().__init__(position)
         self.args = args
@@ -79,12 +99,16 @@ class LambdaFun(Expression):
 
 
 class ListCreate(Expression):
+    __slots__ = ('line', 'values')
+
     def __init__(self, position: Position, values: Group):
         super().__init__(position)
         self.values = values
 
 
 class GetElementFromList(Expression):
+    __slots__ = ('line', 'list', 'index')
+
     def __init__(self, position: Position, lst, index: Expression):
         super().__init__(position)
         self.list = lst
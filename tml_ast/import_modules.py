@@ -5,6 +5,8 @@ from position import Position
 
 
 class Import(Node):
+    __slots__ = ('line', 'modules', 'do_open_namespace')
+
     def __init__(self, position: Position, modules: List[str], do_open_namespace=False):
         super().__init__(position)
         self.modules = modules
@@ -1,8 +1,123 @@
-from typing import Any
+from typing import Any, Dict, Iterator, List, Tuple
 
 from position import Position
 
 
 class Node:
+    """
+    Узел АСД. Позиция узла хранится в виде номера строки (line), а объект Position берется из общей таблицы строк при
+    обращении к position.
+
+    Все узлы используют слоты. Слоты объявляются в конечных классах (в порядке инициализации полей), а у общих базовых
+    классов они пустые: Group наследуется от list, а list несовместим с непустыми слотами других базовых классов.
+    """
+
+    __slots__ = ()
+
     def __init__(self, position: Position):
-        self.position = position
+        self.line = position.line
+
+    @property
+    def position(self) -> Position:
+        return Position.of(self.line)
+
+    def fields(self) -> Iterator[Tuple[str, Any]]:
+        """ Имена и значения полей узла в порядке их объявления (начиная с line). """
+        for name in field_names(type(self)):
+            yield name, getattr(self, name)
+
+
+class FlatTree:
+    """
+    Обертка поддерева для сериализации pickle в виде плоского списка (см. flatten_tree): стандартная сериализация
+    рекурсивна и не справляется с глубоко вложенными АСД. При десериализации получается само поддерево.
+    """
+
+    __slots__ = ('tree',)
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    def __reduce__(self):
+        return restore_tree, (flatten_tree(self.tree),)
+
+
+# Имена полей классов узлов: класс -> имена слотов в порядке объявления.
+FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def field_names(cls: type) -> Tuple[str, ...]:
+    try:
+        return FIELD_NAMES[cls]
+    except KeyError:
+        names = tuple(name for base in reversed(cls.__mro__) for name in base.__dict__.get('__slots__', ()))
+        FIELD_NAMES[cls] = names
+
+        return names
+
+
+def flatten_tree(root) -> List[tuple]:
+    """
+    Плоское представление поддерева (узла или списка): список записей (класс, значения, ссылки) в обратном порядке
+    обхода, в котором дочерние узлы и списки находятся раньше родительских. Значения — поля узла (у Group после них
+    идут элементы) или элементы списка, причем вложенные узлы и списки заменены номерами их записей, а ссылки —
+    позиции таких значений. Обход выполняется без рекурсии.
+    """
+    entries = []
+    indices = {}
+    stack = [(root, False)]
+
+    while stack:
+        value, children_done = stack.pop()
+        if id(value) in indices:
+            continue
+
+        if isinstance(value, Node):
+            values = [field_value for _, field_value in value.fields()]
+            if isinstance(value, list):
+                values.extend(value)
+        else:
+            values = list(value)
+
+        if not children_done:
+            stack.append((value, True))
+            stack.extend((child, False) for child in values if isinstance(child, (Node, list)))
+            continue
+
+        refs = []
+        for i, child in enumerate(values):
+            if isinstance(child, (Node, list)):
+                values[i] = indices[id(child)]
+                refs.append(i)
+
+        indices[id(value)] = len(entries)
+        entries.append((value.__class__ if isinstance(value, Node) else list, tuple(values), tuple(refs)))
+
+    return entries
+
+
+def restore_tree(entries: List[tuple]):
+    """ Поддерево по плоскому представлению flatten_tree. """
+    objects = []
+
+    for cls, values, refs in entries:
+        if refs:
+            values = list(values)
+            for i in refs:
+                values[i] = objects[values[i]]
+
+        if cls is list:
+            objects.append(list(values))
+            continue
+
+        node = cls.__new__(cls)
+        names = field_names(cls)
+        for name, value in zip(names, values):
+            setattr(node, name, value)
+
+        if isinstance(node, list):
+            node.extend(values[len(names):])
+
+        objects.append(node)
+
+    return objects[-1]
@@ -1,4 +1,4 @@
-from typing import List, Any
+from typing import List, Any, Tuple
 
 from .node import Node
 from .import_modules import Import
@@ -7,9 +7,17 @@ from .definitions import Definition
 
 
 class Root(Node):
+    """
+    Корень АСД. spans — промежутки исходного кода (смещения начала и конца), занимаемые объявлениями верхнего уровня
+    (в том же порядке, что и definitions).
+    """
+
+    __slots__ = ('line', 'module_name', 'imports', 'opens', 'definitions', 'spans')
+
     def __init__(self, module_name: str, imports: Import, opens: Import, definitions: List[Definition]):
         super().__init__(Position.start())
         self.module_name = module_name
         self.imports = imports
         self.opens = opens
         self.definitions = definitions
+        self.spans: List[Tuple[int, int]] = []
@@ -5,20 +5,24 @@ from position import Position
 
 
 class Type(Node):
+    __slots__ = ('line', 'name')
+
     def __init__(self, position: Position, name: str):
         super().__init__(position)
         self.name = name
 
 
 class SimpleType(Type):
-    pass
+    __slots__ = ()
 
 
 class ParameterizedType(Type):
+    __slots__ = ('params',)
+
     def __init__(self, position: Position, name: str, params: list):
         super().__init__(position, name)
         self.params = params
 
 
 class PolymorphType(Type):
-    pass
+    __slots__ = ()